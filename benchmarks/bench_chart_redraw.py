@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark price chart redraw latency.
+
+Compares the original approach (a new Figure, plot and full draw for every
+ticker view) with the persistent chart of StockDetailsFrame: set_data on
+an LTTB-downsampled line with a full draw when the axes change, and a blit
+of the line alone when they do not. Runs on the Agg backend, so no window
+is needed.
+
+Usage: python benchmarks/bench_chart_redraw.py [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.dates as mdates
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.gui.downsample import lttb_indices
+
+MAX_CHART_POINTS = 500
+
+# Regular-session 5-minute bars per trading day (9:30 to 16:00)
+BARS_PER_DAY = 78
+
+# Series name -> (trading days, bars per day): daily bars for 1 and 5 years,
+# and 1 year of 5-minute intraday bars
+SERIES = {'1y daily': (252, 1), '5y daily': (1260, 1), '1y 5-minute': (252, BARS_PER_DAY)}
+
+
+def make_series(days: int, bars_per_day: int, rng: np.random.Generator):
+    """Generate a random-walk price series on weekday timestamps, daily or intraday."""
+    sessions = np.busday_offset('2020-01-01', np.arange(days), roll='forward').astype('datetime64[m]')
+    if bars_per_day == 1:
+        timestamps = sessions
+    else:
+        opening = np.repeat(sessions, bars_per_day) + np.timedelta64(9 * 60 + 30, 'm')
+        timestamps = opening + np.tile(np.arange(bars_per_day), days) * np.timedelta64(5, 'm')
+    dates = mdates.date2num(timestamps)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(dates))))
+    return dates, closes
+
+
+def style_axes(fig: Figure):
+    """Create axes styled like StockDetailsFrame."""
+    fig.patch.set_facecolor('#040F16')
+    ax = fig.add_subplot(111)
+    fig.subplots_adjust(left=0.1, right=0.95, bottom=0.15, top=0.9)
+    ax.set_facecolor('#040F16')
+    ax.tick_params(colors='white', labelsize=9)
+    ax.set_title('Price History (1 Year)', color='white', pad=10, fontsize=12)
+    ax.grid(True, alpha=0.2)
+    ax.xaxis_date()
+    return ax
+
+
+def rebuild(dates, closes):
+    """Original approach: build and draw a new figure."""
+    fig = Figure(figsize=(10, 5), dpi=100)
+    ax = style_axes(fig)
+    ax.plot(dates, closes, color='#55A76A', linewidth=2)
+    canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+
+
+class PersistentChart:
+    """Persistent approach: one figure, line data replaced in place."""
+
+    def __init__(self):
+        self.fig = Figure(figsize=(10, 5), dpi=100)
+        self.ax = style_axes(self.fig)
+        self.line, = self.ax.plot([], [], color='#55A76A', linewidth=2, animated=True)
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.background = None
+
+    def show(self, dates, closes, blit: bool):
+        keep = lttb_indices(dates, closes, MAX_CHART_POINTS)
+        self.line.set_data(dates[keep], closes[keep])
+        if blit and self.background is not None:
+            self.canvas.restore_region(self.background)
+            self.ax.draw_artist(self.line)
+            return
+        margin = (closes.max() - closes.min()) * 0.05
+        self.ax.set_xlim(dates[0], dates[-1])
+        self.ax.set_ylim(closes.min() - margin, closes.max() + margin)
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.ax.draw_artist(self.line)
+
+
+def time_ms(func, repeat: int) -> float:
+    """Median wall time of a call in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return float(np.median(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=20, help='redraws per measurement (default: 20)')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    chart = PersistentChart()
+    print(f"{'series':>12} {'points':>7} {'rebuild':>10} {'set_data':>10} {'blit':>10}")
+    for name, (days, bars_per_day) in SERIES.items():
+        dates, closes = make_series(days, bars_per_day, rng)
+        points = len(dates)
+        rebuild_ms = time_ms(lambda: rebuild(dates, closes), args.repeat)
+        full_ms = time_ms(lambda: chart.show(dates, closes, blit=False), args.repeat)
+        blit_ms = time_ms(lambda: chart.show(dates, closes, blit=True), args.repeat)
+        print(f"{name:>12} {points:>7} {rebuild_ms:>8.1f}ms {full_ms:>8.1f}ms {blit_ms:>8.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Benchmark each stage of the sentiment pipeline on a synthetic corpus.
+
+Times TickerExtractor.extract_potential_tickers, sentence segmentation,
+SentimentAnalyzer.analyze_ticker_sentiment, get_top_sentiments and a
+full run_analysis (what main() runs) for each corpus size. Reddit is
+replaced by RecordedReddit serving the generated posts and Yahoo Finance
+by an in-process validator that knows the corpus tickers, so nothing
+touches the network, and all stores live in a temporary data directory.
+
+Results are written as JSON; --compare checks them against an earlier
+results file and exits with status 1 on a regression.
+
+Usage: python benchmarks/bench_pipeline.py [--sizes N ...] [--output FILE] [--compare FILE]
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from corpus import CorpusConfig, CorpusGenerator, to_things
+from src.sentiment_analyzer.main import AnalysisComponents, run_analysis
+from src.sentiment_analyzer.recorded_reddit import RecordedReddit
+from src.sentiment_analyzer.reddit_scraper import RedditScraper
+from src.sentiment_analyzer.score_cache import ScoreCache
+from src.sentiment_analyzer.segmenter import DEFAULT_SEGMENTER, SEGMENTERS
+from src.sentiment_analyzer.sentiment_analyzer import SentimentAnalyzer
+from src.sentiment_analyzer.sentiment_log import SentimentLogStore
+from src.sentiment_analyzer.ticker_utils import TickerExtractor
+
+DEFAULT_SIZES = [50, 1000, 10000]
+
+
+class OfflineTickerExtractor(TickerExtractor):
+    """TickerExtractor whose Yahoo Finance lookups are answered from a known ticker list."""
+
+    def __init__(self, listed: List[str]):
+        super().__init__(use_cache=False, calls_per_second=None)
+        self.listed = set(listed)
+
+    def _get_info(self, ticker: str) -> dict:
+        if ticker in self.listed:
+            return {'symbol': ticker, 'quoteType': 'EQUITY', 'regularMarketPrice': 100.0}
+        return {}
+
+
+def best_of(func: Callable[[], object], repeat: int, setup: Optional[Callable[[], None]] = None) -> float:
+    """Fastest wall time in seconds of func over repeat runs, each after setup."""
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def bench_size(size: int, args: argparse.Namespace, data_dir: str) -> List[Dict]:
+    """Time every stage on a corpus of size posts."""
+    generator = CorpusGenerator(CorpusConfig(
+        posts=size,
+        tickers=args.tickers,
+        ticker_density=args.ticker_density,
+        sentence_words=args.sentence_words,
+        sentences_per_post=args.sentences_per_post,
+        seed=args.seed
+    ))
+    posts = generator.posts()
+    texts = [f"{post['title']}\n{post['body']}" for post in posts]
+    extractor = OfflineTickerExtractor(generator.tickers)
+    state = {}
+
+    def fresh_analyzer():
+        # A new score cache per repetition, so every run scores from scratch
+        state['analyzer'] = SentimentAnalyzer(score_cache=ScoreCache(), workers=args.workers,
+                                              segmenter=args.segmenter)
+
+    def extract():
+        return [extractor.extract_potential_tickers(text) for text in texts]
+
+    def segment():
+        return state['analyzer'].split_sentences(texts)
+
+    listed = extractor.listed
+    post_tickers = [sorted(candidates & listed) for candidates in extract()]
+
+    def analyze():
+        analyzer = state['analyzer']
+        totals: Dict[str, List[float]] = {}
+        for text, tickers in zip(texts, post_tickers):
+            if tickers:
+                for ticker, score in analyzer.analyze_ticker_sentiment(text, tickers).items():
+                    totals.setdefault(ticker, []).append(score)
+        state['means'] = {ticker: sum(scores) / len(scores) for ticker, scores in totals.items()}
+
+    def rank():
+        return state['analyzer'].get_top_sentiments(state['means'])
+
+    def end_to_end():
+        components = AnalysisComponents(
+            reddit_scraper=RedditScraper(None, None, None,
+                                         reddit=RecordedReddit(listings={'stocks': {'top': to_things(posts)}}),
+                                         subreddit='stocks'),
+            ticker_extractor=OfflineTickerExtractor(generator.tickers),
+            sentiment_analyzer=SentimentAnalyzer(score_cache=ScoreCache(), workers=args.workers,
+                                                 segmenter=args.segmenter),
+            subreddits=['stocks'],
+            log_store=SentimentLogStore(os.path.join(data_dir, 'sentiment_log.db'))
+        )
+        try:
+            run_analysis(components, post_limit=size)
+        finally:
+            components.close()
+
+    fresh_analyzer()
+    stages = [
+        ('extract_potential_tickers', extract, None),
+        ('split_sentences', segment, fresh_analyzer),
+        ('analyze_ticker_sentiment', analyze, fresh_analyzer),
+        ('get_top_sentiments', rank, None),
+        ('end_to_end', end_to_end, None),
+    ]
+    results = []
+    for stage, func, setup in stages:
+        seconds = best_of(func, args.repeat, setup)
+        results.append({
+            'stage': stage,
+            'posts': size,
+            'seconds': seconds,
+            'posts_per_second': size / seconds if seconds else None
+        })
+        print(f"{size:>8} {stage:<26} {seconds * 1000:>10.1f} ms {size / seconds if seconds else 0:>12.0f} posts/s")
+    return results
+
+
+def git_commit() -> Optional[str]:
+    """Current commit of the working tree, if it is a git checkout."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: List[Dict], baseline_path: str, tolerance: float) -> bool:
+    """Print time ratios against a baseline file; return False if any stage regressed."""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {(row['stage'], row['posts']): row['seconds'] for row in json.load(f)['results']}
+
+    ok = True
+    print(f"\nCompared with {baseline_path} (tolerance {tolerance:.0%}):")
+    for row in results:
+        before = baseline.get((row['stage'], row['posts']))
+        if not before:
+            continue
+        ratio = row['seconds'] / before
+        regressed = ratio > 1 + tolerance
+        ok = ok and not regressed
+        print(f"{row['posts']:>8} {row['stage']:<26} {ratio:>6.2f}x{'  REGRESSION' if regressed else ''}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help=f"corpus sizes in posts (default: {' '.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument('--tickers', type=int, default=200, help='distinct tickers (default: 200)')
+    parser.add_argument('--ticker-density', type=float, default=0.3,
+                        help='share of sentences mentioning a ticker (default: 0.3)')
+    parser.add_argument('--sentence-words', type=int, default=14, help='mean words per sentence (default: 14)')
+    parser.add_argument('--sentences-per-post', type=int, default=6, help='mean sentences per post (default: 6)')
+    parser.add_argument('--workers', type=int, default=1, help='sentiment scoring processes (default: 1)')
+    parser.add_argument('--segmenter', choices=sorted(SEGMENTERS), default=DEFAULT_SEGMENTER,
+                        help=f'sentence segmenter (default: {DEFAULT_SEGMENTER})')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per stage; the fastest counts (default: 3)')
+    parser.add_argument('--seed', type=int, default=0, help='corpus random seed (default: 0)')
+    parser.add_argument('--output', metavar='FILE', help='write results as JSON to FILE')
+    parser.add_argument('--compare', metavar='FILE', help='compare with an earlier --output FILE')
+    parser.add_argument('--tolerance', type=float, default=0.15,
+                        help='slowdown treated as a regression by --compare (default: 0.15)')
+    args = parser.parse_args()
+
+    # Keep the pipeline's debug logging out of the timings
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        os.environ['BULLBEARRADAR_DATA_DIR'] = data_dir
+        results = []
+        for size in args.sizes:
+            results.extend(bench_size(size, args, data_dir))
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'config': {key: value for key, value in vars(args).items()
+                       if key not in ('output', 'compare', 'tolerance')}
+        },
+        'results': results
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.output}")
+
+    if args.compare and not compare(results, args.compare, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Compare the sentence segmenters for accuracy and throughput.
+
+Accuracy is measured two ways:
+- against the hand-labelled edge cases of tests/segmenter_cases.py
+  (abbreviations, initialisms, dollar amounts, tickers, ellipses,
+  quotes, paragraphs);
+- against punkt on a corpus: the synthetic benchmark corpus, or a
+  recorded Reddit listing (--listing r/stocks/top.json from a --record
+  snapshot, or corpus.py --output). Sentence breaks are compared by
+  position, ignoring whitespace, as precision/recall/F1 with punkt as
+  the reference, and the first disagreements are printed.
+
+Throughput is the fastest of --repeat passes over the corpus. Without
+nltk and its punkt data, only the built-in segmenter is measured.
+
+Usage: python benchmarks/bench_segmenter.py [--posts N | --listing FILE] [--repeat N] [--show N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Set, Tuple
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from corpus import CorpusConfig, CorpusGenerator
+from src.sentiment_analyzer.segmenter import SEGMENTERS, get_segmenter
+from tests.segmenter_cases import LABELLED_CASES
+
+
+def breaks(text: str, sentences: List[str]) -> Set[int]:
+    """Positions of sentence breaks, counted in non-whitespace characters from the start."""
+    positions = set()
+    offset = 0
+    for sentence in sentences[:-1]:
+        offset += sum(1 for char in sentence if not char.isspace())
+        positions.add(offset)
+    return positions
+
+
+def score(expected: Set[int], found: Set[int]) -> Tuple[int, int, int]:
+    """True positives, false positives and false negatives of found breaks."""
+    return len(expected & found), len(found - expected), len(expected - found)
+
+
+def f1(tp: int, fp: int, fn: int) -> Tuple[float, float, float]:
+    """Precision, recall and F1 from break counts (1.0 when there is nothing to find)."""
+    precision = tp / (tp + fp) if tp + fp else 1.0
+    recall = tp / (tp + fn) if tp + fn else 1.0
+    return precision, recall, (2 * precision * recall / (precision + recall) if precision + recall else 0.0)
+
+
+def load_segmenters(names: List[str]) -> Dict[str, Callable[[str], List[str]]]:
+    """Create the named segmenters, skipping those whose dependencies are missing."""
+    segmenters = {}
+    for name in names:
+        segmenter = get_segmenter(name)
+        try:
+            segmenter("Warm up. Ready.")
+        except (ImportError, LookupError) as e:
+            print(f"Skipping {name}: {str(e).strip().splitlines()[0]}")
+            continue
+        segmenters[name] = segmenter
+    return segmenters
+
+
+def labelled_accuracy(segmenters: Dict[str, Callable[[str], List[str]]]):
+    """Score every segmenter on the hand-labelled cases."""
+    print(f"\nLabelled cases ({len(LABELLED_CASES)}):")
+    print(f"  {'segmenter':<10} {'exact':>7} {'precision':>10} {'recall':>8} {'F1':>6}")
+    for name, segmenter in segmenters.items():
+        exact = 0
+        totals = [0, 0, 0]
+        for text, expected in LABELLED_CASES:
+            found = segmenter(text)
+            exact += found == expected
+            for i, count in enumerate(score(breaks(text, expected), breaks(text, found))):
+                totals[i] += count
+        precision, recall, f = f1(*totals)
+        print(f"  {name:<10} {exact:>3}/{len(LABELLED_CASES):<3} {precision:>10.3f} {recall:>8.3f} {f:>6.3f}")
+
+
+def agreement(texts: List[str], reference: Callable[[str], List[str]],
+              candidate: Callable[[str], List[str]], show: int):
+    """Compare a segmenter with the reference on a corpus, printing the first disagreements."""
+    totals = [0, 0, 0]
+    identical = 0
+    shown = 0
+    for text in texts:
+        expected, found = reference(text), candidate(text)
+        identical += expected == found
+        for i, count in enumerate(score(breaks(text, expected), breaks(text, found))):
+            totals[i] += count
+        if expected != found and shown < show:
+            shown += 1
+            print(f"\n  punkt: {expected}\n  regex: {found}")
+    precision, recall, f = f1(*totals)
+    print(f"\nAgreement with punkt on {len(texts)} texts: {identical / len(texts):.1%} identical, "
+          f"break precision {precision:.3f}, recall {recall:.3f}, F1 {f:.3f}")
+
+
+def throughput(texts: List[str], segmenters: Dict[str, Callable[[str], List[str]]], repeat: int):
+    """Print the fastest pass of each segmenter over the texts."""
+    chars = sum(len(text) for text in texts)
+    print(f"\nThroughput on {len(texts)} texts ({chars / 1e6:.2f} M characters, best of {repeat}):")
+    for name, segmenter in segmenters.items():
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            sentences = sum(len(segmenter(text)) for text in texts)
+            timings.append(time.perf_counter() - started)
+        seconds = min(timings)
+        print(f"  {name:<10} {seconds * 1000:>9.1f} ms {len(texts) / seconds:>10.0f} texts/s "
+              f"{chars / seconds / 1e6:>7.2f} M chars/s {sentences:>9} sentences")
+
+
+def load_listing(path: str) -> List[str]:
+    """Texts (title and body) of the posts in a Reddit listing JSON file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        listing = json.load(f)
+    children = listing['data']['children'] if isinstance(listing, dict) else listing
+    return [f"{child['data'].get('title', '')} {child['data'].get('selftext') or child['data'].get('body', '')}"
+            for child in children]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--posts', type=int, default=2000, help='synthetic corpus size in posts (default: 2000)')
+    source.add_argument('--listing', metavar='FILE', help='use the posts of a recorded Reddit listing instead')
+    parser.add_argument('--segmenters', nargs='+', choices=sorted(SEGMENTERS), default=sorted(SEGMENTERS),
+                        help='segmenters to compare (default: all)')
+    parser.add_argument('--repeat', type=int, default=3, help='throughput passes; the fastest counts (default: 3)')
+    parser.add_argument('--show', type=int, default=5, help='disagreements with punkt to print (default: 5)')
+    parser.add_argument('--seed', type=int, default=0, help='synthetic corpus random seed (default: 0)')
+    args = parser.parse_args()
+
+    if args.listing:
+        texts = load_listing(args.listing)
+    else:
+        posts = CorpusGenerator(CorpusConfig(posts=args.posts, seed=args.seed)).posts()
+        texts = [f"{post['title']} {post['body']}" for post in posts]
+
+    segmenters = load_segmenters(args.segmenters)
+    if not segmenters:
+        sys.exit("No segmenter available")
+
+    labelled_accuracy(segmenters)
+    if 'punkt' in segmenters and 'regex' in segmenters:
+        agreement(texts, segmenters['punkt'], segmenters['regex'], args.show)
+    throughput(texts, segmenters, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
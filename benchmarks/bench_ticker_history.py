@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark ticker history queries over a long history.
+
+Fills a temporary TickerHistoryStore with --days of synthetic daily
+aggregates (--tickers tickers, combined and for each of --sources
+subreddits), then times:
+- record_day: replacing one day's rows, as each run does;
+- ticker_range: one ticker over the whole history, for random tickers;
+- day: every ticker of one day, for random days.
+
+Usage: python benchmarks/bench_ticker_history.py [--days N] [--tickers N] [--sources N] [--budget MS]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import Callable, List
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.sentiment_analyzer.ticker_history import ALL_SOURCES, TickerHistoryStore
+
+
+def day_rows(tickers: List[str], sources: List[str], rng: random.Random) -> List[dict]:
+    """Synthetic aggregates of one day: every ticker, combined and per source."""
+    rows = []
+    for source in [ALL_SOURCES] + sources:
+        for ticker in tickers:
+            mean = rng.uniform(-1, 1)
+            rows.append({'ticker': ticker, 'source': source, 'mean': mean, 'count': rng.randint(1, 500),
+                         'weighted_mean': mean * rng.uniform(0.8, 1.2), 'decayed_mean': mean * rng.uniform(0.8, 1.2)})
+    return rows
+
+
+def timings_ms(func: Callable[[], object], runs: int) -> List[float]:
+    """Wall times in milliseconds of runs calls."""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def report(name: str, timings: List[float]) -> float:
+    """Print the median and 95th percentile of timings; return the latter."""
+    p95 = sorted(timings)[int(len(timings) * 0.95) - 1] if len(timings) > 1 else timings[0]
+    print(f"  {name:<14} median {statistics.median(timings):8.3f} ms   p95 {p95:8.3f} ms")
+    return p95
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--days', type=int, default=365, help='days of history (default: 365)')
+    parser.add_argument('--tickers', type=int, default=1000, help='tickers per day (default: 1000)')
+    parser.add_argument('--sources', type=int, default=2, help='subreddits per day (default: 2)')
+    parser.add_argument('--queries', type=int, default=200, help='queries timed per kind (default: 200)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed (default: 0)')
+    parser.add_argument('--budget', type=float, default=None,
+                        help='fail (exit 1) if a p95 query time exceeds MS milliseconds')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    tickers = [f"T{index:04d}" for index in range(args.tickers)]
+    sources = [f"sub{index}" for index in range(args.sources)]
+    first = date(2025, 1, 1)
+    days = [(first + timedelta(days=offset)).isoformat() for offset in range(args.days)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = TickerHistoryStore(os.path.join(directory, 'ticker_history.db'))
+        started = time.perf_counter()
+        for day in days:
+            store.record_day(day, day_rows(tickers, sources, rng))
+        rows = len(store)
+        size = os.path.getsize(store.path)
+        print(f"Filled {rows} rows ({args.days} days) in {time.perf_counter() - started:.1f}s, "
+              f"{size / 1e6:.1f} MB on disk")
+
+        print(f"\nQuery times ({args.queries} queries per kind):")
+        record = report('record_day', timings_ms(
+            lambda: store.record_day(rng.choice(days), day_rows(tickers, sources, rng)), max(5, args.queries // 20)))
+        ticker_range = report('ticker_range', timings_ms(
+            lambda: store.ticker_range(rng.choice(tickers), days[0], days[-1]), args.queries))
+        day_query = report('day', timings_ms(lambda: store.day(rng.choice(days)), args.queries))
+        store.close()
+
+    if args.budget is not None and max(ticker_range, day_query) > args.budget:
+        print(f"Over budget: p95 query time above {args.budget:.1f} ms")
+        sys.exit(1)
+    print(f"\nrecord_day replaces {args.tickers * (args.sources + 1)} rows; p95 {record:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
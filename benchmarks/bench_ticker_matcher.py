@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark ticker mention detection.
+
+Compares the original per-ticker approach (one substring test per ticker and
+sentence), a per-ticker word-boundary regex, a single compiled alternation
+and TickerMatcher, for 10, 100 and 1,000 tickers.
+
+Usage: python benchmarks/bench_ticker_matcher.py [--sentences N] [--repeat N]
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import timeit
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.sentiment_analyzer.ticker_matcher import TickerMatcher, compile_ticker_pattern
+
+WORDS = (
+    "the stock market said earnings were strong but guidance looks weak and "
+    "I think shares could drop after the call while others expect a rally"
+).split()
+
+
+def make_tickers(count: int, rng: random.Random) -> list:
+    """Generate distinct 2-5 letter ticker symbols."""
+    tickers = set()
+    while len(tickers) < count:
+        tickers.add(''.join(rng.choices(string.ascii_uppercase, k=rng.randint(2, 5))))
+    return sorted(tickers)
+
+
+def make_sentences(tickers: list, count: int, rng: random.Random) -> list:
+    """Generate sentences that each mention one or two tickers among filler words."""
+    sentences = []
+    for _ in range(count):
+        words = rng.choices(WORDS, k=rng.randint(8, 25))
+        for ticker in rng.sample(tickers, k=min(len(tickers), rng.randint(1, 2))):
+            words.insert(rng.randrange(len(words)), ticker)
+        sentences.append(' '.join(words) + '.')
+    return sentences
+
+
+def substring_loop(sentences, tickers):
+    return [[ticker for ticker in tickers if ticker in sentence] for sentence in sentences]
+
+
+def per_ticker_regex(sentences, tickers):
+    patterns = [(ticker, compile_ticker_pattern([ticker])) for ticker in tickers]
+    return [[ticker for ticker, pattern in patterns if pattern.search(sentence)] for sentence in sentences]
+
+
+def alternation(sentences, tickers):
+    pattern = compile_ticker_pattern(tickers)
+    return [pattern.findall(sentence) for sentence in sentences]
+
+
+def ticker_matcher(sentences, tickers):
+    matcher = TickerMatcher(tickers)
+    return [matcher.find_all(sentence) for sentence in sentences]
+
+
+APPROACHES = [
+    ("substring loop (original)", substring_loop),
+    ("per-ticker boundary regex", per_ticker_regex),
+    ("compiled alternation", alternation),
+    ("TickerMatcher", ticker_matcher),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sentences', type=int, default=2000, help='sentences per run')
+    parser.add_argument('--repeat', type=int, default=3, help='timing repetitions (best is reported)')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    print(f"{'tickers':>8}  {'approach':<28}{'best (ms)':>10}{'per sentence (us)':>20}")
+    for ticker_count in (10, 100, 1000):
+        tickers = make_tickers(ticker_count, rng)
+        sentences = make_sentences(tickers, args.sentences, rng)
+        for name, func in APPROACHES:
+            best = min(timeit.repeat(lambda: func(sentences, tickers), number=1, repeat=args.repeat))
+            print(f"{ticker_count:>8}  {name:<28}{best * 1000:>10.1f}{best / len(sentences) * 1e6:>20.2f}")
+
+
+if __name__ == "__main__":
+    main()
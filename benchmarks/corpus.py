@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Synthetic r/stocks corpus generator.
+
+Produces posts shaped like RedditScraper output (and the Reddit JSON
+things RecordedReddit serves), with configurable post count, ticker
+density and sentence length. Ticker popularity follows a Zipf-like
+distribution, as a few symbols dominate real discussion, and text mixes
+in $-prefixed tickers, uppercase slang that looks like tickers, numbers
+and emoji.
+
+Usage: python benchmarks/corpus.py --posts N [--output FILE] [options]
+"""
+
+import argparse
+import itertools
+import json
+import random
+import string
+from dataclasses import dataclass
+from typing import Dict, List
+
+# Frequently discussed symbols; synthetic ones are added up to --tickers
+POPULAR_TICKERS = [
+    'TSLA', 'NVDA', 'AAPL', 'AMD', 'MSFT', 'AMZN', 'META', 'GOOGL', 'PLTR', 'SOFI',
+    'INTC', 'NFLX', 'BABA', 'DIS', 'COIN', 'GME', 'AMC', 'RIVN', 'NIO', 'JPM',
+    'BAC', 'KO', 'PFE', 'XOM', 'CVX', 'UBER', 'SHOP', 'SQ', 'PYPL', 'SNOW',
+]
+
+# Uppercase words that look like tickers but are not listed
+NOISE_WORDS = ['YOLO', 'DD', 'IMO', 'ATH', 'FOMO', 'HODL', 'IV', 'OTM', 'ITM', 'EOD', 'CEO', 'EPS', 'USA']
+
+BULLISH = ['strong', 'great', 'beat', 'bullish', 'love', 'undervalued', 'growth', 'buy', 'moon', 'record']
+BEARISH = ['weak', 'terrible', 'miss', 'bearish', 'hate', 'overvalued', 'decline', 'sell', 'crash', 'loss']
+FILLER = (
+    "the stock market said earnings were guidance looks and I think shares could drop after "
+    "call while others expect a rally this quarter revenue margin position holding week price "
+    "target analysts report long term short squeeze volume options chain today"
+).split()
+EMOJI = ['🚀', '📈', '📉', '💎', '🙌', '🐻', '🐂']
+
+
+@dataclass
+class CorpusConfig:
+    """Shape of a generated corpus."""
+    posts: int = 1000
+    tickers: int = 200
+    ticker_density: float = 0.3     # Share of sentences mentioning a ticker
+    sentence_words: int = 14        # Mean words per sentence
+    sentences_per_post: int = 6     # Mean sentences per post body
+    seed: int = 0
+    end_time: float = 1735689600.0  # Posts are spread over the day before (2025-01-01 UTC)
+
+
+def make_tickers(count: int, rng: random.Random) -> List[str]:
+    """Popular tickers first, then distinct synthetic 3-4 letter symbols."""
+    tickers = POPULAR_TICKERS[:count]
+    taken = set(tickers) | set(NOISE_WORDS)
+    while len(tickers) < count:
+        symbol = ''.join(rng.choices(string.ascii_uppercase, k=rng.randint(3, 4)))
+        if symbol not in taken:
+            taken.add(symbol)
+            tickers.append(symbol)
+    return tickers
+
+
+class CorpusGenerator:
+    """Generates a reproducible synthetic corpus for a CorpusConfig."""
+
+    def __init__(self, config: CorpusConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.tickers = make_tickers(config.tickers, self.rng)
+        # Zipf-like weights: the n-th ticker is mentioned about 1/n as often as the first
+        self._weights = list(itertools.accumulate(1 / rank for rank in range(1, len(self.tickers) + 1)))
+
+    def _ticker(self) -> str:
+        ticker = self.rng.choices(self.tickers, cum_weights=self._weights)[0]
+        return f"${ticker}" if self.rng.random() < 0.25 else ticker
+
+    def sentence(self) -> str:
+        """One sentence, mentioning one or two tickers with probability ticker_density."""
+        rng = self.rng
+        length = max(3, int(rng.gauss(self.config.sentence_words, self.config.sentence_words / 3)))
+        words = rng.choices(FILLER, k=length)
+        mood = BULLISH if rng.random() < 0.5 else BEARISH
+        for _ in range(rng.randint(1, 2)):
+            words[rng.randrange(length)] = rng.choice(mood)
+        if rng.random() < self.config.ticker_density:
+            for _ in range(1 if rng.random() < 0.8 else 2):
+                words.insert(rng.randrange(len(words) + 1), self._ticker())
+        if rng.random() < 0.1:
+            words.insert(rng.randrange(len(words) + 1), rng.choice(NOISE_WORDS))
+        if rng.random() < 0.1:
+            words.append(f"{rng.randint(1, 500)}%")
+        text = ' '.join(words)
+        end = rng.choice(['.', '.', '.', '!', '?'])
+        if rng.random() < 0.05:
+            end += ' ' + rng.choice(EMOJI)
+        return text[0].upper() + text[1:] + end
+
+    def post(self, index: int) -> Dict:
+        """A post dict as produced by RedditScraper.iter_top_daily_posts."""
+        rng = self.rng
+        count = max(0, int(rng.gauss(self.config.sentences_per_post, self.config.sentences_per_post / 2)))
+        return {
+            'id': f"b{index:06x}",
+            'title': self.sentence().rstrip('.!?'),
+            'body': ' '.join(self.sentence() for _ in range(count)),
+            'score': int(rng.paretovariate(1.2) * 10),
+            'created_utc': self.config.end_time - rng.uniform(0, 86400),
+            'edited': 0.0,
+            'source': 'stocks',
+            'crosspost_parent': None
+        }
+
+    def posts(self) -> List[Dict]:
+        """Every post of the corpus, highest score first like a top listing."""
+        posts = [self.post(index) for index in range(self.config.posts)]
+        posts.sort(key=lambda post: post['score'], reverse=True)
+        return posts
+
+
+def to_things(posts: List[Dict]) -> List[Dict]:
+    """Convert posts into the Reddit JSON t3 things served by RecordedReddit."""
+    return [{'kind': 't3', 'data': {
+        'id': post['id'],
+        'title': post['title'],
+        'selftext': post['body'],
+        'score': post['score'],
+        'created_utc': post['created_utc'],
+        'edited': False,
+        'crosspost_parent': None
+    }} for post in posts]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--posts', type=int, default=1000, help='posts to generate (default: 1000)')
+    parser.add_argument('--tickers', type=int, default=200, help='distinct tickers (default: 200)')
+    parser.add_argument('--ticker-density', type=float, default=0.3,
+                        help='share of sentences mentioning a ticker (default: 0.3)')
+    parser.add_argument('--sentence-words', type=int, default=14, help='mean words per sentence (default: 14)')
+    parser.add_argument('--sentences-per-post', type=int, default=6, help='mean sentences per post (default: 6)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed (default: 0)')
+    parser.add_argument('--output', metavar='FILE',
+                        help='write a Reddit top.json listing here (default: print a sample post)')
+    args = parser.parse_args()
+
+    generator = CorpusGenerator(CorpusConfig(
+        posts=args.posts,
+        tickers=args.tickers,
+        ticker_density=args.ticker_density,
+        sentence_words=args.sentence_words,
+        sentences_per_post=args.sentences_per_post,
+        seed=args.seed
+    ))
+    posts = generator.posts()
+    if args.output:
+        # Same layout as RecordedReddit.from_directory expects for r/<subreddit>/top.json
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'kind': 'Listing', 'data': {'children': to_things(posts)}}, f)
+        print(f"Wrote {len(posts)} posts to {args.output}")
+    else:
+        print(json.dumps(posts[0], indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
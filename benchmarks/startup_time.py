@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark application startup.
+
+Launches fresh interpreters and measures, from process launch:
+- import time of the GUI (src.gui.app), with the slowest imports taken
+  from python -X importtime;
+- time to first frame: until the main window has been built and its
+  first round of drawing has been processed.
+
+It also lists heavy modules imported before the first frame, which should
+be none: they are deferred until an analysis starts or a ticker is opened.
+Time to first frame needs a display.
+
+Usage: python benchmarks/startup_time.py [--runs N] [--top N] [--budget SECONDS]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Modules that must not be imported before the window appears
+HEAVY_MODULES = ('matplotlib', 'numpy', 'pandas', 'pyarrow', 'yfinance', 'praw', 'nltk', 'vaderSentiment')
+
+IMPORT_ONLY = f"""
+import sys
+sys.path.insert(0, {ROOT!r})
+import src.gui.app
+"""
+
+FIRST_FRAME = f"""
+import sys
+sys.path.insert(0, {ROOT!r})
+from src.gui.app import StockSentimentApp
+app = StockSentimentApp()
+app.root.update()
+print("first-frame", flush=True)
+print(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules), flush=True)
+app.root.destroy()
+"""
+
+
+def time_process(code: str) -> float:
+    """Wall time in seconds of a fresh interpreter running code."""
+    started = time.perf_counter()
+    subprocess.run([sys.executable, '-c', code], check=True, capture_output=True)
+    return time.perf_counter() - started
+
+
+def time_first_frame():
+    """Seconds from launch to the first processed frame, and the heavy modules loaded by then."""
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable, '-c', FIRST_FRAME],
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    first_line = process.stdout.readline()
+    elapsed = time.perf_counter() - started
+    heavy = process.stdout.readline().strip()
+    _, stderr = process.communicate()
+    if process.returncode != 0 or first_line.strip() != 'first-frame':
+        raise RuntimeError(stderr.strip().splitlines()[-1] if stderr.strip() else 'no first frame')
+    return elapsed, [name for name in heavy.split(',') if name]
+
+
+def slowest_imports(top: int):
+    """Parse python -X importtime output into the top modules by cumulative microseconds."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', IMPORT_ONLY],
+                            capture_output=True, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        match = re.match(r'import time:\s+(\d+) \|\s+(\d+) \| (.*)', line)
+        if match:
+            rows.append((int(match.group(2)), int(match.group(1)), match.group(3)))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5, help='launches per measurement (default: 5)')
+    parser.add_argument('--top', type=int, default=15, help='slowest imports to list (default: 15)')
+    parser.add_argument('--budget', type=float, default=None,
+                        help='fail (exit 1) if the median time to first frame exceeds SECONDS')
+    args = parser.parse_args()
+
+    baseline = statistics.median(time_process('pass') for _ in range(args.runs))
+    imports = statistics.median(time_process(IMPORT_ONLY) for _ in range(args.runs))
+    print(f"Interpreter startup:  {baseline * 1000:7.1f} ms")
+    print(f"GUI import:           {imports * 1000:7.1f} ms ({(imports - baseline) * 1000:.1f} ms over startup)")
+
+    print("\nSlowest imports (cumulative):")
+    for cumulative, own, name in slowest_imports(args.top):
+        print(f"  {cumulative / 1000:7.1f} ms  {own / 1000:7.1f} ms self  {name}")
+
+    try:
+        runs = [time_first_frame() for _ in range(args.runs)]
+    except RuntimeError as e:
+        print(f"\nTime to first frame:  unavailable ({e})")
+        return
+
+    first_frame = statistics.median(elapsed for elapsed, _ in runs)
+    heavy = sorted({name for _, names in runs for name in names})
+    print(f"\nTime to first frame:  {first_frame * 1000:7.1f} ms")
+    print(f"Heavy modules loaded: {', '.join(heavy) if heavy else 'none'}")
+
+    if args.budget is not None and first_frame > args.budget:
+        print(f"Over budget: {first_frame:.3f}s > {args.budget:.3f}s")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
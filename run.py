@@ -4,6 +4,7 @@ Stock Sentiment Analyzer GUI
 Run this script to start the graphical user interface.
 """
 
+import multiprocessing
 import os
 import sys
 
@@ -13,6 +14,8 @@ sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 from src.gui.app import main
 
 if __name__ == "__main__":
+    # Required for sentiment worker processes in the frozen Windows build
+    multiprocessing.freeze_support()
     try:
         main()
     except KeyboardInterrupt:
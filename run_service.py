@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Stock Sentiment Analyzer service
+Run this script to analyze sentiment headlessly on a schedule, e.g.
+    python run_service.py --cron "0 9-16 * * 1-5" --workers 4
+"""
+
+import multiprocessing
+import os
+import sys
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from src.sentiment_analyzer.service import main
+
+if __name__ == "__main__":
+    # Required for sentiment worker processes in the frozen Windows build
+    multiprocessing.freeze_support()
+    try:
+        main()
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        sys.exit(1)
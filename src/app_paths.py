@@ -0,0 +1,28 @@
+import os
+import sys
+from pathlib import Path
+
+APP_NAME = "BullBearRadar"
+
+
+def get_app_data_dir() -> Path:
+    """
+    Get the per-user directory used for caches and logs, creating it if needed.
+
+    The location can be overridden with the BULLBEARRADAR_DATA_DIR environment
+    variable; otherwise %APPDATA%/BullBearRadar is used on Windows and
+    ~/.bullbearradar everywhere else.
+
+    Returns:
+        Path: Existing application data directory
+    """
+    override = os.getenv("BULLBEARRADAR_DATA_DIR")
+    if override:
+        data_dir = Path(override)
+    elif sys.platform == "win32" and os.getenv("APPDATA"):
+        data_dir = Path(os.getenv("APPDATA")) / APP_NAME
+    else:
+        data_dir = Path.home() / f".{APP_NAME.lower()}"
+
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
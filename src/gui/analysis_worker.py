@@ -0,0 +1,90 @@
+import queue
+import threading
+import logging
+from typing import Callable, List, Optional, Tuple
+
+from ..sentiment_analyzer.cancellation import AnalysisCancelled
+
+# Event kinds pushed to the queue by the worker thread
+PROGRESS = 'progress'
+DONE = 'done'
+ERROR = 'error'
+CANCELLED = 'cancelled'
+
+
+class AnalysisWorker:
+    """
+    Runs the sentiment analysis on a background thread.
+
+    The worker never touches Tk: progress updates and the final outcome are
+    pushed to a thread-safe queue as (kind, payload) events, which the GUI
+    drains from its own event loop with poll().
+    """
+
+    def __init__(self, analyze: Callable[..., Tuple[List[str], List[str]]]):
+        """
+        Initialize the worker.
+
+        Args:
+            analyze (Callable): Analysis entry point accepting progress_callback
+                and cancel_event keyword arguments, e.g. sentiment_analyzer.main.main
+        """
+        self.analyze = analyze
+        self.logger = logging.getLogger(__name__)
+        self.events: queue.Queue = queue.Queue()
+        self._cancel_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def is_running(self) -> bool:
+        """Check whether a run is in flight."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        """
+        Start a run unless one is already in flight.
+
+        Returns:
+            bool: True if a new run was started
+        """
+        if self.is_running():
+            self.logger.info("Analysis already running, not starting another")
+            return False
+        self._cancel_event = threading.Event()
+        # Daemon thread, so closing the window does not wait for network calls
+        self._thread = threading.Thread(
+            target=self._run, args=(self._cancel_event,), name="analysis", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def cancel(self):
+        """Ask the in-flight run to stop at its next progress checkpoint."""
+        self._cancel_event.set()
+
+    def _run(self, cancel_event: threading.Event):
+        """Thread body: run the analysis and report its outcome."""
+        try:
+            result = self.analyze(
+                progress_callback=lambda update: self.events.put((PROGRESS, update)),
+                cancel_event=cancel_event
+            )
+            self.events.put((DONE, result))
+        except AnalysisCancelled:
+            self.events.put((CANCELLED, None))
+        except Exception as e:
+            self.logger.error(f"Error during analysis: {str(e)}")
+            self.events.put((ERROR, e))
+
+    def poll(self) -> List[Tuple[str, object]]:
+        """
+        Take every pending event without blocking.
+
+        Returns:
+            List[Tuple[str, object]]: (kind, payload) events in the order they were sent
+        """
+        pending = []
+        while True:
+            try:
+                pending.append(self.events.get_nowait())
+            except queue.Empty:
+                return pending
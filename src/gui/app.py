@@ -3,12 +3,26 @@ from tkinter import messagebox
 from typing import Tuple, List, Optional
 
 
-from ..sentiment_analyzer.main import main as analyze_sentiment
+from .analysis_worker import AnalysisWorker, PROGRESS, DONE, ERROR, CANCELLED
 from .loading_frame import LoadingFrame
 from .results_frame import ResultsFrame
 from .stock_details_frame import StockDetailsFrame
 
+def analyze_sentiment(**kwargs) -> Tuple[List[str], List[str]]:
+    """
+    Run the sentiment analysis.
+    
+    The analysis modules (praw, nltk, vaderSentiment, yfinance, pandas) are
+    imported here, on the worker thread of the first run, rather than
+    before the window can appear.
+    """
+    from ..sentiment_analyzer.main import main
+    return main(**kwargs)
+
 class StockSentimentApp:
+    # Milliseconds between checks for events from the analysis worker
+    POLL_INTERVAL = 50
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("BullBearRadar")
@@ -21,11 +35,17 @@ class StockSentimentApp:
         self.results_frame = ResultsFrame(self.root)
         self.stock_details_frame = StockDetailsFrame(self.root)
         
+        # Analysis runs on a background thread; the Tk loop only drains its events
+        self.worker = AnalysisWorker(analyze_sentiment)
+        self._poll_id: Optional[str] = None
+        
         # Set callbacks
         print("Setting up callbacks")  # Debug print
         self.results_frame.set_analyze_callback(self.start_analysis)
         self.results_frame.set_stock_click_callback(self.show_stock_details)
         self.stock_details_frame.set_back_callback(self.show_results_frame)
+        self.loading_frame.set_cancel_callback(self.cancel_analysis)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
         print("Callbacks set")  # Debug print
         
         # Start with loading frame
@@ -65,32 +85,63 @@ class StockSentimentApp:
             )
             
     def start_analysis(self):
-        """Start the sentiment analysis process."""
+        """Start the sentiment analysis on the background worker."""
+        if self.worker.is_running():
+            print("Analysis already running")  # Debug print
+            return
+        
         print("Starting new analysis")  # Debug print
+        self.results_frame.set_analyze_enabled(False)
         self.show_loading_frame()
-        print("Showed loading frame")  # Debug print
-        self.root.update()
+        self.worker.start()
+        self._poll_id = self.root.after(self.POLL_INTERVAL, self._poll_worker)
         
-        try:
-            print("Running sentiment analysis")  # Debug print
-            # Run sentiment analysis with progress callback
-            bullish, bearish = analyze_sentiment(progress_callback=self.handle_progress)
-            
-            print(f"Analysis complete. Bullish: {bullish}, Bearish: {bearish}")  # Debug print
-            # Update results display
-            self.results_frame.display_results(bullish, bearish)
-            print("Updated results")  # Debug print
-            self.show_results_frame()
-            print("Showed results frame")  # Debug print
-            
-        except Exception as e:
-            print(f"Error during analysis: {str(e)}")  # Debug print
-            # Show error message
-            tk.messagebox.showerror(
-                "Error",
-                f"An error occurred during analysis:\n{str(e)}"
-            )
-            self.show_results_frame()
+    def cancel_analysis(self):
+        """Ask the running analysis to stop; the results frame returns once it has."""
+        print("Cancelling analysis")  # Debug print
+        self.worker.cancel()
+        
+    def _poll_worker(self):
+        """Apply the events sent by the analysis worker, then check again unless it has finished."""
+        self._poll_id = None
+        for kind, payload in self.worker.poll():
+            if kind == PROGRESS:
+                self.handle_progress(payload)
+            elif kind == DONE:
+                bullish, bearish = payload
+                print(f"Analysis complete. Bullish: {bullish}, Bearish: {bearish}")  # Debug print
+                self.results_frame.display_results(bullish, bearish)
+                # Download the ranked tickers' details before they are clicked
+                self.stock_details_frame.stock_data.prefetch(bullish + bearish)
+                self._finish_analysis()
+                return
+            elif kind == CANCELLED:
+                print("Analysis cancelled")  # Debug print
+                self._finish_analysis()
+                return
+            elif kind == ERROR:
+                print(f"Error during analysis: {str(payload)}")  # Debug print
+                self._finish_analysis()
+                # Show error message
+                tk.messagebox.showerror(
+                    "Error",
+                    f"An error occurred during analysis:\n{str(payload)}"
+                )
+                return
+        self._poll_id = self.root.after(self.POLL_INTERVAL, self._poll_worker)
+        
+    def _finish_analysis(self):
+        """Return to the results once a run has ended."""
+        self.results_frame.set_analyze_enabled(True)
+        self.show_results_frame()
+        
+    def close(self):
+        """Cancel any running analysis and prefetch, then close the window."""
+        self.worker.cancel()
+        self.stock_details_frame.close()
+        if self._poll_id:
+            self.root.after_cancel(self._poll_id)
+        self.root.destroy()
             
     def run(self):
         """Start the application."""
@@ -0,0 +1,52 @@
+import numpy as np
+
+
+def lttb_indices(x, y, threshold: int) -> np.ndarray:
+    """
+    Pick the points to plot with Largest-Triangle-Three-Buckets downsampling.
+
+    The first and last points are always kept. The points in between are
+    split into threshold - 2 buckets, and each bucket keeps the point that
+    forms the largest triangle with the point kept from the previous bucket
+    and the average of the next bucket, which preserves peaks and troughs
+    far better than taking every n-th point.
+
+    Args:
+        x: Ascending x values (e.g. matplotlib date numbers)
+        y: y values, same length as x
+        threshold (int): Maximum number of points to keep
+
+    Returns:
+        np.ndarray: Ascending indices of the kept points (all indices if
+            there are no more than threshold points)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # threshold - 2 buckets over the inner points 1 .. n - 2
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+            next_x, next_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+
+        # Twice the triangle areas; the constant factor does not change the argmax
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+
+    return selected
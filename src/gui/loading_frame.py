@@ -10,6 +10,7 @@ class LoadingFrame(tk.Frame):
         self._current_progress = 0
         self._target_progress = 0
         self._animation_id: Optional[str] = None
+        self._cancel_callback = None
         
         # Configure style for progress bar
         style = ttk.Style()
@@ -62,6 +63,35 @@ class LoadingFrame(tk.Frame):
         )
         self.status_label.pack(pady=10)
         
+        # Create cancel button
+        self.cancel_button = tk.Button(
+            self.label_frame,
+            text="Cancel",
+            command=self._on_cancel_click,
+            bg="#040F16",
+            fg="#FBFBFF",
+            activebackground="#0B1B24",
+            activeforeground="#FBFBFF",
+            relief=tk.RAISED,
+            bd=2,
+            cursor="hand2",
+            padx=20,
+            pady=5,
+            font=("Helvetica", 10)
+        )
+        self.cancel_button.pack(pady=10)
+        
+    def _on_cancel_click(self):
+        """Handle the Cancel button: disable it until the run has stopped."""
+        self.cancel_button.configure(state=tk.DISABLED)
+        self.status_label["text"] = "Cancelling..."
+        if self._cancel_callback:
+            self._cancel_callback()
+            
+    def set_cancel_callback(self, callback):
+        """Set the callback function for the Cancel button."""
+        self._cancel_callback = callback
+        
     def _animate_progress(self):
         """Animate the progress bar smoothly towards target value."""
         if self._current_progress < self._target_progress:
@@ -70,7 +100,6 @@ class LoadingFrame(tk.Frame):
                 self._target_progress
             )
             self.progress_bar["value"] = self._current_progress
-            self.update_idletasks()
             
             if self._current_progress < self._target_progress:
                 self._animation_id = self.after(20, self._animate_progress)
@@ -86,7 +115,8 @@ class LoadingFrame(tk.Frame):
         self._target_progress = value
         self._animate_progress()
         
-        if status:
+        # Keep "Cancelling..." visible for updates sent before the run noticed
+        if status and str(self.cancel_button["state"]) != tk.DISABLED:
             self.status_label["text"] = status
         
     def reset(self):
@@ -98,4 +128,4 @@ class LoadingFrame(tk.Frame):
         self._target_progress = 0
         self.progress_bar["value"] = 0
         self.status_label["text"] = "Starting analysis..."
-        self.update()
\ No newline at end of file
+        self.cancel_button.configure(state=tk.NORMAL)
\ No newline at end of file
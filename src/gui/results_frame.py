@@ -123,6 +123,10 @@ class ResultsFrame(tk.Frame):
         print(f"Setting analyze callback: {callback}")  # Debug print
         self._on_analyze_click_callback = callback
         
+    def set_analyze_enabled(self, enabled: bool):
+        """Enable or disable the Analyze Again button, e.g. while a run is in flight."""
+        self.analyze_button.configure(state=tk.NORMAL if enabled else tk.DISABLED)
+        
     def set_stock_click_callback(self, callback):
         """Set the callback function for when a stock is clicked."""
         self._stock_click_callback = callback
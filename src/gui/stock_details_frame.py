@@ -1,18 +1,34 @@
+import time
+import logging
 import tkinter as tk
-from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-from typing import Dict, Any
 
-from ..stock_performance.stock_data import StockData
+# matplotlib, numpy, pandas and yfinance are imported when the first ticker
+# is shown, so they do not delay the application window
 
 class StockDetailsFrame(tk.Frame):
+    # Most points drawn in the price chart; longer histories are downsampled
+    MAX_CHART_POINTS = 500
+    
     def __init__(self, master=None):
         super().__init__(master, bg="#040F16")
-        self.stock_data = StockData()
+        self.logger = logging.getLogger(__name__)
+        self._stock_data = None
+        self._canvas = None
         self._create_widgets()
         
+    @property
+    def stock_data(self):
+        """The StockData used for the details, created on first use."""
+        if self._stock_data is None:
+            from ..stock_performance.stock_data import StockData
+            self._stock_data = StockData()
+        return self._stock_data
+        
+    def close(self):
+        """Stop background price prefetching, if any was started."""
+        if self._stock_data is not None:
+            self._stock_data.close()
+        
     def _create_widgets(self):
         """Create and setup the stock details display widgets."""
         
@@ -132,16 +148,17 @@ class StockDetailsFrame(tk.Frame):
         self.market_cap_label.config(text=f"Market Cap: {self._format_market_cap(data['market_cap'])}")
         self.pe_ratio_label.config(text=f"P/E Ratio: {data['pe_ratio']:.2f}")
         
-        # Create and display price history chart
-        self._create_price_chart(data['history'])
+        # Display price history in the chart
+        if self._canvas is None:
+            self._create_price_chart()
+        self._update_price_chart(data['history'])
+        
+    def _create_price_chart(self):
+        """Create the price history chart once; later tickers only replace its line data."""
+        import matplotlib.dates as mdates
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
         
-    def _create_price_chart(self, history):
-        """Create and display the price history chart."""
-        # Clear previous chart if it exists
-        for widget in self.chart_frame.winfo_children():
-            widget.destroy()
-            
-        # Create figure and plot
         fig = Figure(figsize=(10, 5), dpi=100)  # Larger chart size for better visibility
         fig.patch.set_facecolor('#040F16')
         
@@ -155,23 +172,78 @@ class StockDetailsFrame(tk.Frame):
         for spine in ax.spines.values():
             spine.set_color('white')
             
-        # Plot price history
-        ax.plot(history.index, history['Close'], color='#55A76A', linewidth=2)  # Thicker line
+        # Empty price line; animated, so it is drawn by blitting on top of the cached background
+        self._price_line, = ax.plot([], [], color='#55A76A', linewidth=2, animated=True)  # Thicker line
         ax.set_title('Price History (1 Year)', color='white', pad=10, fontsize=12)
         ax.grid(True, alpha=0.2)
         
-        # Format x-axis
-        ax.xaxis.set_major_locator(plt.MaxNLocator(6))  # Limit number of x-axis labels
-        plt.setp(ax.get_xticklabels(), rotation=30, ha='right')  # Adjusted rotation and alignment
+        # Format x-axis as dates
+        ax.xaxis_date()
+        ax.xaxis.set_major_locator(mdates.AutoDateLocator(maxticks=6))  # Limit number of x-axis labels
         
         # Add the plot to the frame
         # Create a container frame for the canvas with padding
         canvas_container = tk.Frame(self.chart_frame, bg="#040F16", padx=10, pady=5)
         canvas_container.pack(fill=tk.BOTH, expand=True)
         
-        canvas = FigureCanvasTkAgg(fig, master=canvas_container)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self._figure = fig
+        self._ax = ax
+        self._background = None
+        self._canvas = FigureCanvasTkAgg(fig, master=canvas_container)
+        self._canvas.mpl_connect('draw_event', self._on_chart_draw)
+        self._canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+    def _on_chart_draw(self, event):
+        """After a full redraw, cache the background and blit the price line onto it."""
+        self._background = self._canvas.copy_from_bbox(self._figure.bbox)
+        self._ax.draw_artist(self._price_line)
+        self._canvas.blit(self._figure.bbox)
+        
+    def _update_price_chart(self, history):
+        """Show a price history in the chart, redrawing as little as possible."""
+        import matplotlib.dates as mdates
+        import numpy as np
+        from .downsample import lttb_indices
+        
+        started = time.perf_counter()
+        
+        dates = mdates.date2num(history.index)
+        closes = history['Close'].to_numpy(dtype=float)
+        # yfinance gives NaN closes for halts and partial bars; skip them like plot() would
+        valid = ~np.isnan(closes)
+        dates, closes = dates[valid], closes[valid]
+        keep = lttb_indices(dates, closes, self.MAX_CHART_POINTS)
+        dates, closes = dates[keep], closes[keep]
+        self._price_line.set_data(dates, closes)
+        
+        # Compute limits directly instead of relim()/autoscale_view() over every artist
+        if len(dates):
+            low, high = float(closes.min()), float(closes.max())
+            margin = (high - low) * 0.05 or abs(high) * 0.05 or 1.0
+            limits = ((float(dates[0]), float(dates[-1]) if dates[-1] > dates[0] else float(dates[0]) + 1),
+                      (low - margin, high + margin))
+        else:
+            limits = (self._ax.get_xlim(), self._ax.get_ylim())
+        
+        if self._background is not None and limits == (self._ax.get_xlim(), self._ax.get_ylim()):
+            # Same axes, e.g. reopening a ticker: only the line needs drawing
+            self._canvas.restore_region(self._background)
+            self._ax.draw_artist(self._price_line)
+            self._canvas.blit(self._figure.bbox)
+            mode = "blit"
+        else:
+            self._ax.set_xlim(*limits[0])
+            self._ax.set_ylim(*limits[1])
+            for label in self._ax.get_xticklabels():
+                label.set_rotation(30)  # Adjusted rotation and alignment
+                label.set_horizontalalignment('right')
+            self._canvas.draw()
+            mode = "full"
+        
+        self.logger.debug(
+            f"Price chart {mode} redraw of {len(dates)}/{len(history)} points "
+            f"in {(time.perf_counter() - started) * 1000:.1f} ms"
+        )
         
     def _on_back_click(self):
         """Callback for Back button - to be set by main app."""
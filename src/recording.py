@@ -0,0 +1,127 @@
+import gzip
+import json
+import threading
+import logging
+from pathlib import Path
+from typing import Any, Dict, Union
+
+# Channels written by the components that talk to Reddit and Yahoo Finance
+REDDIT_LISTING = 'reddit_listing'
+REDDIT_COMMENTS = 'reddit_comments'
+YFINANCE_INFO = 'yfinance_info'
+YFINANCE_HISTORY = 'yfinance_history'
+
+
+class Snapshot:
+    """
+    Records external responses to, or replays them from, a snapshot directory.
+
+    Each channel is a gzip-compressed JSONL file (<channel>.jsonl.gz) of
+    {"key": ..., "payload": ...} lines. When a key is recorded more than once
+    the last payload wins on replay.
+    """
+
+    RECORD = 'record'
+    REPLAY = 'replay'
+
+    def __init__(self, directory: Union[str, Path], mode: str):
+        """
+        Open a snapshot.
+
+        Args:
+            directory (str | Path): Snapshot directory (created when recording)
+            mode (str): Snapshot.RECORD or Snapshot.REPLAY
+        """
+        if mode not in (self.RECORD, self.REPLAY):
+            raise ValueError(f"Unknown snapshot mode: {mode}")
+        self.directory = Path(directory)
+        self.mode = mode
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._writers: Dict[str, Any] = {}
+        self._channels: Dict[str, Dict[str, Any]] = {}
+
+        if mode == self.RECORD:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        elif not self.directory.is_dir():
+            raise FileNotFoundError(f"Snapshot directory not found: {self.directory}")
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == self.RECORD
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == self.REPLAY
+
+    def _channel_path(self, channel: str) -> Path:
+        return self.directory / f"{channel}.jsonl.gz"
+
+    def record(self, channel: str, key: str, payload: Any):
+        """
+        Append a response to a channel.
+
+        Args:
+            channel (str): Channel name, e.g. YFINANCE_INFO
+            key (str): Lookup key, e.g. the ticker symbol
+            payload (Any): JSON-serializable response
+        """
+        if not self.recording:
+            return
+        line = json.dumps({"key": key, "payload": payload}, default=str) + "\n"
+        with self._lock:
+            writer = self._writers.get(channel)
+            if writer is None:
+                writer = gzip.open(self._channel_path(channel), 'at', encoding='utf-8')
+                self._writers[channel] = writer
+            writer.write(line)
+
+    def entries(self, channel: str) -> Dict[str, Any]:
+        """
+        Get every recorded payload of a channel.
+
+        Args:
+            channel (str): Channel name
+
+        Returns:
+            Dict[str, Any]: Payloads by key (empty if the channel was never recorded)
+        """
+        with self._lock:
+            if channel not in self._channels:
+                entries = {}
+                path = self._channel_path(channel)
+                if path.exists():
+                    with gzip.open(path, 'rt', encoding='utf-8') as f:
+                        for line in f:
+                            if line.strip():
+                                entry = json.loads(line)
+                                entries[entry["key"]] = entry["payload"]
+                self._channels[channel] = entries
+            return self._channels[channel]
+
+    def lookup(self, channel: str, key: str) -> Any:
+        """
+        Get a recorded payload.
+
+        Args:
+            channel (str): Channel name
+            key (str): Lookup key
+
+        Returns:
+            Any: The recorded payload
+
+        Raises:
+            KeyError: If nothing was recorded for the key
+        """
+        entries = self.entries(channel)
+        if key not in entries:
+            raise KeyError(f"No {channel} recorded for {key!r} in {self.directory}")
+        return entries[key]
+
+    def close(self):
+        """Flush and close the channel files being recorded."""
+        with self._lock:
+            for writer in self._writers.values():
+                writer.close()
+            self._writers.clear()
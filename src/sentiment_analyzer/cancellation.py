@@ -0,0 +1,2 @@
+class AnalysisCancelled(Exception):
+    """Raised when a run is cancelled through its cancel_event."""
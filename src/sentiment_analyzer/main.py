@@ -1,14 +1,32 @@
+import argparse
 import os
+import sys
+import threading
 from datetime import datetime
 import logging
 import pandas as pd
 from dotenv import load_dotenv
-from typing import List, Tuple, Callable, Optional
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Tuple, Callable, Optional, Union
 import csv
 
 from .reddit_scraper import RedditScraper
 from .ticker_utils import TickerExtractor
+from .symbol_universe import SymbolUniverse
 from .sentiment_analyzer import SentimentAnalyzer
+from .score_cache import ScoreCache
+from .segmenter import DEFAULT_SEGMENTER, SEGMENTERS
+from .multi_subreddit import MultiSubredditScraper
+from .pipeline import build_mention_table
+from .sentiment_log import SentimentLogStore
+from .ticker_history import ALL_SOURCES, TickerHistoryStore
+from .post_checkpoint import PostCheckpointStore
+from .recorded_reddit import RecordedReddit
+from .cancellation import AnalysisCancelled
+from .metrics import RunMetrics
+from ..app_paths import get_app_data_dir
+from ..recording import Snapshot
 
 # Set up logging
 logging.basicConfig(
@@ -17,15 +35,40 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def load_or_create_sentiment_log() -> pd.DataFrame:
-    """Load existing sentiment log or create a new one if it doesn't exist."""
+# Number of top daily posts analyzed per run
+POST_LIMIT = 50
+
+# Log file written by earlier versions to the working directory
+LEGACY_LOG_CSV = 'sentiment_log.csv'
+
+def get_sentiment_log_store() -> SentimentLogStore:
+    """Open the sentiment log, importing the legacy CSV the first time."""
+    store = SentimentLogStore()
+    if len(store) == 0 and os.path.exists(LEGACY_LOG_CSV):
+        try:
+            store.import_csv(LEGACY_LOG_CSV)
+        except Exception as e:
+            logger.error(f"Error importing {LEGACY_LOG_CSV}: {str(e)}")
+    return store
+
+def load_or_create_sentiment_log(store: Optional[SentimentLogStore] = None) -> pd.DataFrame:
+    """Load the sentiment log as a DataFrame (empty if nothing was logged yet)."""
     columns = ['Date', 'Top 3 Bullish', 'Top 3 Bearish']
     
     try:
-        if os.path.exists('sentiment_log.csv'):
-            return pd.read_csv('sentiment_log.csv')
+        if store is None:
+            log_store = get_sentiment_log_store()
+            rows = log_store.read_range()
+            log_store.close()
         else:
-            return pd.DataFrame(columns=columns)
+            rows = store.read_range()
+        return pd.DataFrame(
+            [
+                [row['date'], format_ticker_list(row['bullish']), format_ticker_list(row['bearish'])]
+                for row in rows
+            ],
+            columns=columns
+        )
     except Exception as e:
         logger.error(f"Error loading sentiment log: {str(e)}")
         return pd.DataFrame(columns=columns)
@@ -34,139 +77,399 @@ def format_ticker_list(tickers: List[str]) -> str:
     """Format list of tickers into comma-separated string."""
     return ', '.join(tickers) if tickers else ''
 
-def save_results(bullish: List[str], bearish: List[str]):
-    """Save results to sentiment_log.csv."""
+def save_results(bullish: List[str], bearish: List[str], store: Optional[SentimentLogStore] = None):
+    """Save results to the sentiment log, replacing any earlier results for today."""
     try:
         # Get today's date
         today = datetime.now().strftime('%Y-%m-%d')
         
-        # Format data
-        new_row = {
-            'Date': today,
-            'Top 3 Bullish': format_ticker_list(bullish),
-            'Top 3 Bearish': format_ticker_list(bearish)
-        }
-        
-        # Load existing data
-        df = load_or_create_sentiment_log()
-        
-        # Append new results
-        df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-        
-        # Save to CSV
-        df.to_csv('sentiment_log.csv', index=False)
+        if store is None:
+            log_store = get_sentiment_log_store()
+            log_store.upsert(today, bullish, bearish)
+            log_store.close()
+        else:
+            store.upsert(today, bullish, bearish)
         logger.info("Results saved successfully")
         
     except Exception as e:
         logger.error(f"Error saving results: {str(e)}")
 
-def main(progress_callback: Optional[Callable[[str], None]] = None) -> Tuple[List[str], List[str]]:
-    """Main function to orchestrate the Reddit sentiment analysis workflow."""
+def save_ticker_history(aggregates: pd.DataFrame, source_aggregates: pd.DataFrame, store: TickerHistoryStore):
+    """
+    Save today's aggregates of every ticker, combined and per source, to the ticker history.
+    
+    Args:
+        aggregates (pd.DataFrame): MentionTable.aggregate() output, indexed by ticker
+        source_aggregates (pd.DataFrame): The same, indexed by source and ticker
+        store (TickerHistoryStore): History to replace today's rows in
+    """
     try:
-        # Load environment variables
-        load_dotenv()
-        
-        # Initialize components
-        reddit_scraper = RedditScraper(
-            client_id=os.getenv('REDDIT_CLIENT_ID'),
-            client_secret=os.getenv('REDDIT_CLIENT_SECRET'),
-            user_agent=os.getenv('REDDIT_USER_AGENT')
-        )
+        today = datetime.now().strftime('%Y-%m-%d')
+        rows = aggregates.reset_index().assign(source=ALL_SOURCES).to_dict('records')
+        rows += source_aggregates.reset_index().to_dict('records')
+        store.record_day(today, rows)
+        logger.info(f"Saved {len(aggregates)} ticker aggregates to the ticker history")
         
-        ticker_extractor = TickerExtractor()
-        sentiment_analyzer = SentimentAnalyzer()
+    except Exception as e:
+        logger.error(f"Error saving ticker history: {str(e)}")
+
+@dataclass
+class AnalysisComponents:
+    """
+    The long-lived parts of an analysis, built once and reusable across runs.
+    
+    Keeping them between runs keeps the ticker validation cache, score cache,
+    symbol universe, VADER lexicon and scoring worker processes warm.
+    """
+    reddit_scraper: Union[RedditScraper, MultiSubredditScraper]
+    ticker_extractor: TickerExtractor
+    sentiment_analyzer: SentimentAnalyzer
+    subreddits: List[str]
+    checkpoints: Optional[PostCheckpointStore] = None
+    log_store: Optional[SentimentLogStore] = None  # None: results are not saved
+    history: Optional[TickerHistoryStore] = None  # None: ticker aggregates are not saved
+    snapshot: Optional[Snapshot] = None
+    
+    def close(self):
+        """Save the score cache and release worker processes, databases and snapshot files."""
+        try:
+            self.sentiment_analyzer.score_cache.save()
+        finally:
+            self.sentiment_analyzer.close()
+            if self.checkpoints:
+                self.checkpoints.close()
+            if self.log_store:
+                self.log_store.close()
+            if self.history:
+                self.history.close()
+            if self.snapshot:
+                self.snapshot.close()
+    
+    def metrics_sources(self) -> List[Callable[[], dict]]:
+        """Counter readers of the components, for RunMetrics."""
+        score_cache = self.sentiment_analyzer.score_cache
+        return [
+            self.reddit_scraper.counters.snapshot,
+            self.ticker_extractor.counters.snapshot,
+            lambda: {'score_cache_hits': score_cache.hits, 'score_cache_misses': score_cache.misses}
+        ]
+
+def build_components(workers: int = 1,
+                     record_dir: Optional[str] = None,
+                     replay_dir: Optional[str] = None,
+                     subreddits: Optional[List[str]] = None,
+                     segmenter: str = DEFAULT_SEGMENTER) -> AnalysisComponents:
+    """
+    Build the components of an analysis from the environment (.env).
+    
+    In record mode every Reddit and Yahoo Finance response is captured to a
+    snapshot directory; in replay mode runs are served entirely from such
+    a snapshot, without network access. Both modes bypass the validation
+    cache, symbol universe and post checkpoints so that every response is
+    captured and replays are deterministic; replays do not update the
+    sentiment log or the ticker history.
+    
+    Args:
+        workers (int): Processes used for sentiment scoring; 1 scores serially
+        record_dir (str, optional): Snapshot directory to record responses to
+        replay_dir (str, optional): Snapshot directory to replay responses from
+        subreddits (List[str], optional): Subreddits to analyze together (default: stocks);
+            the top POST_LIMIT posts of each are fetched concurrently
+        segmenter (str): Sentence segmenter, 'regex' (built in) or 'punkt' (needs NLTK data)
         
-        # Update progress and fetch Reddit posts
-        if progress_callback:
-            progress_callback({"step": "fetching_posts", "message": "Fetching posts from r/stocks...", "progress": 5})
-        logger.info("Fetching posts from r/stocks...")
-        posts = reddit_scraper.get_top_daily_posts()
+    Returns:
+        AnalysisComponents: Components to pass to run_analysis; close them when done
+    """
+    if record_dir and replay_dir:
+        raise ValueError("Cannot record and replay in the same run")
+    
+    # Load environment variables
+    load_dotenv()
+    
+    snapshot = None
+    if record_dir:
+        snapshot = Snapshot(record_dir, Snapshot.RECORD)
+    elif replay_dir:
+        snapshot = Snapshot(replay_dir, Snapshot.REPLAY)
+    
+    # Initialize components
+    subreddits = subreddits or ['stocks']
+    reddit_options = dict(
+        client_id=os.getenv('REDDIT_CLIENT_ID'),
+        client_secret=os.getenv('REDDIT_CLIENT_SECRET'),
+        user_agent=os.getenv('REDDIT_USER_AGENT'),
+        reddit=RecordedReddit.from_snapshot(snapshot) if replay_dir else None,
+        snapshot=snapshot
+    )
+    if len(subreddits) > 1:
+        reddit_scraper = MultiSubredditScraper(subreddits=subreddits, **reddit_options)
+    else:
+        reddit_scraper = RedditScraper(subreddit=subreddits[0], **reddit_options)
+    
+    if snapshot:
+        ticker_extractor = TickerExtractor(use_cache=False, snapshot=snapshot)
+    else:
+        ticker_extractor = TickerExtractor(
+            universe=SymbolUniverse(os.getenv('SYMBOL_UNIVERSE_PATH'))
+        )
+    sentiment_analyzer = SentimentAnalyzer(
+        score_cache=ScoreCache(path=get_app_data_dir() / 'score_cache.json'),
+        workers=workers,
+        segmenter=segmenter
+    )
+    
+    return AnalysisComponents(
+        reddit_scraper=reddit_scraper,
+        ticker_extractor=ticker_extractor,
+        sentiment_analyzer=sentiment_analyzer,
+        subreddits=subreddits,
+        checkpoints=None if snapshot else PostCheckpointStore(),
+        log_store=None if replay_dir else get_sentiment_log_store(),
+        history=None if replay_dir else TickerHistoryStore(),
+        snapshot=snapshot
+    )
+
+def run_analysis(components: AnalysisComponents,
+                 progress_callback: Optional[Callable[[dict], None]] = None,
+                 max_comments: int = 0,
+                 cancel_event: Optional[threading.Event] = None,
+                 post_limit: int = POST_LIMIT,
+                 metrics_path: Optional[Union[str, Path]] = None) -> Tuple[List[str], List[str]]:
+    """
+    Run the Reddit sentiment analysis once with already built components.
+    
+    Every progress update carries the run's metrics so far under "metrics"
+    (see RunMetrics.as_dict): wall time per stage and counts of posts,
+    sentences, candidates, validation lookups, cache hits and network
+    requests, bytes and latency.
+    
+    Args:
+        components (AnalysisComponents): Components from build_components
+        progress_callback (Callable, optional): Receives progress update dicts
+        max_comments (int): Comments from the fetched posts to analyze as well (0 = posts only)
+        cancel_event (threading.Event, optional): When set, the run stops at its next
+            post, ticker lookup, Reddit listing page or progress update; nothing is saved
+        post_limit (int): Top daily posts fetched per subreddit (default: POST_LIMIT)
+        metrics_path (str | Path, optional): File the run's metrics are written to when
+            it ends, whatever the outcome; a .prom suffix selects the Prometheus text
+            format, anything else JSON
         
-        if not posts:
-            logger.error("No posts fetched from Reddit")
-            return [], []
-            
-        total_posts = len(posts)
+    Returns:
+        Tuple of the top bullish and top bearish tickers
+    
+    Raises:
+        AnalysisCancelled: If cancel_event was set during the run
+    """
+    metrics = RunMetrics(components.metrics_sources())
+    
+    def report(update: dict):
+        # Every progress update doubles as a cancellation checkpoint
+        if cancel_event is not None and cancel_event.is_set():
+            raise AnalysisCancelled()
         if progress_callback:
-            progress_callback({
+            progress_callback(dict(update, metrics=metrics.as_dict()))
+    
+    try:
+        sentiment_analyzer = components.sentiment_analyzer
+        source_names = ', '.join(f"r/{name}" for name in components.subreddits)
+        
+        # Catch up with symbols added to the universe since the last run
+        with metrics.stage('prepare'):
+            universe = components.ticker_extractor.universe
+            if universe is not None:
+                universe.refresh()
+            if components.checkpoints:
+                components.checkpoints.purge_expired()
+        
+        # Update progress and start streaming Reddit posts
+        report({"step": "fetching_posts", "message": f"Fetching posts from {source_names}...", "progress": 5})
+        logger.info(f"Fetching posts from {source_names}...")
+        posts = components.reddit_scraper.iter_daily_discussion(limit=post_limit, max_comments=max_comments,
+                                                                cancel_event=cancel_event)
+        
+        posts_processed = 0
+        
+        def on_batch(posts_done: int):
+            nonlocal posts_processed
+            posts_processed = posts_done
+            # Update progress for post processing
+            expected = post_limit * len(components.subreddits) + max_comments
+            post_progress = 10 + (70 * min(posts_done / expected, 1))  # Progress from 10% to 80%
+            report({
                 "step": "processing_posts",
-                "message": "Found {} posts to analyze".format(total_posts),
-                "progress": 10
+                "message": "Processed {} of up to {} posts and comments".format(posts_done, expected),
+                "progress": post_progress
             })
         
-        # Process each post
-        all_tickers = set()
-        combined_text = ""
+        # Stream posts -> sentences -> ticker mentions -> scores -> mention table
+        mentions = build_mention_table(
+            posts,
+            components.ticker_extractor,
+            sentiment_analyzer,
+            on_batch=on_batch,
+            checkpoints=components.checkpoints,
+            metrics=metrics,
+            cancel_event=cancel_event
+        )
         
-        for idx, post in enumerate(posts, 1):
-            # Update progress for post processing
-            if progress_callback:
-                post_progress = 10 + (40 * (idx / total_posts))  # Progress from 10% to 50%
-                progress_callback({
-                    "step": "processing_posts",
-                    "message": "Processing post {} of {}".format(idx, total_posts),
-                    "progress": post_progress
-                })
-                
-            # Combine title and body for analysis
-            post_text = f"{post['title']} {post['body']}"
-            combined_text += f" {post_text}"
-            
-            # Extract tickers from post
-            tickers = ticker_extractor.get_valid_tickers(post_text)
-            all_tickers.update(tickers)
+        with metrics.stage('save_score_cache'):
+            sentiment_analyzer.score_cache.save()
+        logger.info(f"Score cache: {sentiment_analyzer.score_cache.stats()}")
+        
+        # Cancelled while the last batch was processed
+        if cancel_event is not None and cancel_event.is_set():
+            raise AnalysisCancelled()
         
-        if not all_tickers:
+        if not posts_processed:
+            logger.error("No posts fetched from Reddit")
+            metrics.finish('succeeded')
+            return [], []
+        
+        if not len(mentions):
             logger.error("No valid tickers found in posts")
+            metrics.finish('succeeded')
             return [], []
         
-        # Update progress and analyze sentiment
-        if progress_callback:
-            progress_callback({
-                "step": "processing_tickers",
-                "message": "Processing {} found tickers...".format(len(all_tickers)),
-                "progress": 60
-            })
-        logger.info("Analyzing sentiment for {} tickers...".format(len(all_tickers)))
-        ticker_sentiments = sentiment_analyzer.analyze_ticker_sentiment(
-            combined_text, 
-            list(all_tickers)
-        )
+        # Per-ticker and per-source mean, upvote-weighted mean, count and time-decayed mean
+        with metrics.stage('aggregate'):
+            aggregates = mentions.aggregate()
+            source_aggregates = mentions.aggregate(by=('source', 'ticker'))
         
         # Update progress for sentiment analysis
-        if progress_callback:
-            progress_callback({
-                "step": "analyzing_sentiment",
-                "message": "Analyzing sentiment...",
-                "progress": 80
-            })
+        report({
+            "step": "analyzing_sentiment",
+            "message": "Ranking {} found tickers...".format(len(aggregates)),
+            "progress": 85
+        })
+        logger.info("Ranking sentiment for {} tickers from {} mentions...".format(len(aggregates), len(mentions)))
             
         # Get top bullish and bearish tickers
-        bullish, bearish = sentiment_analyzer.get_top_sentiments(ticker_sentiments)
+        with metrics.stage('rank'):
+            bullish, bearish = sentiment_analyzer.get_top_sentiments(aggregates['mean'].to_dict())
+            sources = source_aggregates.index.unique(level='source')
+            if len(sources) > 1:
+                for source in sorted(sources):
+                    source_means = source_aggregates.xs(source, level='source')['mean'].to_dict()
+                    source_bullish, source_bearish = sentiment_analyzer.get_top_sentiments(source_means)
+                    logger.info(f"r/{source}: bullish {', '.join(source_bullish)}; bearish {', '.join(source_bearish)}")
         
         # Update progress and save results
-        if progress_callback:
-            progress_callback({
-                "step": "saving_results",
-                "message": "Saving results...",
-                "progress": 95
-            })
-        logger.info("Saving results...")
-        save_results(bullish, bearish)
+        report({
+            "step": "saving_results",
+            "message": "Saving results...",
+            "progress": 95
+        })
+        if components.log_store is None:
+            logger.info("Replay run, not saving results")
+        else:
+            logger.info("Saving results...")
+            with metrics.stage('save_results'):
+                save_results(bullish, bearish, store=components.log_store)
+        if components.history is not None:
+            with metrics.stage('save_history'):
+                save_ticker_history(aggregates, source_aggregates, components.history)
         
+        metrics.finish('succeeded')
         logger.info("Analysis completed successfully")
         logger.info(f"Top Bullish: {', '.join(bullish)}")
         logger.info(f"Top Bearish: {', '.join(bearish)}")
         
         return bullish, bearish
         
+    except AnalysisCancelled:
+        metrics.finish('cancelled')
+        logger.info("Analysis cancelled")
+        raise
     except Exception as e:
+        metrics.finish('failed')
         logger.error(f"Error in main workflow: {str(e)}")
         raise
+    finally:
+        logger.info(f"Run {metrics.status}, stage times: {metrics.summary()}")
+        if metrics_path:
+            metrics.write(metrics_path)
+
+def main(progress_callback: Optional[Callable[[dict], None]] = None,
+         workers: int = 1,
+         max_comments: int = 0,
+         record_dir: Optional[str] = None,
+         replay_dir: Optional[str] = None,
+         subreddits: Optional[List[str]] = None,
+         cancel_event: Optional[threading.Event] = None,
+         metrics_path: Optional[Union[str, Path]] = None,
+         segmenter: str = DEFAULT_SEGMENTER) -> Tuple[List[str], List[str]]:
+    """
+    Main function to orchestrate the Reddit sentiment analysis workflow.
+    
+    Builds the components, runs the analysis once and releases them; see
+    build_components for the record and replay modes. The service module
+    keeps components alive across scheduled runs instead.
+    
+    Args:
+        progress_callback (Callable, optional): Receives progress update dicts
+        workers (int): Processes used for sentiment scoring; 1 scores serially
+        max_comments (int): Comments from the fetched posts to analyze as well (0 = posts only)
+        record_dir (str, optional): Snapshot directory to record responses to
+        replay_dir (str, optional): Snapshot directory to replay responses from
+        subreddits (List[str], optional): Subreddits to analyze together (default: stocks);
+            the top POST_LIMIT posts of each are fetched concurrently
+        cancel_event (threading.Event, optional): When set, the run stops at its next
+            post, ticker lookup, Reddit listing page or progress update; nothing is saved
+        metrics_path (str | Path, optional): File to write the run's metrics to
+            (.prom for the Prometheus text format, otherwise JSON)
+        segmenter (str): Sentence segmenter, 'regex' (built in) or 'punkt' (needs NLTK data)
+    
+    Raises:
+        AnalysisCancelled: If cancel_event was set during the run
+    """
+    components = build_components(
+        workers=workers,
+        record_dir=record_dir,
+        replay_dir=replay_dir,
+        subreddits=subreddits,
+        segmenter=segmenter
+    )
+    try:
+        return run_analysis(
+            components,
+            progress_callback=progress_callback,
+            max_comments=max_comments,
+            cancel_event=cancel_event,
+            metrics_path=metrics_path
+        )
+    finally:
+        components.close()
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options for a headless run."""
+    parser = argparse.ArgumentParser(description="Analyze r/stocks sentiment")
+    parser.add_argument('--workers', type=int, default=1,
+                        help='processes used for sentiment scoring (default: 1)')
+    parser.add_argument('--max-comments', type=int, default=0,
+                        help='comments to analyze in addition to posts (default: 0)')
+    parser.add_argument('--subreddits', nargs='+', metavar='NAME',
+                        help='subreddits to analyze together (default: stocks)')
+    parser.add_argument('--metrics-file', metavar='FILE',
+                        help='write run metrics to FILE (Prometheus text format if it ends in .prom, else JSON)')
+    parser.add_argument('--segmenter', choices=sorted(SEGMENTERS), default=DEFAULT_SEGMENTER,
+                        help=f"sentence segmenter; punkt needs NLTK and its data (default: {DEFAULT_SEGMENTER})")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--record', metavar='DIR', help='record Reddit/Yahoo responses to DIR')
+    mode.add_argument('--replay', metavar='DIR', help='replay Reddit/Yahoo responses from DIR')
+    return parser.parse_args(argv)
 
 if __name__ == "__main__":
+    args = parse_args()
     try:
-        bullish, bearish = main()
+        bullish, bearish = main(
+            workers=args.workers,
+            max_comments=args.max_comments,
+            record_dir=args.record,
+            replay_dir=args.replay,
+            subreddits=args.subreddits,
+            metrics_path=args.metrics_file,
+            segmenter=args.segmenter
+        )
         print(f"\nTop Bullish: {', '.join(bullish)}")
         print(f"Top Bearish: {', '.join(bearish)}")
     except Exception as e:
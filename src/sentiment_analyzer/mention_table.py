@@ -0,0 +1,178 @@
+from array import array
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Columns of MentionTable.frame
+MENTION_COLUMNS = ['ticker', 'post_id', 'sentence_id', 'compound', 'post_score', 'created_utc', 'source']
+
+# Age at which a mention counts half as much in the time-decayed mean
+DEFAULT_HALF_LIFE = 6 * 3600.0
+
+
+def _timestamp(created: Union[datetime, float, None]) -> float:
+    """Unix time of a post's created_utc, which the scraper gives as a datetime."""
+    if isinstance(created, datetime):
+        return created.timestamp()
+    return float(created or 0.0)
+
+
+class MentionTableBuilder:
+    """
+    Collects ticker mentions column by column while the pipeline streams.
+
+    Mention columns are kept in typed arrays and tickers, posts and sources
+    are interned as integer codes, so millions of mentions take a few bytes
+    each and become a DataFrame without per-row conversion.
+    """
+
+    def __init__(self):
+        self._ticker_codes: Dict[str, int] = {}
+        self._source_codes: Dict[str, int] = {}
+        self._post_codes: Dict[str, int] = {}
+        # Per post
+        self._post_scores = array('q')
+        self._post_created = array('d')
+        self._post_sources = array('l')
+        # Per mention
+        self._tickers = array('l')
+        self._posts = array('l')
+        self._sentences = array('l')
+        self._compounds = array('d')
+
+    def __len__(self) -> int:
+        return len(self._compounds)
+
+    def add_post(self,
+                 post_id: str,
+                 post_score: int,
+                 created_utc: Union[datetime, float, None],
+                 source: Optional[str],
+                 mentions: Sequence[Tuple[str, float, int]]):
+        """
+        Add the mentions found in one post; posts without mentions are skipped.
+
+        Args:
+            post_id (str): Post or comment identifier
+            post_score (int): Reddit score (upvotes - downvotes) of the post
+            created_utc (datetime | float): Creation time of the post
+            source (str, optional): Subreddit the post came from
+            mentions (Sequence[Tuple[str, float, int]]): (ticker, sentence score,
+                sentence position) tuples from the pipeline
+        """
+        if not mentions:
+            return
+        post = self._post_codes.get(post_id)
+        if post is None:
+            post = self._post_codes[post_id] = len(self._post_codes)
+            self._post_scores.append(int(post_score or 0))
+            self._post_created.append(_timestamp(created_utc))
+            self._post_sources.append(self._source_codes.setdefault(source or '', len(self._source_codes)))
+
+        tickers, compounds, sentences = zip(*mentions)
+        codes = self._ticker_codes
+        self._tickers.extend(codes.setdefault(ticker, len(codes)) for ticker in tickers)
+        self._compounds.extend(compounds)
+        self._sentences.extend(sentences)
+        self._posts.extend([post] * len(mentions))
+
+    def build(self) -> 'MentionTable':
+        """Assemble the collected columns into a MentionTable."""
+        # np.array copies each typed array through the buffer protocol, without per-item work
+        posts = np.array(self._posts, dtype=np.int64)
+        frame = pd.DataFrame({
+            'ticker': pd.Categorical.from_codes(np.array(self._tickers), categories=list(self._ticker_codes)),
+            'post_id': pd.Categorical.from_codes(posts, categories=list(self._post_codes)),
+            'sentence_id': np.array(self._sentences, dtype=np.int32),
+            'compound': np.array(self._compounds, dtype=np.float64),
+            'post_score': np.array(self._post_scores, dtype=np.int64)[posts],
+            'created_utc': np.array(self._post_created, dtype=np.float64)[posts],
+            'source': pd.Categorical.from_codes(np.array(self._post_sources)[posts],
+                                                categories=list(self._source_codes)),
+        }, columns=MENTION_COLUMNS)
+        return MentionTable(frame)
+
+
+class MentionTable:
+    """
+    Columnar table of ticker mentions, one row per (ticker, sentence) pair.
+
+    Columns are ticker, post_id, sentence_id (position of the sentence in
+    its post), compound (VADER score of the sentence), post_score,
+    created_utc (Unix time) and source. Aggregates are computed with
+    vectorized groupby operations.
+    """
+
+    def __init__(self, frame: Optional[pd.DataFrame] = None):
+        """
+        Wrap a mention DataFrame.
+
+        Args:
+            frame (pd.DataFrame, optional): Mentions with MENTION_COLUMNS (default: empty)
+        """
+        self.frame = frame if frame is not None else MentionTableBuilder().build().frame
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @staticmethod
+    def upvote_weights(post_scores: np.ndarray) -> np.ndarray:
+        """
+        Weight of a mention by the score of its post: 1 + ln(1 + score).
+
+        Logarithmic, so a viral post counts more without drowning out the
+        rest; posts at or below zero get the base weight of 1.
+        """
+        return 1.0 + np.log1p(np.clip(post_scores, 0, None))
+
+    @staticmethod
+    def decay_weights(created_utc: np.ndarray, now: float, half_life: float) -> np.ndarray:
+        """Weight of a mention by its age: halves every half_life seconds."""
+        return np.exp2(-np.clip(now - created_utc, 0, None) / half_life)
+
+    def aggregate(self,
+                  by: Iterable[str] = ('ticker',),
+                  half_life: float = DEFAULT_HALF_LIFE,
+                  now: Optional[float] = None) -> pd.DataFrame:
+        """
+        Aggregate sentence scores per group of mentions.
+
+        Args:
+            by (Iterable[str]): Columns to group by, e.g. ('source', 'ticker')
+            half_life (float): Half-life in seconds of the time-decayed mean
+            now (float, optional): Unix time the decay is measured from
+                (default: the newest mention, so replays aggregate identically)
+
+        Returns:
+            pd.DataFrame: Indexed by the group columns, with count (mentions),
+                mean, weighted_mean (upvote-weighted) and decayed_mean (time-decayed)
+        """
+        by = list(by)
+        frame = self.frame
+        compound = frame['compound'].to_numpy()
+        if now is None:
+            now = float(frame['created_utc'].max()) if len(frame) else 0.0
+        upvotes = self.upvote_weights(frame['post_score'].to_numpy())
+        decay = self.decay_weights(frame['created_utc'].to_numpy(), now, half_life)
+
+        work = frame[by].assign(
+            compound=compound,
+            upvotes=upvotes,
+            upvoted=upvotes * compound,
+            decay=decay,
+            decayed=decay * compound
+        )
+        grouped = work.groupby(by, observed=True, sort=True)
+        sums = grouped[['compound', 'upvotes', 'upvoted', 'decay', 'decayed']].sum()
+        counts = grouped.size()
+        result = pd.DataFrame({
+            'count': counts,
+            'mean': sums['compound'] / counts,
+            'weighted_mean': sums['upvoted'] / sums['upvotes'],
+            'decayed_mean': sums['decayed'] / sums['decay']
+        })
+        # Mentions so old that every decay weight underflows fall back to the plain mean
+        result['decayed_mean'] = result['decayed_mean'].fillna(result['mean'])
+        return result
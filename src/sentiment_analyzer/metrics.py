@@ -0,0 +1,184 @@
+import json
+import os
+import re
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+# Prefix of every metric in the Prometheus textfile
+PROMETHEUS_PREFIX = 'bullbearradar'
+
+logger = logging.getLogger(__name__)
+
+
+class Counters:
+    """Thread-safe monotonic counters kept by a long-lived component."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: Dict[str, float] = {}
+
+    def add(self, name: str, value: float = 1):
+        """Increase a counter, creating it at zero if needed."""
+        with self._lock:
+            self._values[name] = self._values.get(name, 0) + value
+
+    def snapshot(self) -> Dict[str, float]:
+        """Get the current value of every counter."""
+        with self._lock:
+            return dict(self._values)
+
+
+class RunMetrics:
+    """
+    Stage timings and counts of one analysis run.
+
+    Stages are timed as wall time on the thread running the pipeline, so
+    they add up to (at most) the run's duration; time spent waiting on the
+    Reddit post stream is its own stage. Counters of long-lived components
+    (sources) are reported as their increase since the run started.
+    """
+
+    def __init__(self, sources: Optional[List[Callable[[], Dict[str, float]]]] = None):
+        """
+        Start measuring a run.
+
+        Args:
+            sources (List[Callable], optional): Functions returning the current
+                counters of a component, such as Counters.snapshot
+        """
+        self.started = time.time()
+        self.status = 'running'
+        self.stages: Dict[str, float] = {}
+        self.counts: Dict[str, float] = {}
+        self._sources = sources or []
+        self._baselines = [read() for read in self._sources]
+        self._clock = time.perf_counter()
+
+    def add_time(self, stage: str, seconds: float):
+        """Add wall time to a stage."""
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as part of a stage."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - started)
+
+    def timed_iter(self, stage: str, iterable: Iterable) -> Iterator:
+        """Yield from an iterable, timing each wait for its next item as part of a stage."""
+        iterator = iter(iterable)
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.add_time(stage, time.perf_counter() - started)
+            yield item
+
+    def count(self, name: str, value: float = 1):
+        """Increase a run counter."""
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    def counters(self) -> Dict[str, float]:
+        """Get the run counters together with the component counter increases."""
+        merged = dict(self.counts)
+        for read, baseline in zip(self._sources, self._baselines):
+            for name, value in read().items():
+                merged[name] = merged.get(name, 0) + value - baseline.get(name, 0)
+        return merged
+
+    def finish(self, status: str):
+        """Record how the run ended (succeeded, cancelled or failed)."""
+        self.status = status
+
+    def as_dict(self) -> Dict:
+        """
+        Get the metrics as plain data, as included in progress updates.
+
+        Returns:
+            Dict with status, started (Unix time), duration_seconds,
+            stages (seconds per stage) and counters
+        """
+        return {
+            'status': self.status,
+            'started': self.started,
+            'duration_seconds': time.perf_counter() - self._clock,
+            'stages': dict(self.stages),
+            'counters': self.counters()
+        }
+
+    def write(self, path: Union[str, Path]):
+        """
+        Write the metrics to a file, replacing it atomically.
+
+        Files ending in .prom are written in the Prometheus text format
+        (for the node_exporter textfile collector); anything else as JSON.
+
+        Args:
+            path (str | Path): Metrics file
+        """
+        path = Path(path)
+        data = self.as_dict()
+        try:
+            tmp_path = path.with_suffix(path.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                if path.suffix == '.prom':
+                    f.write(to_prometheus(data))
+                else:
+                    json.dump(data, f, indent=2)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.error(f"Error writing metrics to {path}: {str(e)}")
+
+    def summary(self) -> str:
+        """One-line summary of the slowest stages, for logging."""
+        stages = sorted(self.stages.items(), key=lambda item: item[1], reverse=True)
+        return ', '.join(f"{name} {seconds:.2f}s" for name, seconds in stages)
+
+
+def _metric_name(name: str) -> str:
+    """Turn a counter name into a valid Prometheus metric name."""
+    return re.sub(r'[^a-zA-Z0-9_]', '_', name)
+
+
+def to_prometheus(data: Dict) -> str:
+    """
+    Render RunMetrics.as_dict() output in the Prometheus text exposition format.
+
+    Every value describes the last run, so all metrics are gauges.
+
+    Args:
+        data (Dict): Metrics of a run
+
+    Returns:
+        str: Text ready to be scraped by the node_exporter textfile collector
+    """
+    lines = []
+
+    def gauge(name: str, help_text: str, samples: List[tuple]):
+        full_name = f"{PROMETHEUS_PREFIX}_{name}"
+        lines.append(f"# HELP {full_name} {help_text}")
+        lines.append(f"# TYPE {full_name} gauge")
+        for labels, value in samples:
+            lines.append(f"{full_name}{labels} {value}")
+
+    gauge('last_run_timestamp_seconds', 'Unix time the last analysis run started.',
+          [('', data['started'])])
+    gauge('last_run_duration_seconds', 'Wall time of the last analysis run.',
+          [('', data['duration_seconds'])])
+    gauge('last_run_success', 'Whether the last analysis run succeeded.',
+          [('', 1 if data['status'] == 'succeeded' else 0)])
+    gauge('last_run_stage_seconds', 'Wall time of each stage of the last analysis run.',
+          [(f'{{stage="{stage}"}}', seconds) for stage, seconds in sorted(data['stages'].items())])
+    for name, value in sorted(data['counters'].items()):
+        gauge(f"last_run_{_metric_name(name)}", f"Value of {name} in the last analysis run.", [('', value)])
+    return '\n'.join(lines) + '\n'
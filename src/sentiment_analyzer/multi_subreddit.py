@@ -0,0 +1,180 @@
+import queue
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Set
+
+from ..recording import Snapshot
+from .metrics import Counters
+from .post_checkpoint import content_hash
+from .rate_limiter import RateLimiter
+from .reddit_scraper import RedditScraper
+
+DEFAULT_SUBREDDITS = ['stocks', 'investing', 'wallstreetbets', 'options', 'StockMarket']
+
+# Reddit allows 100 OAuth requests per minute per client; stay a little below
+DEFAULT_CALLS_PER_SECOND = 90 / 60
+
+
+class MultiSubredditScraper:
+    """Scrapes several subreddits concurrently under one shared API rate budget."""
+
+    def __init__(self,
+                 client_id: str,
+                 client_secret: str,
+                 user_agent: str,
+                 subreddits: Optional[List[str]] = None,
+                 reddit=None,
+                 snapshot: Optional[Snapshot] = None,
+                 calls_per_second: Optional[float] = DEFAULT_CALLS_PER_SECOND,
+                 source_calls_per_second: Optional[float] = None):
+        """
+        Initialize one RedditScraper per subreddit.
+
+        praw.Reddit is not thread-safe, so each subreddit gets its own client
+        with the same credentials; only a stand-in client is shared.
+
+        Args:
+            client_id (str): Reddit API client ID
+            client_secret (str): Reddit API client secret
+            user_agent (str): Unique user agent string for the bot
+            subreddits (List[str], optional): Subreddits to scrape (default: DEFAULT_SUBREDDITS)
+            reddit (optional): Stand-in client shared by every subreddit instead of praw.Reddit
+            snapshot (Snapshot, optional): Snapshot to record responses to
+            calls_per_second (float, optional): API requests per second across all sources
+            source_calls_per_second (float, optional): Additional cap per subreddit
+        """
+        self.logger = logging.getLogger(__name__)
+        self.subreddits = list(subreddits or DEFAULT_SUBREDDITS)
+        self.rate_limiter = RateLimiter(calls_per_second)
+        # Request counters of all sources
+        self.counters = Counters()
+
+        self.scrapers = [
+            RedditScraper(client_id, client_secret, user_agent, reddit=reddit,
+                          snapshot=snapshot, subreddit=name,
+                          rate_limiter=self._source_limiter(source_calls_per_second),
+                          counters=self.counters)
+            for name in self.subreddits
+        ]
+
+    def _source_limiter(self, calls_per_second: Optional[float]) -> RateLimiter:
+        """Build the limiter of one source: its own cap, then the shared budget."""
+        if not calls_per_second:
+            return self.rate_limiter
+        return _ChainedRateLimiter(RateLimiter(calls_per_second), self.rate_limiter)
+
+    @staticmethod
+    def _dedup_keys(post: Dict) -> List[str]:
+        """
+        Keys identifying a post across subreddits: original post ID and, for
+        text posts, content. Link and image posts have no body, and a title
+        alone (e.g. "NVDA earnings") does not make two posts the same.
+        """
+        keys = [post.get('crosspost_parent') or f"t3_{post['id']}"]
+        if post['body'].strip():
+            keys.append(content_hash(f"{post['title']}\n{post['body']}"))
+        return keys
+
+    def iter_top_daily_posts(self, limit: int = 50, cancel_event: Optional[threading.Event] = None) -> Iterator[Dict]:
+        """
+        Stream top daily posts from every subreddit as they arrive.
+
+        Listings are fetched concurrently; cross-posts and identical reposts
+        are yielded once, tagged with the subreddit they were first seen in.
+
+        Args:
+            limit (int): Number of posts to fetch per subreddit (default: 50)
+            cancel_event (threading.Event, optional): When set, every listing stops
+                after its current post and the stream ends
+
+        Yields:
+            Dict: Post data as from RedditScraper.get_top_daily_posts, with source set
+        """
+        done = object()
+        posts: queue.Queue = queue.Queue(maxsize=256)
+        stop = threading.Event()
+
+        def cancelled() -> bool:
+            return cancel_event is not None and cancel_event.is_set()
+
+        def fetch(scraper: RedditScraper):
+            try:
+                for post in scraper.iter_top_daily_posts(limit=limit, cancel_event=cancel_event):
+                    if stop.is_set():
+                        break
+                    posts.put(post)
+            finally:
+                posts.put(done)
+
+        seen: Set[str] = set()
+        duplicates = 0
+        with ThreadPoolExecutor(max_workers=len(self.scrapers)) as executor:
+            for scraper in self.scrapers:
+                executor.submit(fetch, scraper)
+            try:
+                remaining = len(self.scrapers)
+                while remaining and not cancelled():
+                    try:
+                        post = posts.get(timeout=0.1)
+                    except queue.Empty:
+                        continue
+                    if post is done:
+                        remaining -= 1
+                        continue
+                    keys = self._dedup_keys(post)
+                    if any(key in seen for key in keys):
+                        duplicates += 1
+                        continue
+                    seen.update(keys)
+                    yield post
+            finally:
+                # Let blocked fetchers finish if the consumer stopped early
+                stop.set()
+                while remaining:
+                    if posts.get() is done:
+                        remaining -= 1
+
+        self.logger.info(f"Skipped {duplicates} cross-posted or duplicate posts")
+
+    def iter_daily_discussion(self,
+                              limit: int = 50,
+                              max_comments: int = 0,
+                              cancel_event: Optional[threading.Event] = None,
+                              **comment_options) -> Iterator[Dict]:
+        """
+        Stream top daily posts from every subreddit, then comments from those posts.
+
+        Args:
+            limit (int): Number of posts to fetch per subreddit (default: 50)
+            max_comments (int): Total comments to include (default: 0, posts only)
+            cancel_event (threading.Event, optional): When set, fetching stops and the stream ends
+            **comment_options: Further options for RedditScraper.iter_comments
+
+        Yields:
+            Dict: Posts, then comments, each tagged with its source subreddit
+        """
+        sources = {}
+        for post in self.iter_top_daily_posts(limit=limit, cancel_event=cancel_event):
+            sources[post['id']] = post['source']
+            yield post
+        if max_comments > 0:
+            for comment in self.scrapers[0].iter_comments(list(sources), max_comments=max_comments,
+                                                          cancel_event=cancel_event, **comment_options):
+                comment['source'] = sources.get(comment['submission_id'], comment['source'])
+                yield comment
+
+    def __str__(self) -> str:
+        """Return string representation of the scraper."""
+        return f"MultiSubredditScraper(subreddits={', '.join('r/' + name for name in self.subreddits)})"
+
+
+class _ChainedRateLimiter:
+    """Acquires several rate limiters in turn."""
+
+    def __init__(self, *limiters: RateLimiter):
+        self.limiters = limiters
+
+    def acquire(self):
+        for limiter in self.limiters:
+            limiter.acquire()
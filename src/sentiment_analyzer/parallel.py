@@ -0,0 +1,105 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Sequence
+import logging
+
+from .segmenter import RegexSegmenter
+
+# Per-process state, created once by _init_worker in each pool process
+_worker_vader = None
+_worker_tokenizer: Optional[Callable[[str], List[str]]] = None
+
+
+def _init_worker(tokenizer: Callable[[str], List[str]]):
+    """Create the VADER analyzer and install the sentence tokenizer for this worker process."""
+    global _worker_vader, _worker_tokenizer
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+    _worker_vader = SentimentIntensityAnalyzer()
+    _worker_tokenizer = tokenizer
+
+
+def _score_chunk(sentences: List[str]) -> List[float]:
+    """Score a chunk of sentences, matching SentimentAnalyzer's serial fallback of 0.0."""
+    scores = []
+    for sentence in sentences:
+        try:
+            scores.append(_worker_vader.polarity_scores(sentence)['compound'])
+        except Exception:
+            scores.append(0.0)
+    return scores
+
+
+def _tokenize_chunk(texts: List[str]) -> List[List[str]]:
+    """Split a chunk of texts into sentences."""
+    return [_worker_tokenizer(text) for text in texts]
+
+
+def _chunked(items: Sequence, size: int) -> List[Sequence]:
+    """Split a sequence into consecutive chunks of at most size items."""
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+class ParallelScorer:
+    """Shards sentence scoring and tokenization across a pool of processes."""
+
+    def __init__(self,
+                 workers: int,
+                 chunk_size: int = 256,
+                 tokenizer: Optional[Callable[[str], List[str]]] = None):
+        """
+        Initialize the scorer. The process pool is started on first use.
+
+        Args:
+            workers (int): Number of worker processes
+            chunk_size (int): Items sent to a worker per task, large enough to
+                amortize inter-process communication
+            tokenizer (Callable, optional): Picklable sentence segmenter used by
+                tokenize (default: the built-in regex segmenter)
+        """
+        self.workers = max(1, workers)
+        self.chunk_size = max(1, chunk_size)
+        self.tokenizer = tokenizer if tokenizer is not None else RegexSegmenter()
+        self.logger = logging.getLogger(__name__)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self.logger.debug(f"Starting sentiment process pool with {self.workers} workers")
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                 initargs=(self.tokenizer,))
+        return self._executor
+
+    def score(self, sentences: List[str]) -> List[float]:
+        """
+        Score sentences on the process pool.
+
+        Args:
+            sentences (List[str]): Sentences to score
+
+        Returns:
+            List[float]: Compound scores, in input order
+        """
+        chunks = _chunked(sentences, self.chunk_size)
+        results = self._get_executor().map(_score_chunk, chunks)
+        return [score for chunk in results for score in chunk]
+
+    def tokenize(self, texts: List[str]) -> List[List[str]]:
+        """
+        Split texts into sentences on the process pool.
+
+        Args:
+            texts (List[str]): Texts to split
+
+        Returns:
+            List[List[str]]: Sentences of each text, in input order
+        """
+        # Texts are much longer than sentences, so use smaller chunks
+        chunks = _chunked(texts, max(1, self.chunk_size // 16))
+        results = self._get_executor().map(_tokenize_chunk, chunks)
+        return [sentences for chunk in results for sentences in chunk]
+
+    def close(self):
+        """Shut down the process pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -0,0 +1,238 @@
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import logging
+import threading
+
+from .cancellation import AnalysisCancelled
+from .metrics import RunMetrics
+from .mention_table import MentionTable, MentionTableBuilder
+from .post_checkpoint import Mention, PostCheckpointStore, content_hash
+from .sentiment_analyzer import SentimentAnalyzer
+from .ticker_matcher import TickerMatcher
+from .ticker_utils import TickerExtractor
+
+logger = logging.getLogger(__name__)
+
+# Posts processed together; bounds memory while keeping validation and scoring batched
+DEFAULT_BATCH_SIZE = 50
+
+
+def iter_batches(items: Iterable, size: int) -> Iterator[List]:
+    """Yield consecutive lists of at most size items from an iterable."""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def iter_until_cancelled(items: Iterable, cancel_event: Optional[threading.Event]) -> Iterator:
+    """Yield items, raising AnalysisCancelled before the next one once cancel_event is set."""
+    for item in items:
+        if cancel_event is not None and cancel_event.is_set():
+            raise AnalysisCancelled()
+        yield item
+
+
+def post_text(post: Dict) -> str:
+    """Combine a post's title and body into the text that is analyzed (comments have no title)."""
+    return f"{post.get('title', '')} {post['body']}"
+
+
+def checkpoint_key(post: Dict) -> Optional[str]:
+    """Build the checkpoint key of a post or comment (Reddit fullname), if it has an ID."""
+    if 'id' not in post:
+        return None
+    prefix = 't1' if 'submission_id' in post else 't3'
+    return f"{prefix}_{post['id']}"
+
+
+def iter_post_mentions(posts: Iterable[Dict],
+                       ticker_extractor: TickerExtractor,
+                       sentiment_analyzer: SentimentAnalyzer,
+                       batch_size: int = DEFAULT_BATCH_SIZE,
+                       on_batch: Optional[Callable[[int], None]] = None,
+                       checkpoints: Optional[PostCheckpointStore] = None,
+                       metrics: Optional[RunMetrics] = None,
+                       cancel_event: Optional[threading.Event] = None
+                       ) -> Iterator[Tuple[Dict, List[Mention]]]:
+    """
+    Stream each post with the ticker mentions found in it.
+
+    A mention is a (ticker, sentence score, sentence position) tuple; a
+    sentence mentioning several tickers gives one mention per ticker.
+
+    Posts are consumed in batches: the batch's ticker candidates are
+    validated (each distinct symbol once per run), each post is split into
+    sentences, and every sentence mentioning a validated ticker is scored
+    once. Only the current batch is held in memory, except when the
+    sentiment analyzer has a process pool: then the sentences of several
+    batches are collected until there are enough to be worth sharding
+    across the workers, and scored together.
+
+    With a checkpoint store, posts whose content, edit time and sentence
+    segmenter match their checkpoint reuse the stored mentions; only new or
+    edited posts, or posts checkpointed with another segmenter, are
+    analyzed, and their mentions are checkpointed. Mentions are yielded in
+    post order either way, so aggregates equal those of a full run.
+
+    With run metrics, the time spent waiting for posts and in each stage is
+    recorded along with the posts, sentences, candidates and mentions seen.
+
+    With a cancel event, the run is checked before every post and after
+    ticker validation, which also stops early when the event is set.
+
+    Args:
+        posts (Iterable[Dict]): Posts with title and body, e.g. from RedditScraper.iter_daily_discussion
+        ticker_extractor (TickerExtractor): Extracts and validates ticker candidates
+        sentiment_analyzer (SentimentAnalyzer): Splits and scores sentences
+        batch_size (int): Posts processed per batch
+        on_batch (Callable, optional): Called with the number of posts processed so far
+        checkpoints (PostCheckpointStore, optional): Per-post results from earlier runs
+        metrics (RunMetrics, optional): Run metrics to record stage timings and counts in
+        cancel_event (threading.Event, optional): Stops the run when set
+
+    Yields:
+        Tuple[Dict, List[Mention]]: A post and its ticker mentions
+
+    Raises:
+        AnalysisCancelled: If cancel_event was set
+    """
+    validity: Dict[str, bool] = {}
+    matcher = TickerMatcher()
+    metrics = metrics if metrics is not None else RunMetrics()
+    posts_done = 0
+
+    # Batches waiting to be scored: posts, checkpoint keys, digests, analyzed
+    # positions and mentions, plus the relevant sentences of all of them
+    min_sentences = sentiment_analyzer.PARALLEL_MIN_SENTENCES if sentiment_analyzer.parallel else 0
+    max_posts = max(batch_size, min_sentences)
+    waiting: List[Tuple[List[Dict], List[Optional[str]], List[str], List[int], List[List[Mention]]]] = []
+    waiting_posts = 0
+    relevant_sentences: List[str] = []
+    relevant_mentions: List[Tuple[List[Mention], int, Iterable[str]]] = []
+
+    def score_waiting() -> Iterator[Tuple[Dict, List[Mention]]]:
+        """Score the waiting sentences together, then checkpoint and yield the waiting posts."""
+        nonlocal posts_done
+        with metrics.stage('score_sentences'):
+            scores = sentiment_analyzer.score_batch(relevant_sentences)
+            for (mentions, position, mentioned), score in zip(relevant_mentions, scores):
+                mentions.extend((ticker, score, position) for ticker in sorted(mentioned))
+        metrics.count('sentences_scored', len(relevant_sentences))
+
+        for batch, keys, digests, pending, post_mentions in waiting:
+            if checkpoints:
+                with metrics.stage('checkpoints'):
+                    checkpoints.put_many(
+                        (keys[idx], batch[idx].get('edited', 0), digests[idx], post_mentions[idx])
+                        for idx in pending if keys[idx]
+                    )
+            metrics.count('mentions', sum(len(mentions) for mentions in post_mentions))
+
+            yield from zip(batch, post_mentions)
+
+            posts_done += len(batch)
+            if on_batch:
+                on_batch(posts_done)
+
+    posts = iter_until_cancelled(metrics.timed_iter('fetch_posts', posts), cancel_event)
+    for batch in iter_batches(posts, batch_size):
+        texts = [post_text(post) for post in batch]
+        keys = [checkpoint_key(post) for post in batch]
+        digests = [content_hash(text, sentiment_analyzer.segmenter_name) for text in texts]
+        post_mentions: List[Optional[List[Mention]]] = [None] * len(batch)
+
+        # Reuse checkpoints of unchanged posts
+        if checkpoints:
+            with metrics.stage('checkpoints'):
+                stored = checkpoints.get_many(key for key in keys if key)
+                for idx, (post, key, digest) in enumerate(zip(batch, keys, digests)):
+                    checkpoint = stored.get(key)
+                    if (checkpoint and checkpoint.content_hash == digest
+                            and checkpoint.edited == post.get('edited', 0)):
+                        post_mentions[idx] = checkpoint.mentions
+        pending = [idx for idx, mentions in enumerate(post_mentions) if mentions is None]
+        pending_texts = [texts[idx] for idx in pending]
+
+        # Validate candidates not seen earlier in this run
+        with metrics.stage('extract_candidates'):
+            candidates = [ticker_extractor.extract_potential_tickers(text) for text in pending_texts]
+            unseen = set().union(*candidates) - validity.keys()
+        if unseen:
+            with metrics.stage('validate_tickers'):
+                results = ticker_extractor.validate_tickers(unseen, cancel_event=cancel_event)
+                if cancel_event is not None and cancel_event.is_set():
+                    raise AnalysisCancelled()
+                validity.update(results)
+                matcher.add(ticker for ticker, is_valid in results.items() if is_valid)
+
+        # Find the sentences of each post that mention a valid ticker. A post
+        # can only mention tickers among its own candidates, so one matcher
+        # over every valid ticker seen so far serves all posts.
+        with metrics.stage('split_sentences'):
+            split_texts = sentiment_analyzer.split_sentences(pending_texts)
+        with metrics.stage('match_tickers'):
+            for idx, text_candidates, sentences in zip(pending, candidates, split_texts):
+                post_mentions[idx] = []
+                if not any(validity.get(ticker) for ticker in text_candidates):
+                    continue
+                for position, mentioned in sentiment_analyzer.build_sentence_index(sentences, matcher).items():
+                    relevant_sentences.append(sentences[position])
+                    relevant_mentions.append((post_mentions[idx], position, mentioned))
+
+        metrics.count('posts', len(batch))
+        metrics.count('posts_from_checkpoints', len(batch) - len(pending))
+        metrics.count('sentences', sum(len(sentences) for sentences in split_texts))
+        metrics.count('candidates', sum(len(text_candidates) for text_candidates in candidates))
+        metrics.count('candidates_validated', len(unseen))
+
+        # Score the collected sentences together and attribute them to their tickers
+        waiting.append((batch, keys, digests, pending, post_mentions))
+        waiting_posts += len(batch)
+        if len(relevant_sentences) >= min_sentences or waiting_posts >= max_posts:
+            yield from score_waiting()
+            waiting.clear()
+            waiting_posts = 0
+            relevant_sentences.clear()
+            relevant_mentions.clear()
+
+    if waiting:
+        yield from score_waiting()
+
+
+def build_mention_table(posts: Iterable[Dict],
+                        ticker_extractor: TickerExtractor,
+                        sentiment_analyzer: SentimentAnalyzer,
+                        batch_size: int = DEFAULT_BATCH_SIZE,
+                        on_batch: Optional[Callable[[int], None]] = None,
+                        checkpoints: Optional[PostCheckpointStore] = None,
+                        metrics: Optional[RunMetrics] = None,
+                        cancel_event: Optional[threading.Event] = None) -> MentionTable:
+    """
+    Run the streaming pipeline into a columnar table of every ticker mention.
+
+    Each mention is stored with its post's ID, score, creation time and
+    source, so upvote-weighted and time-decayed aggregates can be computed
+    from the table afterwards.
+
+    Takes the same arguments as iter_post_mentions.
+
+    Returns:
+        MentionTable: One row per (ticker, sentence) mention
+    """
+    builder = MentionTableBuilder()
+    for number, (post, mentions) in enumerate(iter_post_mentions(posts, ticker_extractor, sentiment_analyzer,
+                                                                 batch_size, on_batch, checkpoints, metrics,
+                                                                 cancel_event)):
+        builder.add_post(
+            checkpoint_key(post) or f"#{number}",
+            post.get('score', 0),
+            post.get('created_utc'),
+            post.get('source'),
+            mentions
+        )
+    table = builder.build()
+    logger.debug(f"Built mention table with {len(table)} mentions")
+    return table
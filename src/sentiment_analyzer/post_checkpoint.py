@@ -0,0 +1,153 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from ..app_paths import get_app_data_dir
+
+# Posts older than this are re-analyzed, so changes in ticker validation catch up
+DEFAULT_MAX_AGE = 7 * 24 * 3600
+
+# One ticker mention: (ticker, sentence score, position of the sentence in the post)
+Mention = Tuple[str, float, int]
+
+
+def content_hash(text: str, segmenter: Optional[str] = None) -> str:
+    """
+    Hash the analyzed text of a post.
+
+    Args:
+        text (str): Text of the post
+        segmenter (str, optional): Name of the sentence segmenter the post is
+            analyzed with, so checkpoints made with another segmenter do not match
+
+    Returns:
+        str: Hex digest
+    """
+    if segmenter:
+        text = f"{segmenter}\0{text}"
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class PostCheckpoint:
+    """Cached analysis of one post or comment."""
+    key: str
+    edited: float
+    content_hash: str
+    mentions: List[Mention]
+    processed_at: float
+
+
+class PostCheckpointStore:
+    """SQLite store of per-post ticker mentions, keyed by Reddit ID."""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, max_age: float = DEFAULT_MAX_AGE):
+        """
+        Open (or create) the checkpoint store.
+
+        Args:
+            path (str | Path, optional): Database file (default: post_checkpoints.db in the app data dir)
+            max_age (float): Seconds after which a checkpoint is ignored and the post re-analyzed
+        """
+        self.path = Path(path) if path else get_app_data_dir() / "post_checkpoints.db"
+        self.max_age = max_age
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS post_checkpoint (
+                key TEXT PRIMARY KEY,
+                edited REAL NOT NULL,
+                content_hash TEXT NOT NULL,
+                mentions TEXT NOT NULL,
+                processed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, PostCheckpoint]:
+        """
+        Look up fresh checkpoints.
+
+        Args:
+            keys (Iterable[str]): Post keys
+
+        Returns:
+            Dict[str, PostCheckpoint]: Checkpoints younger than max_age, by key;
+                checkpoints written before mentions had sentence positions are left out
+        """
+        keys = list(set(keys))
+        found = {}
+        oldest = time.time() - self.max_age
+        try:
+            with self._lock:
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._conn.execute(
+                        "SELECT key, edited, content_hash, mentions, processed_at FROM post_checkpoint "
+                        f"WHERE key IN ({placeholders}) AND processed_at >= ?",
+                        chunk + [oldest]
+                    ).fetchall()
+                    for key, edited, digest, mentions, processed_at in rows:
+                        mentions = [tuple(mention) for mention in json.loads(mentions)]
+                        if any(len(mention) != 3 for mention in mentions):
+                            continue
+                        found[key] = PostCheckpoint(key, edited, digest, mentions, processed_at)
+        except sqlite3.Error as e:
+            self.logger.error(f"Error reading post checkpoints: {str(e)}")
+        return found
+
+    def put_many(self, checkpoints: Iterable[Tuple[str, float, str, List[Mention]]]):
+        """
+        Store checkpoints in one transaction.
+
+        Args:
+            checkpoints (Iterable[Tuple]): (key, edited, content_hash, mentions) tuples
+        """
+        now = time.time()
+        rows = [
+            (key, edited, digest, json.dumps(mentions), now)
+            for key, edited, digest, mentions in checkpoints
+        ]
+        if not rows:
+            return
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO post_checkpoint "
+                    "(key, edited, content_hash, mentions, processed_at) VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            self.logger.error(f"Error writing post checkpoints: {str(e)}")
+
+    def purge_expired(self) -> int:
+        """
+        Delete checkpoints older than max_age.
+
+        Returns:
+            int: Number of deleted rows
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM post_checkpoint WHERE processed_at < ?",
+                (time.time() - self.max_age,)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,39 @@
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls to at most a given rate."""
+
+    def __init__(self, calls_per_second: Optional[float] = None):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            calls_per_second (float, optional): Maximum call rate; None or 0 disables limiting
+        """
+        self.interval = 1.0 / calls_per_second if calls_per_second else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self):
+        """Block until the caller may make its next call."""
+        if not self.interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
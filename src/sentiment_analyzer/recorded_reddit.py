@@ -0,0 +1,195 @@
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+from ..recording import Snapshot, REDDIT_COMMENTS, REDDIT_LISTING
+
+logger = logging.getLogger(__name__)
+
+
+def _children(listing) -> List[Dict]:
+    """Get the things in a Reddit Listing (or a bare list of things)."""
+    if isinstance(listing, dict):
+        return listing.get('data', {}).get('children', [])
+    return listing or []
+
+
+class RecordedThing:
+    """Read-only view of a recorded Reddit object, exposing its JSON fields as attributes."""
+
+    def __init__(self, data: Dict):
+        self._data = data
+
+    def __getattr__(self, name: str):
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self._data.get('id')!r})"
+
+
+class RecordedMoreComments(RecordedThing):
+    """A "load more comments" stub. It has no body, like praw's MoreComments."""
+
+
+class RecordedComment(RecordedThing):
+    """A recorded comment with its replies."""
+
+    @property
+    def replies(self) -> "RecordedCommentForest":
+        replies = self._data.get('replies')
+        return RecordedCommentForest(_children(replies) if replies else [])
+
+
+class RecordedCommentForest:
+    """Stand-in for praw's CommentForest built from recorded comment things."""
+
+    def __init__(self, things: List[Dict]):
+        self._items = [
+            RecordedComment(thing['data']) if thing.get('kind') == 't1' else RecordedMoreComments(thing.get('data', {}))
+            for thing in things
+            if thing.get('kind') in ('t1', 'more')
+        ]
+
+    def __iter__(self) -> Iterator[RecordedThing]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def replace_more(self, limit: Optional[int] = 32, threshold: int = 0) -> List[RecordedMoreComments]:
+        """
+        Mimic praw's replace_more.
+
+        Recordings already contain every comment that was loaded when they
+        were made, so stubs cannot be expanded offline; they are removed
+        from the top level just as praw removes the stubs it does not expand.
+
+        Returns:
+            List[RecordedMoreComments]: The removed stubs
+        """
+        stubs = [item for item in self._items if isinstance(item, RecordedMoreComments)]
+        self._items = [item for item in self._items if not isinstance(item, RecordedMoreComments)]
+        return stubs
+
+
+class RecordedSubmission(RecordedThing):
+    """A recorded submission whose comments are loaded on first access."""
+
+    def __init__(self, data: Dict, reddit: "RecordedReddit"):
+        super().__init__(data)
+        self._reddit = reddit
+        self._comments: Optional[RecordedCommentForest] = None
+
+    @property
+    def comments(self) -> RecordedCommentForest:
+        if self._comments is None:
+            self._comments = RecordedCommentForest(self._reddit.comment_things(self._data['id']))
+        return self._comments
+
+
+class RecordedSubreddit:
+    """Stand-in for a praw Subreddit serving recorded listings."""
+
+    def __init__(self, name: str, reddit: "RecordedReddit"):
+        self.display_name = name
+        self._reddit = reddit
+
+    def _listing(self, sort: str, limit: Optional[int]) -> Iterator[RecordedSubmission]:
+        things = self._reddit.listing_things(self.display_name, sort)
+        for thing in things[:limit] if limit is not None else things:
+            yield RecordedSubmission(thing['data'], self._reddit)
+
+    def top(self, time_filter: str = 'all', limit: Optional[int] = 100, **kwargs) -> Iterator[RecordedSubmission]:
+        return self._listing('top', limit)
+
+    def hot(self, limit: Optional[int] = 100, **kwargs) -> Iterator[RecordedSubmission]:
+        return self._listing('hot', limit)
+
+    def new(self, limit: Optional[int] = 100, **kwargs) -> Iterator[RecordedSubmission]:
+        return self._listing('new', limit)
+
+
+class RecordedReddit:
+    """
+    Offline stand-in for praw.Reddit serving recorded Reddit JSON.
+
+    Listings and comment pages use the JSON returned by Reddit's public
+    endpoints, e.g. https://www.reddit.com/r/stocks/top.json?t=day and
+    https://www.reddit.com/comments/<id>.json. With from_directory they are
+    read from:
+
+        <root>/r/<subreddit>/<sort>.json   (sort: top, hot or new)
+        <root>/comments/<submission id>.json
+    """
+
+    def __init__(self,
+                 listings: Optional[Dict[str, Dict[str, List[Dict]]]] = None,
+                 comment_pages: Optional[Dict[str, List[Dict]]] = None,
+                 root: Optional[Union[str, Path]] = None):
+        """
+        Initialize the stand-in.
+
+        Args:
+            listings (Dict, optional): subreddit -> sort -> list of t3 things
+            comment_pages (Dict, optional): submission ID -> list of t1/more things
+            root (str | Path, optional): Directory to lazily read missing data from
+        """
+        self._listings = {name.lower(): sorts for name, sorts in (listings or {}).items()}
+        self._comment_pages = dict(comment_pages or {})
+        self._root = Path(root) if root else None
+
+    @classmethod
+    def from_directory(cls, root: Union[str, Path]) -> "RecordedReddit":
+        """Serve recorded JSON files from a directory (see class docstring for the layout)."""
+        return cls(root=root)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Snapshot) -> "RecordedReddit":
+        """Serve the listings and comments captured in a Snapshot by RedditScraper."""
+        listings: Dict[str, Dict[str, List[Dict]]] = {}
+        for key, things in snapshot.entries(REDDIT_LISTING).items():
+            subreddit, sort = key.rsplit('/', 1)
+            listings.setdefault(subreddit, {})[sort] = things
+        return cls(listings=listings, comment_pages=snapshot.entries(REDDIT_COMMENTS))
+
+    def _load(self, *parts: str):
+        if not self._root:
+            return None
+        path = self._root.joinpath(*parts)
+        if not path.exists():
+            logger.debug(f"No recording at {path}")
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def listing_things(self, subreddit: str, sort: str) -> List[Dict]:
+        """Get the recorded submissions of a subreddit listing."""
+        sorts = self._listings.setdefault(subreddit.lower(), {})
+        if sort not in sorts:
+            sorts[sort] = _children(self._load('r', subreddit, f"{sort}.json"))
+        return sorts[sort]
+
+    def comment_things(self, submission_id: str) -> List[Dict]:
+        """Get the recorded top-level comment things of a submission."""
+        if submission_id not in self._comment_pages:
+            page = self._load('comments', f"{submission_id}.json")
+            # A comment page is [submission listing, comment listing]
+            if isinstance(page, list) and len(page) == 2 and page[1].get('kind') == 'Listing':
+                page = page[1]
+            self._comment_pages[submission_id] = _children(page)
+        return self._comment_pages[submission_id]
+
+    def subreddit(self, name: str) -> RecordedSubreddit:
+        return RecordedSubreddit(name, self)
+
+    def submission(self, id: str) -> RecordedSubmission:
+        for sorts in self._listings.values():
+            for things in sorts.values():
+                for thing in things:
+                    if thing['data'].get('id') == id:
+                        return RecordedSubmission(thing['data'], self)
+        return RecordedSubmission({'id': id}, self)
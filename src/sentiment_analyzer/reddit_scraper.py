@@ -1,11 +1,29 @@
-import praw
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import Callable, List, Dict, Iterable, Iterator, Optional
+
+from ..recording import Snapshot, REDDIT_COMMENTS, REDDIT_LISTING
+from .metrics import Counters
+from .rate_limiter import RateLimiter
+
+# Submissions returned per listing request by the Reddit API
+LISTING_PAGE_SIZE = 100
 
 class RedditScraper:
-    """A class to handle scraping Reddit posts from r/stocks."""
+    """A class to handle scraping Reddit posts from a subreddit (r/stocks by default)."""
     
-    def __init__(self, client_id: str, client_secret: str, user_agent: str):
+    def __init__(self,
+                 client_id: str,
+                 client_secret: str,
+                 user_agent: str,
+                 reddit=None,
+                 snapshot: Optional[Snapshot] = None,
+                 subreddit: str = 'stocks',
+                 rate_limiter: Optional[RateLimiter] = None,
+                 counters: Optional[Counters] = None):
         """
         Initialize the RedditScraper with Reddit API credentials.
         
@@ -13,17 +31,151 @@ class RedditScraper:
             client_id (str): Reddit API client ID
             client_secret (str): Reddit API client secret
             user_agent (str): Unique user agent string for the bot
+            reddit (optional): Client to use instead of praw.Reddit, such as a
+                RecordedReddit serving recorded JSON for offline runs
+            snapshot (Snapshot, optional): Snapshot that fetched listings and
+                comments are recorded to when it is in record mode
+            subreddit (str): Subreddit to scrape (default: stocks)
+            rate_limiter (RateLimiter, optional): Limiter acquired before each API
+                request, e.g. shared by several scrapers
+            counters (Counters, optional): Request counters to update, e.g. shared
+                by several scrapers
         """
-        self.reddit = praw.Reddit(
-            client_id=client_id,
-            client_secret=client_secret,
-            user_agent=user_agent
-        )
-        self.subreddit = self.reddit.subreddit('stocks')
+        self.counters = counters if counters is not None else Counters()
+        self._new_client: Optional[Callable[[], object]] = None
+        if reddit is None:
+            # Not needed (or imported) with a stand-in client
+            import praw
+            import requests
+            
+            def new_client():
+                session = requests.Session()
+                session.hooks['response'].append(self._count_response)
+                return praw.Reddit(
+                    client_id=client_id,
+                    client_secret=client_secret,
+                    user_agent=user_agent,
+                    requestor_kwargs={'session': session}
+                )
+            
+            self._new_client = new_client
+            reddit = new_client()
+        self.reddit = reddit
+        # praw.Reddit is not thread-safe: comment workers each create their own
+        self._thread_clients = threading.local()
+        self.subreddit_name = subreddit
+        self.subreddit = self.reddit.subreddit(self.subreddit_name)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.snapshot = snapshot if snapshot is not None and snapshot.recording else None
+
+    def _count_response(self, response, *args, **kwargs):
+        """Record the size and latency of an HTTP response from the Reddit API."""
+        self.counters.add('reddit_http_responses')
+        self.counters.add('reddit_response_bytes', len(response.content))
+        self.counters.add('reddit_response_seconds', response.elapsed.total_seconds())
+
+    def _thread_client(self):
+        """Get the calling worker thread's own client (a stand-in client is shared)."""
+        if self._new_client is None:
+            return self.reddit
+        client = getattr(self._thread_clients, 'reddit', None)
+        if client is None:
+            client = self._thread_clients.reddit = self._new_client()
+        return client
+
+    def _acquire(self):
+        """Wait for the rate limiter before an API request and count the request."""
+        started = time.perf_counter()
+        self.rate_limiter.acquire()
+        self.counters.add('reddit_rate_limit_wait_seconds', time.perf_counter() - started)
+        self.counters.add('reddit_requests')
+
+    def _post_from_submission(self, submission) -> Dict:
+        """Convert a PRAW submission into the post dict used by the analyzer."""
+        return {
+            'id': submission.id,
+            'title': submission.title,
+            'body': submission.selftext,
+            'score': submission.score,
+            'created_utc': datetime.fromtimestamp(submission.created_utc),
+            # False if never edited, otherwise the edit timestamp
+            'edited': float(getattr(submission, 'edited', False) or 0),
+            'source': self.subreddit_name,
+            # Fullname of the original post if this is a cross-post
+            'crosspost_parent': getattr(submission, 'crosspost_parent', None)
+        }
+
+    def _submission_thing(self, submission) -> Dict:
+        """Serialize a submission as a Reddit JSON thing for recording."""
+        return {'kind': 't3', 'data': {
+            'id': submission.id,
+            'title': submission.title,
+            'selftext': submission.selftext,
+            'score': submission.score,
+            'created_utc': submission.created_utc,
+            'edited': getattr(submission, 'edited', False),
+            'crosspost_parent': getattr(submission, 'crosspost_parent', None)
+        }}
+
+    def _comment_things(self, comments, levels: int) -> List[Dict]:
+        """Serialize a comment forest, down to the given number of levels, for recording."""
+        things = []
+        for comment in comments:
+            if not hasattr(comment, 'body'):
+                continue
+            replies = self._comment_things(comment.replies, levels - 1) if levels > 1 else []
+            things.append({'kind': 't1', 'data': {
+                'id': comment.id,
+                'body': comment.body,
+                'score': comment.score,
+                'created_utc': comment.created_utc,
+                'edited': getattr(comment, 'edited', False),
+                'replies': {'kind': 'Listing', 'data': {'children': replies}} if replies else ''
+            }})
+        return things
+
+    def _iter_top_submissions(self, limit: int) -> Iterator:
+        """Iterate the subreddit's top submissions of the day, recording them if requested."""
+        things = []
+        self._acquire()
+        try:
+            # Get top posts from the last 24 hours
+            for count, submission in enumerate(self.subreddit.top('day', limit=limit)):
+                # Listings are paged, so each page is one request
+                if count % LISTING_PAGE_SIZE == LISTING_PAGE_SIZE - 1:
+                    self._acquire()
+                if self.snapshot:
+                    things.append(self._submission_thing(submission))
+                yield submission
+        finally:
+            if self.snapshot:
+                self.snapshot.record(REDDIT_LISTING, f"{self.subreddit_name}/top", things)
+
+    def iter_top_daily_posts(self, limit: int = 50, cancel_event: Optional[threading.Event] = None) -> Iterator[Dict]:
+        """
+        Stream top daily posts from the subreddit as they arrive from the API.
+        
+        Args:
+            limit (int): Number of posts to fetch (default: 50)
+            cancel_event (threading.Event, optional): When set, the stream ends
+                after the current post, without requesting further pages
+            
+        Yields:
+            Dict: Post data with title, body, score and created_utc, as
+                described in get_top_daily_posts
+        """
+        try:
+            for submission in self._iter_top_submissions(limit):
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+                yield self._post_from_submission(submission)
+                
+        except Exception as e:
+            print(f"Error fetching posts: {str(e)}")
 
     def get_top_daily_posts(self, limit: int = 50) -> List[Dict]:
         """
-        Fetch top daily posts from r/stocks.
+        Fetch top daily posts from the subreddit.
         
         Args:
             limit (int): Number of posts to fetch (default: 50)
@@ -31,21 +183,19 @@ class RedditScraper:
         Returns:
             List[Dict]: List of dictionaries containing post data
                 Each dict contains:
+                - id: Submission ID
                 - title: Post title
                 - body: Post body text
                 - score: Post score (upvotes - downvotes)
                 - created_utc: Post creation timestamp
+                - edited: Last edit timestamp (0 if never edited)
+                - source: Subreddit the post was fetched from
+                - crosspost_parent: Fullname of the original post, for cross-posts
         """
         posts = []
         try:
-            # Get top posts from the last 24 hours
-            for submission in self.subreddit.top('day', limit=limit):
-                post_data = {
-                    'title': submission.title,
-                    'body': submission.selftext,
-                    'score': submission.score,
-                    'created_utc': datetime.fromtimestamp(submission.created_utc)
-                }
+            for submission in self._iter_top_submissions(limit):
+                post_data = self._post_from_submission(submission)
                 posts.append(post_data)
                 
         except Exception as e:
@@ -54,6 +204,155 @@ class RedditScraper:
             
         return posts
 
+    def _iter_submission_comments(self,
+                                  submission_id: str,
+                                  max_depth: int,
+                                  replace_more_limit: int,
+                                  stopped: Callable[[], bool]) -> Iterator[Dict]:
+        """Walk one submission's comment tree breadth-first, yielding comment dicts (on a worker thread)."""
+        self._acquire()
+        submission = self._thread_client().submission(id=submission_id)
+        # Expand at most replace_more_limit "load more comments" stubs; the rest are dropped
+        submission.comments.replace_more(limit=replace_more_limit)
+        if self.snapshot:
+            self.snapshot.record(REDDIT_COMMENTS, submission_id,
+                                 self._comment_things(submission.comments, max_depth))
+        
+        level = [(comment, 0) for comment in submission.comments]
+        while level and not stopped():
+            next_level = []
+            for comment, depth in level:
+                # Unexpanded MoreComments stubs have no body
+                if stopped() or not hasattr(comment, 'body'):
+                    continue
+                yield {
+                    'id': comment.id,
+                    'submission_id': submission_id,
+                    'body': comment.body,
+                    'score': comment.score,
+                    'created_utc': datetime.fromtimestamp(comment.created_utc),
+                    'edited': float(getattr(comment, 'edited', False) or 0),
+                    'source': self.subreddit_name,
+                    'depth': depth
+                }
+                if depth + 1 < max_depth:
+                    next_level.extend((reply, depth + 1) for reply in comment.replies)
+            level = next_level
+
+    def iter_comments(self,
+                      submission_ids: Iterable[str],
+                      max_depth: int = 3,
+                      replace_more_limit: int = 0,
+                      max_comments: int = 1000,
+                      workers: int = 4,
+                      cancel_event: Optional[threading.Event] = None) -> Iterator[Dict]:
+        """
+        Stream comments from several submissions, fetched concurrently.
+        
+        Comments are yielded as soon as any submission produces them; each
+        submission's tree is walked level by level without copying it. Each
+        worker thread uses its own Reddit client.
+        
+        Args:
+            submission_ids (Iterable[str]): Submissions to read comments from
+            max_depth (int): Deepest reply level to include (1 = top-level comments only)
+            replace_more_limit (int): "Load more comments" expansions per submission
+                (each is one extra API request)
+            max_comments (int): Total comments to yield across all submissions
+            workers (int): Submissions fetched concurrently
+            cancel_event (threading.Event, optional): When set, the workers stop
+                fetching and the stream ends
+            
+        Yields:
+            Dict: Comment data with id, submission_id, body, score, created_utc, edited, source and depth
+        """
+        submission_ids = list(submission_ids)
+        if not submission_ids or max_comments <= 0:
+            return
+        
+        stop = threading.Event()
+        done = object()
+        # Bounded so that workers cannot run far ahead of the consumer
+        comments: queue.Queue = queue.Queue(maxsize=256)
+        
+        def stopped() -> bool:
+            return stop.is_set() or (cancel_event is not None and cancel_event.is_set())
+        
+        def fetch(submission_id: str):
+            try:
+                if stopped():
+                    return
+                for comment in self._iter_submission_comments(
+                        submission_id, max_depth, replace_more_limit, stopped):
+                    while not stopped():
+                        try:
+                            comments.put(comment, timeout=0.1)
+                            break
+                        except queue.Full:
+                            continue
+            except Exception as e:
+                print(f"Error fetching comments for {submission_id}: {str(e)}")
+            finally:
+                while True:
+                    try:
+                        comments.put(done, timeout=0.1)
+                        break
+                    except queue.Full:
+                        if stopped():
+                            break
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, min(workers, len(submission_ids))))
+        try:
+            for submission_id in submission_ids:
+                executor.submit(fetch, submission_id)
+            
+            remaining = len(submission_ids)
+            yielded = 0
+            while remaining and yielded < max_comments and not stopped():
+                try:
+                    item = comments.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if item is done:
+                    remaining -= 1
+                    continue
+                yield item
+                yielded += 1
+        finally:
+            # Stop the workers and drain the queue so none stays blocked
+            stop.set()
+            while True:
+                try:
+                    comments.get_nowait()
+                except queue.Empty:
+                    break
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_daily_discussion(self,
+                              limit: int = 50,
+                              max_comments: int = 0,
+                              cancel_event: Optional[threading.Event] = None,
+                              **comment_options) -> Iterator[Dict]:
+        """
+        Stream top daily posts followed by comments from those posts.
+        
+        Args:
+            limit (int): Number of posts to fetch (default: 50)
+            max_comments (int): Total comments to include (default: 0, posts only)
+            cancel_event (threading.Event, optional): When set, fetching stops and the stream ends
+            **comment_options: Further options for iter_comments
+            
+        Yields:
+            Dict: Posts (see get_top_daily_posts), then comments (see iter_comments)
+        """
+        post_ids = []
+        for post in self.iter_top_daily_posts(limit=limit, cancel_event=cancel_event):
+            post_ids.append(post['id'])
+            yield post
+        if max_comments > 0:
+            yield from self.iter_comments(post_ids, max_comments=max_comments, cancel_event=cancel_event,
+                                          **comment_options)
+
     def __str__(self) -> str:
         """Return string representation of the scraper."""
-        return f"RedditScraper(subreddit=r/stocks)"
\ No newline at end of file
+        return f"RedditScraper(subreddit=r/{self.subreddit_name})"
\ No newline at end of file
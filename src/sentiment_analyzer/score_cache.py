@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import threading
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+
+class ScoreCache:
+    """Bounded LRU cache of sentiment scores keyed by normalized sentence hash."""
+
+    def __init__(self, max_size: int = 100_000, path: Optional[Union[str, Path]] = None):
+        """
+        Initialize the score cache.
+
+        Args:
+            max_size (int): Maximum number of cached scores before the least
+                recently used are evicted
+            path (str | Path, optional): JSON file to load from and save to;
+                None keeps the cache in memory only
+        """
+        self.max_size = max(1, max_size)
+        self.path = Path(path) if path else None
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._scores: "OrderedDict[str, float]" = OrderedDict()
+
+        if self.path:
+            self.load()
+
+    @staticmethod
+    def key(sentence: str) -> str:
+        """
+        Build the cache key for a sentence.
+
+        Whitespace is collapsed before hashing; VADER splits on whitespace,
+        so sentences that only differ in spacing score identically.
+
+        Args:
+            sentence (str): Sentence text
+
+        Returns:
+            str: Hex digest identifying the normalized sentence
+        """
+        normalized = ' '.join(sentence.split())
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def get(self, key: str) -> Optional[float]:
+        """
+        Look up a cached score and record a hit or miss.
+
+        Args:
+            key (str): Key from ScoreCache.key
+
+        Returns:
+            float or None if the key is not cached
+        """
+        with self._lock:
+            score = self._scores.get(key)
+            if score is None:
+                self.misses += 1
+                return None
+            self._scores.move_to_end(key)
+            self.hits += 1
+            return score
+
+    def record_hit(self):
+        """Count a lookup served without consulting the cache (e.g. an in-batch duplicate)."""
+        with self._lock:
+            self.hits += 1
+
+    def put(self, key: str, score: float):
+        """
+        Store a score, evicting the least recently used entry when full.
+
+        Args:
+            key (str): Key from ScoreCache.key
+            score (float): Sentiment score
+        """
+        with self._lock:
+            self._scores[key] = score
+            self._scores.move_to_end(key)
+            while len(self._scores) > self.max_size:
+                self._scores.popitem(last=False)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get cache effectiveness counters.
+
+        Returns:
+            Dict with hits, misses, hit_rate and size
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._scores)
+        }
+
+    def clear(self):
+        """Drop all cached scores and reset the counters."""
+        with self._lock:
+            self._scores.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def load(self):
+        """Load persisted scores from the cache file, if it exists."""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            with self._lock:
+                # Stored oldest first, so the most recent entries survive trimming
+                for key, score in list(stored.items())[-self.max_size:]:
+                    self._scores[key] = score
+            self.logger.debug(f"Loaded {len(self._scores)} cached scores from {self.path}")
+        except Exception as e:
+            self.logger.error(f"Error loading score cache: {str(e)}")
+
+    def save(self):
+        """Write the cached scores to the cache file."""
+        if not self.path:
+            return
+        try:
+            with self._lock:
+                snapshot = dict(self._scores)
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            self.logger.error(f"Error saving score cache: {str(e)}")
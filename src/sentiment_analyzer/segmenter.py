@@ -0,0 +1,147 @@
+import re
+from typing import Callable, Dict, List, Optional
+
+# Segmenter used when none is configured
+DEFAULT_SEGMENTER = 'regex'
+
+# Candidate sentence ends: terminal punctuation with any closing quotes or
+# brackets followed by whitespace (or the end of the text), and blank lines
+_CANDIDATE = re.compile(
+    r'(?P<punct>[.!?]+)(?P<close>["\'”’)\]]*)(?P<space>\s+|$)'
+    r'|(?P<para>\n[ \t]*\n\s*)'
+)
+
+# Abbreviations that are never followed by a sentence break
+ABBREVIATIONS = {
+    'mr', 'mrs', 'ms', 'dr', 'prof', 'sr', 'jr', 'st', 'gen', 'gov', 'sen', 'rep',
+    'vs', 'approx', 'est', 'dept', 'fig', 'cf', 'al', 'eg', 'ie',
+    'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'sept', 'oct', 'nov', 'dec',
+}
+
+# Abbreviations that only continue the sentence before a number ("No. 1", "p. 12", "pg. 5")
+NUMBER_ABBREVIATIONS = {'no', 'nos', 'vol', 'p', 'pp', 'pg', 'pgs'}
+
+# Company suffixes; they often end a sentence, but not before "(TICKER)"
+COMPANY_SUFFIXES = {'inc', 'corp', 'co', 'ltd', 'llc', 'plc', 'bros', 'hldgs'}
+
+# Dotted initialisms such as U.S, U.K or p.m (the final period is matched separately)
+_INITIALISM = re.compile(r'(?:[A-Za-z]\.)+[A-Za-z]')
+
+_OPENING = '"\'“‘([*'
+
+
+class RegexSegmenter:
+    """
+    Rule-based sentence segmenter for Reddit finance text.
+
+    A compiled regular expression finds candidate sentence ends and a few
+    rules reject the ones that are not: abbreviations such as "Mr." or
+    "vs.", dotted initialisms such as "U.S." or "p.m.", single-letter
+    initials, "No." before a number, company suffixes such as "Inc."
+    before a lowercase word or "(TICKER)", and ellipses before a lowercase
+    word. Periods inside tokens, as in "$4.5B", "3.14" or "BRK.B", are
+    never candidates. Blank lines always end a sentence.
+
+    Needs no external data, and instances can be pickled to worker processes.
+    """
+
+    name = 'regex'
+
+    def _is_boundary(self, text: str, match: re.Match) -> bool:
+        """Decide whether a candidate match ends a sentence."""
+        if match.group('para') or match.end() == len(text):
+            return True
+        if match.group('space').count('\n') >= 2:
+            return True
+        punct = match.group('punct')
+        if '!' in punct or '?' in punct:
+            return True
+
+        # Like punkt, only abbreviation-like tokens consult the next word's case
+        next_word = text[match.end():match.end() + 3].lstrip(_OPENING)
+        if len(punct) > 1:
+            # An ellipsis ends the sentence before a capitalized word
+            return not next_word[:1].islower()
+
+        start = match.start()
+        while start > 0 and not text[start - 1].isspace():
+            start -= 1
+        token = text[start:match.start()].lstrip(_OPENING)
+        word = token.lower()
+        if word in ABBREVIATIONS or _INITIALISM.fullmatch(token):
+            return False
+        if len(token) == 1 and token.isalpha() and token != 'I':
+            return False
+        following = text[match.end():match.end() + 1]
+        if word in NUMBER_ABBREVIATIONS and following.isdigit():
+            return False
+        if word in COMPANY_SUFFIXES:
+            return not (next_word[:1].islower() or following == '(')
+        return True
+
+    def __call__(self, text: str) -> List[str]:
+        """
+        Split text into sentences.
+
+        Args:
+            text (str): Text to split
+
+        Returns:
+            List[str]: Sentences with surrounding whitespace removed, in order
+        """
+        sentences = []
+        start = 0
+        for match in _CANDIDATE.finditer(text):
+            if not self._is_boundary(text, match):
+                continue
+            end = match.start('para') if match.group('para') else match.end('close')
+            sentence = text[start:end].strip()
+            if sentence:
+                sentences.append(sentence)
+            start = match.end()
+        tail = text[start:].strip()
+        if tail:
+            sentences.append(tail)
+        return sentences
+
+
+class PunktSegmenter:
+    """NLTK's punkt sentence tokenizer; needs nltk and its punkt data downloaded."""
+
+    name = 'punkt'
+
+    def __init__(self, language: str = 'english'):
+        self.language = language
+        self._tokenize: Optional[Callable[..., List[str]]] = None
+
+    def __call__(self, text: str) -> List[str]:
+        """Split text into sentences with punkt, loading it on first use."""
+        if self._tokenize is None:
+            from nltk.tokenize import sent_tokenize  # Optional dependency
+            self._tokenize = sent_tokenize
+        return self._tokenize(text, language=self.language)
+
+
+SEGMENTERS: Dict[str, Callable[[], Callable[[str], List[str]]]] = {
+    'regex': RegexSegmenter,
+    'punkt': PunktSegmenter,
+}
+
+
+def get_segmenter(name: str = DEFAULT_SEGMENTER) -> Callable[[str], List[str]]:
+    """
+    Create a sentence segmenter by name.
+
+    Args:
+        name (str): One of SEGMENTERS: 'regex' (built in, the default) or 'punkt' (NLTK)
+
+    Returns:
+        Callable: Function-like segmenter taking a text and returning its sentences
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    try:
+        return SEGMENTERS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown sentence segmenter {name!r}, expected one of {', '.join(SEGMENTERS)}")
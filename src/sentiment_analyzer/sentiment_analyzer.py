@@ -1,38 +1,134 @@
-import nltk
-from nltk.tokenize import sent_tokenize
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 import logging
 from statistics import mean
 
+from .parallel import ParallelScorer
+from .score_cache import ScoreCache
+from .segmenter import DEFAULT_SEGMENTER, get_segmenter
+from .ticker_matcher import TickerMatcher
+
 class SentimentAnalyzer:
     """A class to analyze sentiment of text containing stock tickers."""
     
-    def __init__(self):
-        """Initialize the SentimentAnalyzer with VADER sentiment analyzer."""
+    # Below this many sentences to score, process start-up and IPC cost more than they save
+    PARALLEL_MIN_SENTENCES = 1000
+
+    def __init__(self,
+                 score_cache: Optional[ScoreCache] = None,
+                 cache_size: int = 100_000,
+                 workers: int = 1,
+                 chunk_size: int = 256,
+                 segmenter: Union[str, Callable[[str], List[str]]] = DEFAULT_SEGMENTER):
+        """
+        Initialize the SentimentAnalyzer with VADER sentiment analyzer.
+        
+        Args:
+            score_cache (ScoreCache, optional): Cache of sentence scores to use
+                (default: a new in-memory cache)
+            cache_size (int): Size of the default cache when none is given
+            workers (int): Worker processes for scoring large batches; 1 scores serially
+            chunk_size (int): Sentences sent to a worker process per task
+            segmenter (str | Callable): Sentence segmenter name ('regex', the built-in
+                default, or 'punkt' for NLTK), or a function splitting a text into sentences
+        """
         self.vader = SentimentIntensityAnalyzer()
-        self.tokenizer = sent_tokenize
+        self.tokenizer = get_segmenter(segmenter) if isinstance(segmenter, str) else segmenter
+        # Identifies the segmenter in post checkpoints, whose mentions depend on it
+        self.segmenter_name = getattr(self.tokenizer, 'name', None) or getattr(
+            self.tokenizer, '__qualname__', type(self.tokenizer).__name__)
+        self.score_cache = score_cache if score_cache is not None else ScoreCache(max_size=cache_size)
+        self.parallel = ParallelScorer(workers, chunk_size, self.tokenizer) if workers > 1 else None
         
         # Set up logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
 
+    def _score(self, text: str) -> float:
+        """Run VADER on a piece of text, returning 0.0 on failure."""
+        try:
+            scores = self.vader.polarity_scores(text)
+            return scores['compound']
+        except Exception as e:
+            self.logger.error(f"Error analyzing sentiment: {str(e)}")
+            return 0.0
+
     def get_text_sentiment(self, text: str) -> float:
         """
         Get the compound sentiment score for a piece of text.
         
+        Scores are memoized in the analyzer's score cache.
+        
         Args:
             text (str): Text to analyze
             
         Returns:
             float: Compound sentiment score (-1 to 1)
         """
-        try:
-            scores = self.vader.polarity_scores(text)
-            return scores['compound']
-        except Exception as e:
-            self.logger.error(f"Error analyzing sentiment: {str(e)}")
-            return 0.0
+        key = self.score_cache.key(text)
+        score = self.score_cache.get(key)
+        if score is None:
+            score = self._score(text)
+            self.score_cache.put(key, score)
+        return score
+
+    def score_batch(self, sentences: List[str]) -> List[float]:
+        """
+        Get compound sentiment scores for many sentences.
+        
+        Each distinct (whitespace-normalized) sentence is looked up in the
+        score cache and, if missing, scored once.
+        
+        Args:
+            sentences (List[str]): Sentences to analyze
+            
+        Returns:
+            List[float]: Compound sentiment scores, in input order
+        """
+        keys = [self.score_cache.key(sentence) for sentence in sentences]
+        
+        # Resolve each distinct sentence once from the cache
+        resolved: Dict[str, float] = {}
+        missing: Dict[str, str] = {}
+        for key, sentence in zip(keys, sentences):
+            if key in resolved or key in missing:
+                self.score_cache.record_hit()
+                continue
+            score = self.score_cache.get(key)
+            if score is None:
+                missing[key] = sentence
+            else:
+                resolved[key] = score
+        
+        # Score the rest, on the process pool when the batch is large enough
+        if self.parallel and len(missing) >= self.PARALLEL_MIN_SENTENCES:
+            new_scores = self.parallel.score(list(missing.values()))
+        else:
+            new_scores = [self._score(sentence) for sentence in missing.values()]
+        for key, score in zip(missing, new_scores):
+            self.score_cache.put(key, score)
+            resolved[key] = score
+        
+        return [resolved[key] for key in keys]
+
+    def split_sentences(self, texts: List[str]) -> List[List[str]]:
+        """
+        Split many texts into sentences.
+        
+        Args:
+            texts (List[str]): Texts to split
+            
+        Returns:
+            List[List[str]]: Sentences of each text, in input order
+        """
+        if self.parallel and sum(len(text) for text in texts) >= self.PARALLEL_MIN_SENTENCES * 100:
+            return self.parallel.tokenize(texts)
+        return [self.tokenizer(text) for text in texts]
+
+    def close(self):
+        """Release the worker processes, if any."""
+        if self.parallel:
+            self.parallel.close()
 
     def get_sentences_with_ticker(self, text: str, ticker: str) -> List[str]:
         """
@@ -49,19 +145,47 @@ class SentimentAnalyzer:
             # Split text into sentences
             sentences = self.tokenizer(text)
             
-            # Return sentences containing the ticker
+            # Return sentences containing the ticker as a whole word
+            matcher = TickerMatcher([ticker])
             return [
                 sentence for sentence in sentences
-                if ticker in sentence
+                if matcher.find_tickers(sentence)
             ]
         except Exception as e:
             self.logger.error(f"Error extracting sentences: {str(e)}")
             return []
 
+    def build_sentence_index(self,
+                             sentences: List[str],
+                             tickers: Union[Iterable[str], TickerMatcher]) -> Dict[int, Set[str]]:
+        """
+        Map each sentence to the tickers it mentions.
+        
+        Args:
+            sentences (List[str]): Sentences to index
+            tickers (Iterable[str] | TickerMatcher): Ticker symbols to look for,
+                or a prebuilt matcher for them
+            
+        Returns:
+            Dict[int, Set[str]]: Sentence positions mapped to the tickers they mention;
+                sentences without any ticker are omitted
+        """
+        matcher = tickers if isinstance(tickers, TickerMatcher) else TickerMatcher(tickers)
+        index = {}
+        for position, sentence in enumerate(sentences):
+            mentioned = matcher.find_tickers(sentence)
+            if mentioned:
+                index[position] = mentioned
+        return index
+
     def analyze_ticker_sentiment(self, text: str, tickers: List[str]) -> Dict[str, float]:
         """
         Analyze sentiment for each ticker in the text.
         
+        The text is split into sentences once, and each sentence mentioning
+        at least one ticker is scored once; its score counts towards every
+        ticker it mentions.
+        
         Args:
             text (str): Text to analyze
             tickers (List[str]): List of ticker symbols to analyze
@@ -72,14 +196,15 @@ class SentimentAnalyzer:
         try:
             ticker_sentiments: Dict[str, List[float]] = {ticker: [] for ticker in tickers}
             
-            # Process each ticker
-            for ticker in tickers:
-                # Get sentences containing the ticker
-                relevant_sentences = self.get_sentences_with_ticker(text, ticker)
-                
-                # Analyze sentiment for each relevant sentence
-                for sentence in relevant_sentences:
-                    sentiment = self.get_text_sentiment(sentence)
+            # Split text into sentences and find the tickers in each
+            sentences = self.tokenizer(text)
+            sentence_index = self.build_sentence_index(sentences, tickers)
+            
+            # Score each relevant sentence once and attribute it to its tickers
+            positions = list(sentence_index)
+            scores = self.score_batch([sentences[position] for position in positions])
+            for position, sentiment in zip(positions, scores):
+                for ticker in sentence_index[position]:
                     ticker_sentiments[ticker].append(sentiment)
             
             # Calculate average sentiment for each ticker
@@ -0,0 +1,141 @@
+import csv
+import sqlite3
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from ..app_paths import get_app_data_dir
+
+# Column names of the legacy sentiment_log.csv
+CSV_COLUMNS = ['Date', 'Top 3 Bullish', 'Top 3 Bearish']
+
+
+def _split_tickers(value: Optional[str]) -> List[str]:
+    """Parse a comma-separated ticker list as written to the log."""
+    return [ticker.strip() for ticker in (value or '').split(',') if ticker.strip()]
+
+
+class SentimentLogStore:
+    """Date-indexed SQLite store of daily top bullish/bearish tickers."""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Open (or create) the sentiment log.
+
+        Args:
+            path (str | Path, optional): Database file (default: sentiment_log.db in the app data dir)
+        """
+        self.path = Path(path) if path else get_app_data_dir() / "sentiment_log.db"
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        # The date primary key is the index used for upserts and range reads
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sentiment_log (
+                date TEXT PRIMARY KEY,
+                top_bullish TEXT NOT NULL,
+                top_bearish TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM sentiment_log").fetchone()[0]
+
+    def upsert(self, date: str, bullish: List[str], bearish: List[str]):
+        """
+        Record the results for a date, replacing any earlier results for it.
+
+        Args:
+            date (str): Date in YYYY-MM-DD format
+            bullish (List[str]): Top bullish tickers
+            bearish (List[str]): Top bearish tickers
+        """
+        self._upsert_many([(date, bullish, bearish)])
+
+    def _upsert_many(self, rows: List[tuple]):
+        """Upsert (date, bullish, bearish) rows in a single transaction."""
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO sentiment_log (date, top_bullish, top_bearish, updated_at) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(date) DO UPDATE SET top_bullish = excluded.top_bullish, "
+                "top_bearish = excluded.top_bearish, updated_at = excluded.updated_at",
+                [(date, ', '.join(bullish), ', '.join(bearish), now) for date, bullish, bearish in rows]
+            )
+            self._conn.commit()
+
+    def get(self, date: str) -> Optional[Dict]:
+        """
+        Get the results recorded for a date.
+
+        Args:
+            date (str): Date in YYYY-MM-DD format
+
+        Returns:
+            Dict with date, bullish and bearish, or None if nothing was recorded
+        """
+        rows = self.read_range(date, date)
+        return rows[0] if rows else None
+
+    def read_range(self, start: Optional[str] = None, end: Optional[str] = None) -> List[Dict]:
+        """
+        Read the results for an inclusive date range.
+
+        Args:
+            start (str, optional): First date (YYYY-MM-DD); None reads from the beginning
+            end (str, optional): Last date (YYYY-MM-DD); None reads to the end
+
+        Returns:
+            List[Dict]: Rows with date, bullish and bearish, ordered by date
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date, top_bullish, top_bearish FROM sentiment_log "
+                "WHERE date >= ? AND date <= ? ORDER BY date",
+                (start or '', end or '9999-12-31')
+            ).fetchall()
+        return [
+            {'date': date, 'bullish': _split_tickers(bullish), 'bearish': _split_tickers(bearish)}
+            for date, bullish, bearish in rows
+        ]
+
+    def import_csv(self, csv_path: Union[str, Path]) -> int:
+        """
+        Import a legacy sentiment_log.csv.
+
+        Rows are upserted in file order, so the last row for a duplicated
+        date wins.
+
+        Args:
+            csv_path (str | Path): Path of the CSV file
+
+        Returns:
+            int: Number of rows imported
+        """
+        rows = []
+        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                date = (row.get(CSV_COLUMNS[0]) or '').strip()
+                if date:
+                    rows.append((
+                        date,
+                        _split_tickers(row.get(CSV_COLUMNS[1])),
+                        _split_tickers(row.get(CSV_COLUMNS[2]))
+                    ))
+        self._upsert_many(rows)
+        self.logger.info(f"Imported {len(rows)} rows from {csv_path}")
+        return len(rows)
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
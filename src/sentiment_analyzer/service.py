@@ -0,0 +1,329 @@
+import argparse
+import os
+import signal
+import sys
+import threading
+import time
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional, Set, Tuple, Union
+
+from ..app_paths import get_app_data_dir
+from .cancellation import AnalysisCancelled
+from .main import AnalysisComponents, build_components, run_analysis
+from .segmenter import DEFAULT_SEGMENTER, SEGMENTERS
+
+
+class IntervalSchedule:
+    """Runs every fixed number of seconds."""
+
+    def __init__(self, seconds: float):
+        if seconds <= 0:
+            raise ValueError("Interval must be positive")
+        self.seconds = seconds
+
+    def next_after(self, moment: datetime) -> datetime:
+        return moment + timedelta(seconds=self.seconds)
+
+    def __str__(self) -> str:
+        return f"every {self.seconds:g}s"
+
+
+class CronSchedule:
+    """
+    Runs at the times matched by a five-field cron expression.
+
+    Fields are minute, hour, day of month, month and day of week (0-7,
+    where 0 and 7 are Sunday), each *, a number, a range a-b, a list a,b
+    or a step */n or a-b/n. As in cron, when both day fields are
+    restricted a day matching either of them qualifies. Times are local.
+    """
+
+    FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields, got {len(fields)}: {expression!r}")
+        self.expression = expression
+        parsed = [self._parse_field(field, low, high) for field, (low, high) in zip(fields, self.FIELD_RANGES)]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        # Cron counts Sunday as 0 or 7; datetime.isoweekday() counts it as 7
+        self.weekdays = {7 if day == 0 else day for day in weekdays}
+        self.any_day = fields[2] == '*'
+        self.any_weekday = fields[4] == '*'
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int) -> Set[int]:
+        """Expand one cron field into the set of values it matches."""
+        values = set()
+        for part in field.split(','):
+            spec, _, step = part.partition('/')
+            if spec == '*':
+                start, end = low, high
+            elif '-' in spec:
+                start, end = (int(value) for value in spec.split('-', 1))
+            else:
+                start = end = int(spec)
+                if step:
+                    end = high
+            if not low <= start <= end <= high:
+                raise ValueError(f"Cron field {field!r} is outside {low}-{high}")
+            values.update(range(start, end + 1, int(step) if step else 1))
+        return values
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day = moment.day in self.days
+        weekday = moment.isoweekday() in self.weekdays
+        if self.any_day or self.any_weekday:
+            return day and weekday
+        return day or weekday
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        Get the first matching minute after a moment.
+
+        Args:
+            moment (datetime): Local time to search from
+
+        Returns:
+            datetime: The next run time
+
+        Raises:
+            ValueError: If nothing matches within five years (e.g. February 30)
+        """
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=5 * 366)
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year, month = divmod(candidate.month, 12)
+                candidate = candidate.replace(year=candidate.year + year, month=month + 1, day=1, hour=0, minute=0)
+            elif not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+            elif candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Cron expression {self.expression!r} never matches")
+
+    def __str__(self) -> str:
+        return f"cron '{self.expression}'"
+
+
+class RunLock:
+    """
+    Non-blocking lock on a file, held by at most one process at a time.
+
+    The operating system releases it when the holder exits, so a crashed
+    run never leaves a stale lock behind.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file = None
+
+    def acquire(self) -> bool:
+        """
+        Try to take the lock.
+
+        Returns:
+            bool: True if the lock was taken, False if another process holds it
+        """
+        handle = open(self.path, 'a+')
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return False
+        self._file = handle
+        return True
+
+    def release(self):
+        """Release the lock if it is held."""
+        if self._file is None:
+            return
+        if os.name == 'nt':
+            import msvcrt
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+
+
+class AnalysisService:
+    """
+    Long-running headless analyzer.
+
+    Builds the analysis components once, so caches, the symbol universe,
+    the VADER lexicon and scoring worker processes stay warm, and runs the
+    analysis on a schedule. Each run saves to the sentiment log. Runs never
+    overlap: a run that would start while another process holds the run
+    lock is skipped, and slots missed while a run was in progress are
+    dropped rather than queued.
+    """
+
+    def __init__(self,
+                 components: AnalysisComponents,
+                 schedule: Union[IntervalSchedule, CronSchedule],
+                 max_comments: int = 0,
+                 lock_path: Optional[Union[str, Path]] = None,
+                 metrics_path: Optional[Union[str, Path]] = None):
+        """
+        Initialize the service.
+
+        Args:
+            components (AnalysisComponents): Components from build_components;
+                the service closes them when it stops
+            schedule (IntervalSchedule | CronSchedule): When to run
+            max_comments (int): Comments analyzed per run in addition to posts
+            lock_path (str | Path, optional): Run lock file (default: analysis.lock in the app data dir)
+            metrics_path (str | Path, optional): File rewritten with the metrics of every run
+                (.prom for the Prometheus text format, otherwise JSON)
+        """
+        self.components = components
+        self.schedule = schedule
+        self.max_comments = max_comments
+        self.metrics_path = metrics_path
+        self.lock = RunLock(lock_path if lock_path else get_app_data_dir() / "analysis.lock")
+        self.logger = logging.getLogger(__name__)
+
+        self._stop_event = threading.Event()
+        self._cancel_event = threading.Event()
+        self._run_lock = threading.Lock()
+
+    def warm_up(self):
+        """Load the sentence segmenter (and punkt's data, if used) before the first run rather than during it."""
+        started = time.perf_counter()
+        self.components.sentiment_analyzer.split_sentences(["Warm up. Ready."])
+        self.logger.info(f"Components warmed up in {time.perf_counter() - started:.2f}s")
+
+    def run_once(self) -> Optional[Tuple[List[str], List[str]]]:
+        """
+        Run the analysis now unless a run is already in progress.
+
+        Returns:
+            Tuple of the top bullish and bearish tickers, or None if the run
+            was skipped, cancelled or failed
+        """
+        if not self._run_lock.acquire(blocking=False):
+            self.logger.warning("Previous run still in progress, skipping")
+            return None
+        try:
+            if not self.lock.acquire():
+                self.logger.warning(f"Another process holds {self.lock.path}, skipping run")
+                return None
+            try:
+                started = time.perf_counter()
+                result = run_analysis(
+                    self.components,
+                    max_comments=self.max_comments,
+                    cancel_event=self._cancel_event,
+                    metrics_path=self.metrics_path
+                )
+                self.logger.info(f"Run finished in {time.perf_counter() - started:.1f}s")
+                return result
+            except AnalysisCancelled:
+                return None
+            except Exception as e:
+                # Keep serving; the next scheduled run may well succeed
+                self.logger.error(f"Run failed: {str(e)}")
+                return None
+            finally:
+                self.lock.release()
+        finally:
+            self._run_lock.release()
+
+    def serve(self, run_now: bool = False):
+        """
+        Run on schedule until stop() is called, then close the components.
+
+        Args:
+            run_now (bool): Also run once immediately on startup
+        """
+        self.logger.info(f"Analysis service started, running {self.schedule}")
+        try:
+            self.warm_up()
+            if run_now:
+                self.run_once()
+            while not self._stop_event.is_set():
+                next_run = self.schedule.next_after(datetime.now())
+                self.logger.info(f"Next run at {next_run:%Y-%m-%d %H:%M:%S}")
+                # Wait in short steps, so clock changes and suspends are noticed
+                while not self._stop_event.is_set() and datetime.now() < next_run:
+                    self._stop_event.wait(min(60.0, (next_run - datetime.now()).total_seconds()))
+                if not self._stop_event.is_set():
+                    self.run_once()
+        finally:
+            self.components.close()
+            self.logger.info("Analysis service stopped")
+
+    def stop(self):
+        """Stop serving; a run in progress is cancelled at its next post, ticker lookup or listing page."""
+        self._stop_event.set()
+        self._cancel_event.set()
+
+    def install_signal_handlers(self):
+        """Stop gracefully on SIGTERM and Ctrl+C (main thread only)."""
+        def handle(signum, frame):
+            self.logger.info(f"Received signal {signum}, shutting down")
+            self.stop()
+
+        signal.signal(signal.SIGTERM, handle)
+        signal.signal(signal.SIGINT, handle)
+        if hasattr(signal, 'SIGBREAK'):
+            signal.signal(signal.SIGBREAK, handle)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options for the service."""
+    parser = argparse.ArgumentParser(description="Run the r/stocks sentiment analysis as a scheduled service")
+    when = parser.add_mutually_exclusive_group(required=True)
+    when.add_argument('--interval', type=float, metavar='SECONDS', help='run every SECONDS')
+    when.add_argument('--cron', metavar='EXPR', help="run on a cron schedule, e.g. '0 9-16 * * 1-5'")
+    parser.add_argument('--run-now', action='store_true', help='also run once at startup')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='processes used for sentiment scoring (default: 1)')
+    parser.add_argument('--max-comments', type=int, default=0,
+                        help='comments to analyze in addition to posts (default: 0)')
+    parser.add_argument('--subreddits', nargs='+', metavar='NAME',
+                        help='subreddits to analyze together (default: stocks)')
+    parser.add_argument('--metrics-file', metavar='FILE',
+                        help='rewrite FILE after each run with its metrics; use a .prom name in '
+                             'the node_exporter textfile directory for Prometheus, anything else for JSON')
+    parser.add_argument('--segmenter', choices=sorted(SEGMENTERS), default=DEFAULT_SEGMENTER,
+                        help=f"sentence segmenter; punkt needs NLTK and its data (default: {DEFAULT_SEGMENTER})")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Entry point of the headless service."""
+    args = parse_args(argv)
+    schedule = IntervalSchedule(args.interval) if args.interval else CronSchedule(args.cron)
+    service = AnalysisService(
+        build_components(workers=args.workers, subreddits=args.subreddits, segmenter=args.segmenter),
+        schedule,
+        max_comments=args.max_comments,
+        metrics_path=args.metrics_file
+    )
+    service.install_signal_handlers()
+    service.serve(run_now=args.run_now)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        sys.exit(1)
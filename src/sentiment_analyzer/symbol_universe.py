@@ -0,0 +1,147 @@
+import csv
+import io
+import itertools
+import os
+import threading
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from ..app_paths import get_app_data_dir
+
+# Security types (as written by common listing files) that count as equities
+EQUITY_TYPES = {'EQUITY', 'STOCK', 'COMMON STOCK', 'CS', 'ADR', 'ADRC'}
+
+DEFAULT_COLUMNS = ('symbol', 'name', 'exchange', 'type')
+
+
+class SymbolUniverse:
+    """In-memory index of listed securities loaded from a local CSV file."""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Load the listed-securities file.
+
+        The file is a CSV of symbol, name, exchange and type. A header row is
+        optional; when present, columns are located by name. Later rows for the
+        same symbol override earlier ones, so updates can simply be appended.
+
+        Args:
+            path (str | Path, optional): CSV file (default: symbols.csv in the app data dir)
+        """
+        self.path = Path(path) if path else get_app_data_dir() / "symbols.csv"
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._types: Dict[str, bool] = {}
+        self._columns: Optional[Dict[str, int]] = None
+        self._offset = 0
+        self._mtime = 0.0
+        self._tail = b''
+
+        self.refresh()
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol.upper() in self._types
+
+    def is_equity(self, symbol: str) -> Optional[bool]:
+        """
+        Classify a symbol using the local listing.
+
+        Args:
+            symbol (str): Ticker symbol
+
+        Returns:
+            True if the symbol is a listed equity, False if it is listed as
+            something else, or None if the symbol is not in the file
+        """
+        return self._types.get(symbol.upper())
+
+    def _parse(self, text: str):
+        """Parse CSV rows from text and merge them into the index."""
+        rows = csv.reader(io.StringIO(text))
+
+        if self._columns is None:
+            first = next(rows, None)
+            if first is None:
+                return
+            header = [field.strip().lower() for field in first]
+            if 'symbol' in header:
+                self._columns = {
+                    name: header.index(name) for name in DEFAULT_COLUMNS if name in header
+                }
+            else:
+                self._columns = {name: idx for idx, name in enumerate(DEFAULT_COLUMNS)}
+                rows = itertools.chain([first], rows)
+
+        symbol_col = self._columns['symbol']
+        type_col = self._columns.get('type')
+        equity_types = EQUITY_TYPES
+        types = self._types
+
+        for row in rows:
+            if len(row) <= symbol_col:
+                continue
+            symbol = row[symbol_col].strip().upper()
+            if not symbol:
+                continue
+            security_type = row[type_col].strip().upper() if type_col is not None and len(row) > type_col else ''
+            types[symbol] = security_type in equity_types
+
+    def _remember_end(self, content: bytes, stat: os.stat_result):
+        """Record where the file ended so the next refresh can detect appends."""
+        self._tail = (self._tail + content)[-256:]
+        self._offset, self._mtime = stat.st_size, stat.st_mtime
+
+    def refresh(self) -> bool:
+        """
+        Bring the index up to date with the file on disk.
+
+        If the file has only grown since the last load, just the appended
+        rows are read; any other change triggers a full reload.
+
+        Returns:
+            bool: True if the index changed
+        """
+        with self._lock:
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                had_symbols = bool(self._types)
+                if had_symbols:
+                    self.logger.info(f"Symbol universe {self.path} removed, clearing index")
+                self._types, self._columns = {}, None
+                self._offset, self._mtime, self._tail = 0, 0.0, b''
+                return had_symbols
+
+            if stat.st_mtime == self._mtime and stat.st_size == self._offset:
+                return False
+
+            try:
+                with open(self.path, 'rb') as f:
+                    if self._tail.endswith(b'\n') and self._offset <= stat.st_size:
+                        # If the bytes before the previous end of file are
+                        # unchanged, the file was appended to: parse only the rest
+                        f.seek(self._offset - len(self._tail))
+                        if f.read(len(self._tail)) == self._tail:
+                            appended = f.read()
+                            self._parse(appended.decode('utf-8'))
+                            self._remember_end(appended, stat)
+                            self.logger.debug(f"Symbol universe incrementally refreshed ({len(self._types)} symbols)")
+                            return True
+                        f.seek(0)
+
+                    # Full reload
+                    content = f.read()
+                    self._types, self._columns = {}, None
+                    self._parse(content.decode('utf-8-sig'))
+                    self._tail = b''
+                    self._remember_end(content, stat)
+                    self.logger.info(f"Loaded {len(self._types)} symbols from {self.path}")
+                    return True
+            except Exception as e:
+                self.logger.error(f"Error loading symbol universe: {str(e)}")
+                return False
@@ -0,0 +1,156 @@
+import sqlite3
+import threading
+import time
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+from ..app_paths import get_app_data_dir
+
+# Valid symbols rarely disappear, while rejected ones (new listings, typos that
+# later become tickers) deserve a quicker second look
+DEFAULT_POSITIVE_TTL = 7 * 24 * 3600
+DEFAULT_NEGATIVE_TTL = 24 * 3600
+
+
+@dataclass
+class CachedValidation:
+    """A stored ticker validation result."""
+    symbol: str
+    is_valid: bool
+    quote_type: str
+    info_symbol: str
+    checked_at: float
+
+
+class TickerCache:
+    """Persistent SQLite cache of Yahoo Finance ticker validation results."""
+
+    def __init__(self,
+                 path: Optional[Union[str, Path]] = None,
+                 positive_ttl: float = DEFAULT_POSITIVE_TTL,
+                 negative_ttl: float = DEFAULT_NEGATIVE_TTL):
+        """
+        Open (or create) the validation cache.
+
+        Args:
+            path (str | Path, optional): Database file (default: ticker_cache.db in the app data dir)
+            positive_ttl (float): Seconds a valid result stays fresh
+            negative_ttl (float): Seconds a rejected result stays fresh
+        """
+        self.path = Path(path) if path else get_app_data_dir() / "ticker_cache.db"
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS ticker_validation (
+                symbol TEXT PRIMARY KEY,
+                is_valid INTEGER NOT NULL,
+                quote_type TEXT,
+                info_symbol TEXT,
+                checked_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def _is_fresh(self, entry: CachedValidation, now: float) -> bool:
+        """Check whether an entry is still within its TTL."""
+        ttl = self.positive_ttl if entry.is_valid else self.negative_ttl
+        return now - entry.checked_at < ttl
+
+    def get(self, symbol: str) -> Optional[CachedValidation]:
+        """
+        Look up a fresh validation result.
+
+        Args:
+            symbol (str): Ticker symbol
+
+        Returns:
+            CachedValidation or None if the symbol is unknown or expired
+        """
+        return self.get_many([symbol]).get(symbol.upper())
+
+    def get_many(self, symbols: Iterable[str]) -> Dict[str, CachedValidation]:
+        """
+        Look up fresh validation results for several symbols in one query.
+
+        Args:
+            symbols (Iterable[str]): Ticker symbols
+
+        Returns:
+            Dict[str, CachedValidation]: Fresh entries keyed by upper-case symbol
+        """
+        keys = list({symbol.upper() for symbol in symbols})
+        if not keys:
+            return {}
+
+        now = time.time()
+        found = {}
+        try:
+            with self._lock:
+                # Stay well below SQLite's bound-parameter limit
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._conn.execute(
+                        "SELECT symbol, is_valid, quote_type, info_symbol, checked_at "
+                        f"FROM ticker_validation WHERE symbol IN ({placeholders})",
+                        chunk
+                    ).fetchall()
+                    for symbol, is_valid, quote_type, info_symbol, checked_at in rows:
+                        entry = CachedValidation(symbol, bool(is_valid), quote_type or '',
+                                                 info_symbol or '', checked_at)
+                        if self._is_fresh(entry, now):
+                            found[symbol] = entry
+        except sqlite3.Error as e:
+            self.logger.error(f"Error reading ticker cache: {str(e)}")
+        return found
+
+    def set(self, symbol: str, is_valid: bool, quote_type: str = '', info_symbol: str = ''):
+        """
+        Store a validation result.
+
+        Args:
+            symbol (str): Ticker symbol
+            is_valid (bool): Whether the symbol passed validation
+            quote_type (str): quoteType reported by Yahoo Finance
+            info_symbol (str): symbol reported by Yahoo Finance
+        """
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO ticker_validation "
+                    "(symbol, is_valid, quote_type, info_symbol, checked_at) VALUES (?, ?, ?, ?, ?)",
+                    (symbol.upper(), int(is_valid), quote_type, info_symbol, time.time())
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            self.logger.error(f"Error writing ticker cache: {str(e)}")
+
+    def purge_expired(self) -> int:
+        """
+        Delete entries whose TTL has elapsed.
+
+        Returns:
+            int: Number of deleted rows
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM ticker_validation WHERE "
+                "(is_valid = 1 AND checked_at < ?) OR (is_valid = 0 AND checked_at < ?)",
+                (now - self.positive_ttl, now - self.negative_ttl)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
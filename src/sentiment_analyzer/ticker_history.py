@@ -0,0 +1,145 @@
+import sqlite3
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from ..app_paths import get_app_data_dir
+
+# Source of the rows aggregated over every analyzed subreddit
+ALL_SOURCES = '*'
+
+# Source of the rows of posts without a subreddit; not a valid subreddit name
+UNKNOWN_SOURCE = '?'
+
+# Aggregate columns stored per ticker and day, as produced by MentionTable.aggregate
+AGGREGATE_COLUMNS = ['mean', 'count', 'weighted_mean', 'decayed_mean']
+
+
+class TickerHistoryStore:
+    """
+    SQLite store of per-day, per-ticker sentiment aggregates.
+
+    Rows are clustered on (ticker, source, date), so one ticker's history
+    over a date range is a single contiguous index range, and a secondary
+    (date, source) index serves all tickers of one day. Both queries touch
+    only the rows they return, however long the history grows.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Open (or create) the ticker history.
+
+        Args:
+            path (str | Path, optional): Database file (default: ticker_history.db in the app data dir)
+        """
+        self.path = Path(path) if path else get_app_data_dir() / "ticker_history.db"
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS ticker_daily (
+                ticker TEXT NOT NULL,
+                source TEXT NOT NULL,
+                date TEXT NOT NULL,
+                mean REAL NOT NULL,
+                count INTEGER NOT NULL,
+                weighted_mean REAL NOT NULL,
+                decayed_mean REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (ticker, source, date)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ticker_daily_date ON ticker_daily (date, source)")
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM ticker_daily").fetchone()[0]
+
+    def record_day(self, date: str, rows: Iterable[Dict]):
+        """
+        Store a day's aggregates, replacing everything recorded for that day before.
+
+        Args:
+            date (str): Date in YYYY-MM-DD format
+            rows (Iterable[Dict]): Aggregates with ticker, source (ALL_SOURCES for
+                the combined row; stored as UNKNOWN_SOURCE when empty) and the
+                AGGREGATE_COLUMNS
+        """
+        now = time.time()
+        values = [
+            (row['ticker'].upper(), row.get('source') or UNKNOWN_SOURCE, date, float(row['mean']), int(row['count']),
+             float(row['weighted_mean']), float(row['decayed_mean']), now)
+            for row in rows
+        ]
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM ticker_daily WHERE date = ?", (date,))
+                self._conn.executemany(
+                    "INSERT INTO ticker_daily (ticker, source, date, mean, count, weighted_mean, "
+                    "decayed_mean, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    values
+                )
+        self.logger.debug(f"Recorded {len(values)} ticker aggregates for {date}")
+
+    def ticker_range(self,
+                     ticker: str,
+                     start: Optional[str] = None,
+                     end: Optional[str] = None,
+                     source: str = ALL_SOURCES) -> List[Dict]:
+        """
+        Read one ticker's daily aggregates over an inclusive date range.
+
+        Args:
+            ticker (str): Ticker symbol
+            start (str, optional): First date (YYYY-MM-DD); None reads from the beginning
+            end (str, optional): Last date (YYYY-MM-DD); None reads to the end
+            source (str): Subreddit (UNKNOWN_SOURCE for posts without one), or ALL_SOURCES
+                for the combined aggregates
+
+        Returns:
+            List[Dict]: Rows with date and the AGGREGATE_COLUMNS, ordered by date
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date, mean, count, weighted_mean, decayed_mean FROM ticker_daily "
+                "WHERE ticker = ? AND source = ? AND date >= ? AND date <= ? ORDER BY date",
+                (ticker.upper(), source, start or '', end or '9999-12-31')
+            ).fetchall()
+        return [dict(zip(['date'] + AGGREGATE_COLUMNS, row)) for row in rows]
+
+    def day(self, date: str, source: str = ALL_SOURCES) -> List[Dict]:
+        """
+        Read every ticker's aggregates for one day.
+
+        Args:
+            date (str): Date in YYYY-MM-DD format
+            source (str): Subreddit (UNKNOWN_SOURCE for posts without one), or ALL_SOURCES
+                for the combined aggregates
+
+        Returns:
+            List[Dict]: Rows with ticker and the AGGREGATE_COLUMNS, most mentioned first
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT ticker, mean, count, weighted_mean, decayed_mean FROM ticker_daily "
+                "WHERE date = ? AND source = ? ORDER BY count DESC, ticker",
+                (date, source)
+            ).fetchall()
+        return [dict(zip(['ticker'] + AGGREGATE_COLUMNS, row)) for row in rows]
+
+    def dates(self) -> List[str]:
+        """Get the dates that have aggregates recorded, oldest first."""
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT date FROM ticker_daily ORDER BY date").fetchall()
+        return [date for date, in rows]
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,108 @@
+import re
+from typing import Iterable, List, Pattern, Set, Tuple
+
+# Maximal runs of letters/digits. A ticker made only of such characters that is
+# not surrounded by letters or digits is exactly one of these runs.
+_TOKEN_PATTERN = re.compile(r'[A-Za-z0-9]+')
+_ALNUM = re.compile(r'[A-Za-z0-9]+$')
+
+
+def compile_ticker_pattern(tickers: Iterable[str]) -> Pattern:
+    """
+    Compile a regex matching any of the given tickers as a whole word.
+
+    Tickers must not be surrounded by letters or digits, so "AI" does not
+    match inside "SAID". Longer tickers are tried first.
+
+    Args:
+        tickers (Iterable[str]): Ticker symbols to match
+
+    Returns:
+        Pattern: Compiled pattern whose matches are the ticker symbols
+    """
+    alternatives = sorted({re.escape(ticker) for ticker in tickers}, key=len, reverse=True)
+    if not alternatives:
+        # Never matches
+        return re.compile(r'(?!)')
+    return re.compile(r'(?<![A-Za-z0-9])(?:' + '|'.join(alternatives) + r')(?![A-Za-z0-9])')
+
+
+class TickerMatcher:
+    """Finds every occurrence of a set of tickers in a single scan of the text."""
+
+    def __init__(self, tickers: Iterable[str] = ()):
+        """
+        Build the matcher for a ticker set.
+
+        Args:
+            tickers (Iterable[str]): Ticker symbols to match
+        """
+        self._tokens: Set[str] = set()
+        self._others: Set[str] = set()
+        self._other_pattern = compile_ticker_pattern(())
+        self.add(tickers)
+
+    def add(self, tickers: Iterable[str]):
+        """
+        Add tickers to the matcher.
+
+        Args:
+            tickers (Iterable[str]): Ticker symbols to add
+        """
+        others_changed = False
+        for ticker in tickers:
+            if _ALNUM.match(ticker):
+                self._tokens.add(ticker)
+            elif ticker and ticker not in self._others:
+                # Symbols with punctuation (e.g. BRK.B) span several tokens
+                self._others.add(ticker)
+                others_changed = True
+        if others_changed:
+            self._other_pattern = compile_ticker_pattern(self._others)
+
+    @property
+    def tickers(self) -> Set[str]:
+        """Get the set of tickers being matched."""
+        return self._tokens | self._others
+
+    def __len__(self) -> int:
+        return len(self._tokens) + len(self._others)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._tokens or ticker in self._others
+
+    def find_all(self, text: str) -> List[Tuple[str, int]]:
+        """
+        Find every ticker occurrence in a text.
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            List[Tuple[str, int]]: (ticker, offset) pairs in order of appearance
+        """
+        tokens = self._tokens
+        matches = [
+            (match.group(), match.start())
+            for match in _TOKEN_PATTERN.finditer(text)
+            if match.group() in tokens
+        ]
+        if self._others:
+            matches.extend((match.group(), match.start()) for match in self._other_pattern.finditer(text))
+            matches.sort(key=lambda pair: pair[1])
+        return matches
+
+    def find_tickers(self, text: str) -> Set[str]:
+        """
+        Find the distinct tickers mentioned in a text.
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            Set[str]: Tickers occurring at least once
+        """
+        found = self._tokens.intersection(_TOKEN_PATTERN.findall(text))
+        if self._others:
+            found.update(self._other_pattern.findall(text))
+        return found
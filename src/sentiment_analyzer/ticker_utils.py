@@ -1,13 +1,46 @@
+import json
 import re
-import yfinance as yf
-from typing import List, Set
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, List, Set, Optional, Tuple
 import logging
 
+from ..recording import Snapshot, YFINANCE_INFO
+from .metrics import Counters
+from .rate_limiter import RateLimiter
+from .symbol_universe import SymbolUniverse
+from .ticker_cache import TickerCache
+
 class TickerExtractor:
     """A class to extract and validate stock tickers from text."""
     
-    def __init__(self):
-        """Initialize the TickerExtractor with regex pattern for stock tickers."""
+    def __init__(self,
+                 cache: Optional[TickerCache] = None,
+                 use_cache: bool = True,
+                 max_workers: int = 8,
+                 calls_per_second: Optional[float] = 10.0,
+                 universe: Optional[SymbolUniverse] = None,
+                 snapshot: Optional[Snapshot] = None):
+        """
+        Initialize the TickerExtractor with regex pattern for stock tickers.
+        
+        Args:
+            cache (TickerCache, optional): Validation cache to use (default: on-disk cache in the app data dir)
+            use_cache (bool): Set to False to always validate against Yahoo Finance
+            max_workers (int): Maximum concurrent Yahoo Finance lookups during batch validation
+            calls_per_second (float, optional): Cap on Yahoo Finance lookups per second (None disables)
+            universe (SymbolUniverse, optional): Local listed-securities index consulted before
+                Yahoo Finance; symbols missing from it fall back to an online lookup
+            snapshot (Snapshot, optional): Records Yahoo Finance responses, or in
+                replay mode serves them instead of the network
+        """
+        self.max_workers = max(1, max_workers)
+        self.rate_limiter = RateLimiter(calls_per_second)
+        self.universe = universe
+        self.snapshot = snapshot
+        self.counters = Counters()
+        
         # Pattern matches 1-5 uppercase letters, not surrounded by letters/numbers
         # Excludes common words that might look like tickers
         # Pattern matches 2-5 uppercase letters, not surrounded by letters/numbers
@@ -35,6 +68,13 @@ class TickerExtractor:
         # Set up logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
+        
+        self.cache = None
+        if use_cache:
+            try:
+                self.cache = cache or TickerCache()
+            except Exception as e:
+                self.logger.error(f"Error opening ticker cache, validating without it: {str(e)}")
 
     def extract_potential_tickers(self, text: str) -> Set[str]:
         """
@@ -59,25 +99,46 @@ class TickerExtractor:
             self.logger.error(f"Error extracting tickers: {str(e)}")
             return set()
 
-    def validate_ticker(self, ticker: str) -> bool:
+    def _get_info(self, ticker: str) -> dict:
+        """Get Yahoo Finance quote info for a ticker, honouring the snapshot mode."""
+        if self.snapshot and self.snapshot.replaying:
+            return self.snapshot.lookup(YFINANCE_INFO, ticker)
+        
+        import yfinance as yf  # Not needed (or imported) in replay mode
+        self.rate_limiter.acquire()
+        started = time.perf_counter()
+        stock = yf.Ticker(ticker)
+        info = stock.info
+        self.counters.add('yahoo_requests')
+        self.counters.add('yahoo_request_seconds', time.perf_counter() - started)
+        # yfinance does not expose the raw response; the decoded payload approximates it
+        self.counters.add('yahoo_payload_bytes', len(json.dumps(info, default=str)))
+        if self.snapshot:
+            self.snapshot.record(YFINANCE_INFO, ticker, info)
+        return info
+
+    def _fetch_validation(self, ticker: str) -> Optional[Tuple[bool, str, str]]:
         """
-        Validate if a ticker exists on Yahoo Finance.
+        Validate a ticker against Yahoo Finance.
         
         Args:
             ticker (str): Ticker symbol to validate
             
         Returns:
-            bool: True if ticker is valid, False otherwise
+            Tuple of (is_valid, quoteType, symbol) as reported by Yahoo Finance,
+            or None if the lookup itself failed
         """
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = self._get_info(ticker)
             
             # Debug logging
             self.logger.debug(f"Validating ticker {ticker}")
             if not info:
                 self.logger.debug(f"Ticker {ticker} has no info")
-                return False
+                return False, '', ''
+            
+            quote_type = info.get('quoteType', '') or ''
+            info_symbol = info.get('symbol', '') or ''
             
             # Check for specific fields that real stocks should have
             required_fields = ['symbol', 'regularMarketPrice', 'quoteType']
@@ -86,26 +147,163 @@ class TickerExtractor:
             if not has_required_fields:
                 missing_fields = [f for f in required_fields if f not in info]
                 self.logger.debug(f"Ticker {ticker} missing required fields: {missing_fields}")
-                return False
+                return False, quote_type, info_symbol
             
             # Check if it's an equity/stock
-            quote_type = info.get('quoteType', '')
             if quote_type != 'EQUITY':
                 self.logger.debug(f"Ticker {ticker} is not an equity: {quote_type}")
-                return False
+                return False, quote_type, info_symbol
 
             # Validate market price and symbol
             market_price = info.get('regularMarketPrice', 0)
-            symbol_matches = info.get('symbol', '').upper() == ticker.upper()
+            symbol_matches = info_symbol.upper() == ticker.upper()
             
             if not market_price or not symbol_matches:
                 self.logger.debug(f"Ticker {ticker} failed price/symbol validation")
-                return False
+                return False, quote_type, info_symbol
                 
-            return True
+            return True, quote_type, info_symbol
         except Exception as e:
+            self.counters.add('validation_errors')
             self.logger.error(f"Error validating ticker {ticker}: {str(e)}")
+            return None
+
+    def validate_ticker(self, ticker: str) -> bool:
+        """
+        Validate if a ticker exists on Yahoo Finance.
+        
+        Symbols listed in the local symbol universe are classified offline.
+        Otherwise fresh results from the validation cache are used when
+        available, and only then is Yahoo Finance queried and the outcome stored.
+        
+        Args:
+            ticker (str): Ticker symbol to validate
+            
+        Returns:
+            bool: True if ticker is valid, False otherwise
+        """
+        listed = self._lookup_universe(ticker)
+        if listed is not None:
+            return listed
+        
+        if self.cache:
+            cached = self.cache.get(ticker)
+            if cached:
+                self.logger.debug(f"Ticker {ticker} served from cache (valid={cached.is_valid})")
+                return cached.is_valid
+        
+        return self._validate_and_store(ticker)
+
+    def _lookup_universe(self, ticker: str) -> Optional[bool]:
+        """Classify a ticker from the local symbol universe, if one is loaded."""
+        if self.universe is None:
+            return None
+        return self.universe.is_equity(ticker)
+
+    def _validate_and_store(self, ticker: str) -> bool:
+        """Query Yahoo Finance for a ticker and record the outcome in the cache."""
+        result = self._fetch_validation(ticker)
+        if result is None:
+            # Lookup errors are not cached so the symbol is retried next run
             return False
+        
+        is_valid, quote_type, info_symbol = result
+        if self.cache:
+            self.cache.set(ticker, is_valid, quote_type, info_symbol)
+        return is_valid
+
+    def validate_tickers(self,
+                         tickers: Iterable[str],
+                         cancel_event: Optional[threading.Event] = None) -> Dict[str, bool]:
+        """
+        Validate many tickers, looking each distinct symbol up at most once.
+        
+        Symbols in the local symbol universe are classified offline and fresh
+        cache entries are resolved in a single query; the remaining symbols
+        are validated concurrently on a bounded thread pool, subject
+        to the extractor's rate limit.
+        
+        Args:
+            tickers (Iterable[str]): Ticker symbols to validate (duplicates allowed)
+            cancel_event (threading.Event, optional): When set, lookups not yet
+                started are dropped and the results so far are returned
+            
+        Returns:
+            Dict[str, bool]: Validation result for each distinct symbol (only
+                those resolved before a cancellation)
+        """
+        results = {}
+        unlisted = []
+        for ticker in sorted(set(tickers)):
+            listed = self._lookup_universe(ticker)
+            if listed is None:
+                unlisted.append(ticker)
+            else:
+                results[ticker] = listed
+        universe_hits = len(results)
+        
+        cached = self.cache.get_many(unlisted) if self.cache else {}
+        pending = []
+        for ticker in unlisted:
+            entry = cached.get(ticker.upper())
+            if entry:
+                results[ticker] = entry.is_valid
+            else:
+                pending.append(ticker)
+        
+        self.logger.debug(f"{len(results)} tickers resolved offline, {len(pending)} to validate")
+        self.counters.add('validation_candidates', len(results) + len(pending))
+        self.counters.add('validation_universe_hits', universe_hits)
+        self.counters.add('validation_cache_hits', len(results) - universe_hits)
+        self.counters.add('validation_lookups', len(pending))
+        if pending:
+            workers = min(self.max_workers, len(pending))
+            executor = ThreadPoolExecutor(max_workers=workers)
+            try:
+                futures = [executor.submit(self._validate_and_store, ticker) for ticker in pending]
+                running = set(futures)
+                while running and not (cancel_event is not None and cancel_event.is_set()):
+                    _, running = wait(running, timeout=0.1, return_when=FIRST_COMPLETED)
+                for ticker, future in zip(pending, futures):
+                    if future.done() and not future.cancelled():
+                        results[ticker] = future.result()
+            finally:
+                # Queued lookups are dropped on cancellation; running ones finish in the background
+                executor.shutdown(wait=False, cancel_futures=True)
+        
+        return results
+
+    def get_valid_tickers_batch(self, texts: List[str]) -> List[List[str]]:
+        """
+        Extract and validate stock tickers from many texts in a single pass.
+        
+        Candidates from all texts are collected first so that each distinct
+        symbol is validated exactly once.
+        
+        Args:
+            texts (List[str]): Texts to extract tickers from
+            
+        Returns:
+            List[List[str]]: Valid ticker symbols for each text, in input order
+        """
+        try:
+            candidates = [self.extract_potential_tickers(text) for text in texts]
+            all_candidates = set().union(*candidates)
+            self.logger.debug(f"{len(all_candidates)} distinct potential tickers across {len(texts)} texts")
+            
+            validity = self.validate_tickers(all_candidates)
+            valid_per_text = [
+                [ticker for ticker in text_candidates if validity.get(ticker)]
+                for text_candidates in candidates
+            ]
+            
+            valid_count = sum(validity.values())
+            self.logger.info(f"Found {valid_count} valid tickers across {len(texts)} texts")
+            return valid_per_text
+            
+        except Exception as e:
+            self.logger.error(f"Error in get_valid_tickers_batch: {str(e)}")
+            return [[] for _ in texts]
 
     def get_valid_tickers(self, text: str) -> List[str]:
         """
@@ -123,11 +321,8 @@ class TickerExtractor:
             self.logger.debug(f"Potential tickers found: {potential_tickers}")
             
             # Validate each potential ticker
-            valid_tickers = []
-            for ticker in potential_tickers:
-                if self.validate_ticker(ticker):
-                    valid_tickers.append(ticker)
-                    self.logger.debug(f"Validated ticker: {ticker}")
+            validity = self.validate_tickers(potential_tickers)
+            valid_tickers = [ticker for ticker in potential_tickers if validity.get(ticker)]
             
             self.logger.info(f"Found {len(valid_tickers)} valid tickers: {valid_tickers}")
             return valid_tickers
@@ -1,5 +1,6 @@
 """Package initialization for stock performance analysis."""
 
 from .stock_data import StockData
+from .price_cache import PriceCache
 
-__all__ = ['StockData']
\ No newline at end of file
+__all__ = ['StockData', 'PriceCache']
\ No newline at end of file
@@ -0,0 +1,230 @@
+import importlib.util
+import json
+import os
+import re
+import threading
+import time
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import pandas as pd
+
+from ..app_paths import get_app_data_dir
+
+# pyarrow is the engine for DataFrame.to_parquet; only check that it is
+# installed here, as importing it is slow and only needed on a write
+BARS_FORMAT = 'parquet' if importlib.util.find_spec('pyarrow') else 'pickle'
+
+# Quotes move during the session; daily bars only gain a new row once a day
+DEFAULT_QUOTE_TTL = 15 * 60
+DEFAULT_BARS_TTL = 6 * 3600
+
+# Tickers kept in memory
+DEFAULT_MEMORY_SIZE = 64
+
+
+@dataclass
+class _CachedPrices:
+    """Everything cached for one ticker; a part is None until loaded or fetched."""
+    quote: Optional[Dict[str, Any]] = None
+    quote_fetched_at: float = 0.0
+    bars: Optional[pd.DataFrame] = None
+    bars_period: Optional[str] = None
+    bars_fetched_at: float = 0.0
+
+
+class PriceCache:
+    """
+    Two-tier cache of Yahoo Finance quote info and daily price bars.
+
+    Recently used tickers are kept in an in-memory LRU. Behind it, each
+    ticker has a directory entry of <TICKER>.json (quote fields and fetch
+    times) and <TICKER>.parquet with its bars (<TICKER>.pkl when pyarrow is
+    not installed). Quotes and bars expire independently.
+    """
+
+    def __init__(self,
+                 directory: Optional[Union[str, Path]] = None,
+                 quote_ttl: float = DEFAULT_QUOTE_TTL,
+                 bars_ttl: float = DEFAULT_BARS_TTL,
+                 memory_size: int = DEFAULT_MEMORY_SIZE):
+        """
+        Open (or create) the price cache.
+
+        Args:
+            directory (str | Path, optional): Cache directory (default: price_cache in the app data dir)
+            quote_ttl (float): Seconds quote info stays fresh
+            bars_ttl (float): Seconds price bars stay fresh
+            memory_size (int): Tickers kept in memory
+        """
+        self.directory = Path(directory) if directory else get_app_data_dir() / "price_cache"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.quote_ttl = quote_ttl
+        self.bars_ttl = bars_ttl
+        self.memory_size = memory_size
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.RLock()
+        self._memory: "OrderedDict[str, _CachedPrices]" = OrderedDict()
+
+    def _path(self, ticker: str, suffix: str) -> Path:
+        """File of a ticker, with characters unsafe in file names replaced."""
+        return self.directory / f"{re.sub(r'[^A-Z0-9._^-]', '_', ticker)}{suffix}"
+
+    def _bars_paths(self, ticker: str):
+        """Bars file in the preferred format, then the fallback format."""
+        parquet, pickle = self._path(ticker, '.parquet'), self._path(ticker, '.pkl')
+        return (parquet, pickle) if BARS_FORMAT == 'parquet' else (pickle, parquet)
+
+    def _entry(self, ticker: str) -> _CachedPrices:
+        """Get the entry of a ticker from memory, loading its metadata from disk on a miss."""
+        entry = self._memory.get(ticker)
+        if entry is not None:
+            self._memory.move_to_end(ticker)
+            return entry
+
+        entry = _CachedPrices()
+        meta_path = self._path(ticker, '.json')
+        if meta_path.exists():
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                entry.quote = meta.get('quote')
+                entry.quote_fetched_at = meta.get('quote_fetched_at', 0.0)
+                entry.bars_period = meta.get('bars_period')
+                entry.bars_fetched_at = meta.get('bars_fetched_at', 0.0)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Ignoring unreadable price cache entry {meta_path}: {str(e)}")
+
+        self._memory[ticker] = entry
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+        return entry
+
+    def _load_bars(self, ticker: str) -> Optional[pd.DataFrame]:
+        """Read the bars file of a ticker in whichever format it was written."""
+        for path in self._bars_paths(ticker):
+            if not path.exists():
+                continue
+            try:
+                if path.suffix == '.parquet':
+                    return pd.read_parquet(path)
+                return pd.read_pickle(path)
+            except Exception as e:
+                self.logger.warning(f"Ignoring unreadable price bars {path}: {str(e)}")
+        return None
+
+    def _save_meta(self, ticker: str, entry: _CachedPrices):
+        """Atomically write the metadata file of a ticker."""
+        meta_path = self._path(ticker, '.json')
+        tmp_path = meta_path.with_suffix('.json.tmp')
+        meta = {
+            'quote': entry.quote,
+            'quote_fetched_at': entry.quote_fetched_at,
+            'bars_period': entry.bars_period,
+            'bars_fetched_at': entry.bars_fetched_at
+        }
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, default=str)
+        os.replace(tmp_path, meta_path)
+
+    def _save_bars(self, ticker: str, bars: pd.DataFrame):
+        """Atomically write the bars file of a ticker, removing one in the other format."""
+        path, other = self._bars_paths(ticker)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        if path.suffix == '.parquet':
+            bars.to_parquet(tmp_path)
+        else:
+            bars.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+        if other.exists():
+            other.unlink()
+
+    def get_quote(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up fresh quote info.
+
+        Args:
+            ticker (str): Ticker symbol
+
+        Returns:
+            Dict of quote fields, or None if not cached or expired
+        """
+        with self._lock:
+            entry = self._entry(ticker.upper())
+            if entry.quote is None or time.time() - entry.quote_fetched_at >= self.quote_ttl:
+                return None
+            return entry.quote
+
+    def get_bars(self, ticker: str, period: str, include_stale: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Look up price bars.
+
+        Args:
+            ticker (str): Ticker symbol
+            period (str): History period the bars were fetched for, e.g. "1y"
+            include_stale (bool): Also return expired bars, e.g. to extend them
+
+        Returns:
+            DataFrame of bars, or None if not cached for this period (or expired)
+        """
+        with self._lock:
+            ticker = ticker.upper()
+            entry = self._entry(ticker)
+            if entry.bars_period != period:
+                return None
+            if not include_stale and time.time() - entry.bars_fetched_at >= self.bars_ttl:
+                return None
+            if entry.bars is None:
+                entry.bars = self._load_bars(ticker)
+            return entry.bars
+
+    def put_quote(self, ticker: str, quote: Dict[str, Any]):
+        """
+        Store quote info.
+
+        Args:
+            ticker (str): Ticker symbol
+            quote (Dict): Quote fields, e.g. yfinance Ticker.info
+        """
+        with self._lock:
+            ticker = ticker.upper()
+            entry = self._entry(ticker)
+            entry.quote = quote
+            entry.quote_fetched_at = time.time()
+            try:
+                self._save_meta(ticker, entry)
+            except (OSError, TypeError, ValueError) as e:
+                self.logger.error(f"Error saving quote for {ticker}: {str(e)}")
+
+    def put_bars(self, ticker: str, period: str, bars: pd.DataFrame):
+        """
+        Store price bars.
+
+        Args:
+            ticker (str): Ticker symbol
+            period (str): History period the bars were fetched for
+            bars (pd.DataFrame): Bars indexed by date
+        """
+        with self._lock:
+            ticker = ticker.upper()
+            entry = self._entry(ticker)
+            entry.bars = bars
+            entry.bars_period = period
+            entry.bars_fetched_at = time.time()
+            try:
+                self._save_bars(ticker, bars)
+                self._save_meta(ticker, entry)
+            except Exception as e:
+                self.logger.error(f"Error saving price bars for {ticker}: {str(e)}")
+
+    def clear(self):
+        """Drop every cached ticker from memory and disk."""
+        with self._lock:
+            self._memory.clear()
+            for path in self.directory.iterdir():
+                if path.suffix in ('.json', '.parquet', '.pkl', '.tmp'):
+                    path.unlink()
@@ -1,14 +1,245 @@
-import yfinance as yf
-from typing import Dict, Any
+import io
+import queue
+import re
+import threading
+from concurrent.futures import Future
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Any, Iterable, List, Optional
 import logging
 
+from ..recording import Snapshot, YFINANCE_HISTORY, YFINANCE_INFO
+from .price_cache import PriceCache
+
+# Concurrent downloads when prefetching
+DEFAULT_PREFETCH_WORKERS = 4
+
+# yfinance period units as DateOffset arguments
+PERIOD_UNITS = {'d': 'days', 'wk': 'weeks', 'mo': 'months', 'y': 'years'}
+
+class _DaemonPool:
+    """
+    Minimal thread pool on daemon threads.
+    
+    Unlike ThreadPoolExecutor, whose threads are joined at interpreter exit,
+    downloads still running when the application quits are abandoned. The
+    price cache writes each file atomically, so an abandoned download leaves
+    no partial entry behind.
+    """
+    
+    def __init__(self, workers: int, name: str):
+        self._jobs: queue.Queue = queue.Queue()
+        self._workers = max(1, workers)
+        for number in range(self._workers):
+            threading.Thread(target=self._work, name=f"{name}_{number}", daemon=True).start()
+    
+    def _work(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            future, func, args = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:
+                future.set_exception(e)
+    
+    def submit(self, func: Callable, *args) -> Future:
+        """Queue a call and get a future for its result."""
+        future: Future = Future()
+        self._jobs.put((future, func, args))
+        return future
+    
+    def shutdown(self):
+        """Cancel queued calls and let the workers exit after their current one."""
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                job[0].cancel()
+        # One stop marker per worker thread
+        for _ in range(self._workers):
+            self._jobs.put(None)
+
+def period_start(period: str, last: pd.Timestamp) -> Optional[pd.Timestamp]:
+    """
+    Get the first date a history period ending at a given bar covers.
+    
+    Args:
+        period (str): yfinance history period, e.g. "1y", "6mo" or "ytd"
+        last (pd.Timestamp): Date of the last bar
+        
+    Returns:
+        pd.Timestamp or None if the period is unbounded ("max") or unknown
+    """
+    if period == 'ytd':
+        return last.normalize().replace(month=1, day=1)
+    match = re.fullmatch(r'(\d+)(d|wk|mo|y)', period)
+    if not match:
+        return None
+    return last - pd.DateOffset(**{PERIOD_UNITS[match.group(2)]: int(match.group(1))})
+
 class StockData:
     """Class to fetch and manage stock financial data using Yahoo Finance."""
     
-    def __init__(self):
-        """Initialize StockData with logger setup."""
+    def __init__(self,
+                 snapshot: Optional[Snapshot] = None,
+                 cache: Optional[PriceCache] = None,
+                 use_cache: bool = True):
+        """
+        Initialize StockData with logger setup.
+        
+        Args:
+            snapshot (Snapshot, optional): Records Yahoo Finance responses, or in
+                replay mode serves them instead of the network; bypasses the cache
+            cache (PriceCache, optional): Cache of quotes and price bars
+                (default: the PriceCache in the app data dir)
+            use_cache (bool): Whether to cache fetched data
+        """
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
+        self.snapshot = snapshot
+        self.cache = None
+        if use_cache and not snapshot:
+            self.cache = cache if cache is not None else PriceCache()
+        
+        # Serializes work per ticker, so a detail view waits for an in-flight
+        # prefetch of the same ticker instead of downloading it twice
+        self._ticker_locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+        self._prefetch_pool: Optional[_DaemonPool] = None
+        
+    def _ticker_lock(self, ticker: str) -> threading.Lock:
+        """Get the lock of a ticker."""
+        with self._locks_lock:
+            return self._ticker_locks.setdefault(ticker.upper(), threading.Lock())
+        
+    def _fetch_info(self, ticker: str) -> Dict[str, Any]:
+        """Fetch quote info, honouring the snapshot mode."""
+        if self.snapshot and self.snapshot.replaying:
+            return self.snapshot.lookup(YFINANCE_INFO, ticker)
+        
+        import yfinance as yf
+        info = yf.Ticker(ticker).info
+        if self.snapshot:
+            self.snapshot.record(YFINANCE_INFO, ticker, info)
+        return info
+        
+    def _fetch_history(self, ticker: str, period: str, start: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """Fetch price history for a period, or from a start date, honouring the snapshot mode."""
+        history_key = f"{ticker}|{period}" if start is None else f"{ticker}|{start.date()}"
+        if self.snapshot and self.snapshot.replaying:
+            return pd.read_json(
+                io.StringIO(self.snapshot.lookup(YFINANCE_HISTORY, history_key)),
+                orient="split"
+            )
+        
+        import yfinance as yf
+        if start is None:
+            history = yf.Ticker(ticker).history(period=period)
+        else:
+            history = yf.Ticker(ticker).history(start=start.strftime('%Y-%m-%d'))
+        if self.snapshot:
+            self.snapshot.record(YFINANCE_HISTORY, history_key,
+                                 history.to_json(orient="split", date_format="iso"))
+        return history
+        
+    def _extend_history(self, ticker: str, period: str, stored: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Bring stored bars up to date by fetching only the bars after them.
+        
+        The fetch starts at the second-to-last stored bar: the last one may
+        be a partial session and is always replaced, while the one before
+        is final and must come back unchanged. If it differs, a split or
+        dividend has re-adjusted the history, so the whole period has to be
+        fetched again.
+        
+        Args:
+            ticker (str): The stock ticker symbol
+            period (str): History period kept in the store
+            stored (pd.DataFrame): Previously stored bars, oldest first
+            
+        Returns:
+            DataFrame with the updated bars, or None if they must be refetched
+        """
+        if len(stored) < 2:
+            return None
+        overlap_date = stored.index[-2]
+        delta = self._fetch_history(ticker, period, start=overlap_date)
+        if delta.empty:
+            return stored
+        
+        overlap = delta.index.intersection(stored.index[:-1])
+        if len(overlap) == 0:
+            self.logger.info(f"No overlapping bar for {ticker}, refetching {period} history")
+            return None
+        columns = [column for column in ('Open', 'High', 'Low', 'Close') if column in delta and column in stored]
+        old = stored.loc[overlap, columns].to_numpy(dtype=float)
+        new = delta.loc[overlap, columns].to_numpy(dtype=float)
+        if old.shape != new.shape or not np.allclose(old, new, rtol=1e-6, equal_nan=True):
+            self.logger.info(f"Adjusted prices changed for {ticker}, refetching {period} history")
+            return None
+        
+        history = pd.concat([stored[stored.index < delta.index[0]], delta])
+        history = history[~history.index.duplicated(keep='last')].sort_index()
+        
+        # Trim bars that fell out of the retention window
+        start = period_start(period, history.index[-1])
+        if start is not None:
+            history = history[history.index >= start]
+        self.logger.debug(f"Extended {ticker} history with {len(delta)} fetched bars")
+        return history
+        
+    def get_quote(self, ticker: str) -> Dict[str, Any]:
+        """
+        Get quote info for a stock, from the cache while it is fresh.
+        
+        Args:
+            ticker (str): The stock ticker symbol
+            
+        Returns:
+            Dict of quote fields as returned by yfinance Ticker.info
+        """
+        info = self.cache.get_quote(ticker) if self.cache else None
+        if info is None:
+            info = self._fetch_info(ticker)
+            if self.cache and info:
+                self.cache.put_quote(ticker, info)
+        return info
+        
+    def get_history(self, ticker: str, period: str = "1y") -> pd.DataFrame:
+        """
+        Get daily price bars for a stock, from the cache while they are fresh.
+        
+        Expired cached bars are extended with just the missing days rather
+        than downloading the whole period again.
+        
+        Args:
+            ticker (str): The stock ticker symbol
+            period (str): History period, e.g. "1y" (default: "1y")
+            
+        Returns:
+            DataFrame with historical price data
+        """
+        if not self.cache:
+            return self._fetch_history(ticker, period)
+        
+        history = self.cache.get_bars(ticker, period)
+        if history is not None:
+            return history
+        
+        stored = self.cache.get_bars(ticker, period, include_stale=True)
+        if stored is not None:
+            history = self._extend_history(ticker, period, stored)
+        if history is None:
+            history = self._fetch_history(ticker, period)
+        if not history.empty:
+            self.cache.put_bars(ticker, period, history)
+        return history
         
     def get_stock_history(self, ticker: str) -> Dict[str, Any]:
         """
@@ -26,9 +257,9 @@ class StockData:
             - history: DataFrame with historical price data
         """
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            history = stock.history(period="1y")  # Get 1 year of data
+            with self._ticker_lock(ticker):
+                info = self.get_quote(ticker)
+                history = self.get_history(ticker, period="1y")  # Get 1 year of data
             
             return {
                 "name": info.get("longName", ticker),
@@ -40,4 +271,43 @@ class StockData:
             
         except Exception as e:
             self.logger.error(f"Error fetching data for {ticker}: {str(e)}")
-            return None
\ No newline at end of file
+            return None
+            
+    def prefetch(self, tickers: Iterable[str], max_workers: int = DEFAULT_PREFETCH_WORKERS) -> List[Future]:
+        """
+        Download quote info and price history for tickers in the background.
+        
+        Fills the cache so that later get_stock_history calls are served
+        without waiting on the network. Downloads run on a bounded pool of
+        daemon threads shared by all prefetches, so they never hold up
+        interpreter exit; quote info has no bulk endpoint, so each ticker
+        is fetched on its own.
+        
+        Args:
+            tickers (Iterable[str]): Ticker symbols, e.g. the ranked results
+            max_workers (int): Concurrent downloads (default: DEFAULT_PREFETCH_WORKERS)
+            
+        Returns:
+            List[Future]: One future per distinct ticker, resolving to its
+                get_stock_history result
+        """
+        if not self.cache:
+            return []
+        if self._prefetch_pool is None:
+            self._prefetch_pool = _DaemonPool(max_workers, "prefetch")
+        
+        unique = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+        self.logger.info(f"Prefetching price data for {len(unique)} tickers")
+        return [self._prefetch_pool.submit(self.get_stock_history, ticker) for ticker in unique]
+        
+    def close(self):
+        """
+        Stop prefetching without waiting.
+        
+        Queued tickers are cancelled. Downloads already running finish in the
+        background on daemon threads and are abandoned if the application
+        exits first.
+        """
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.shutdown()
+            self._prefetch_pool = None
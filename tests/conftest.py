@@ -0,0 +1,14 @@
+import os
+import sys
+
+import pytest
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    """Keep caches, checkpoints and logs in a temporary application data directory."""
+    monkeypatch.setenv('BULLBEARRADAR_DATA_DIR', str(tmp_path))
+    return tmp_path
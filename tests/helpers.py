@@ -0,0 +1,42 @@
+"""Test doubles shared by the test modules."""
+
+import time
+from typing import Dict, Iterable, List, Optional
+
+from src.sentiment_analyzer.recorded_reddit import RecordedReddit
+from src.sentiment_analyzer.reddit_scraper import RedditScraper
+from src.sentiment_analyzer.ticker_utils import TickerExtractor
+
+
+class ListedTickerExtractor(TickerExtractor):
+    """TickerExtractor whose Yahoo Finance lookups are answered from a known ticker list."""
+
+    def __init__(self, listed: Iterable[str]):
+        super().__init__(use_cache=False, calls_per_second=None)
+        self.listed = set(listed)
+
+    def _get_info(self, ticker: str) -> dict:
+        if ticker in self.listed:
+            return {'symbol': ticker, 'quoteType': 'EQUITY', 'regularMarketPrice': 100.0}
+        return {}
+
+
+def make_post(post_id: str, title: str, body: str, score: int = 1, source: Optional[str] = 'stocks') -> Dict:
+    """A post as produced by RedditScraper."""
+    return {'id': post_id, 'title': title, 'body': body, 'score': score,
+            'created_utc': time.time(), 'edited': 0, 'source': source}
+
+
+def recorded_scraper(posts: List[Dict], subreddit: str = 'stocks') -> RedditScraper:
+    """A RedditScraper serving posts as the subreddit's top listing, without network access."""
+    things = [{'kind': 't3', 'data': {
+        'id': post['id'],
+        'title': post['title'],
+        'selftext': post['body'],
+        'score': post['score'],
+        'created_utc': post['created_utc'],
+        'edited': False,
+        'crosspost_parent': None
+    }} for post in posts]
+    reddit = RecordedReddit(listings={subreddit: {'top': things}})
+    return RedditScraper(None, None, None, reddit=reddit, subreddit=subreddit)
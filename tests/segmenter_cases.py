@@ -0,0 +1,54 @@
+"""
+Hand-labelled sentence segmentation cases from finance posts: abbreviations,
+initialisms, dollar amounts, tickers, ellipses, quotes and paragraphs.
+
+Checked by tests/test_segmenter.py and scored by benchmarks/bench_segmenter.py.
+"""
+
+from typing import List, Tuple
+
+# (text, expected sentences)
+LABELLED_CASES: List[Tuple[str, List[str]]] = [
+    ("Apple Inc. reported record revenue. Shares rose 3% after hours.",
+     ["Apple Inc. reported record revenue.", "Shares rose 3% after hours."]),
+    ("I'm long Nvidia Corp. (NVDA) into earnings. Guidance should be strong.",
+     ["I'm long Nvidia Corp. (NVDA) into earnings.", "Guidance should be strong."]),
+    ("Bought more shares of Microsoft Corp. They keep growing cloud revenue.",
+     ["Bought more shares of Microsoft Corp.", "They keep growing cloud revenue."]),
+    ("U.S. stocks fell on Friday. The Fed meets next week.",
+     ["U.S. stocks fell on Friday.", "The Fed meets next week."]),
+    ("Revenue came in at $4.5B vs. $4.2B expected. EPS was $1.23.",
+     ["Revenue came in at $4.5B vs. $4.2B expected.", "EPS was $1.23."]),
+    ("$TSLA is up 5.5% today. $AMD is down.",
+     ["$TSLA is up 5.5% today.", "$AMD is down."]),
+    ("BRK.B is my biggest position. It barely moves.",
+     ["BRK.B is my biggest position.", "It barely moves."]),
+    ("Mr. Powell speaks at 2 p.m. today. Expect volatility.",
+     ["Mr. Powell speaks at 2 p.m. today.", "Expect volatility."]),
+    ("J. Powell said rates stay high. Markets sold off.",
+     ["J. Powell said rates stay high.", "Markets sold off."]),
+    ("PLTR to the moon!!! Who else is holding?",
+     ["PLTR to the moon!!!", "Who else is holding?"]),
+    ("What?! AMC squeezed again. Unreal.",
+     ["What?!", "AMC squeezed again.", "Unreal."]),
+    ("I sold too early... Now it's up 20%.",
+     ["I sold too early...", "Now it's up 20%."]),
+    ("Not sure... maybe it recovers tomorrow.",
+     ["Not sure... maybe it recovers tomorrow."]),
+    ("bought more calls. its going up tomorrow. trust me",
+     ["bought more calls.", "its going up tomorrow.", "trust me"]),
+    ("He said \"sell everything.\" Then the market ripped.",
+     ["He said \"sell everything.\"", "Then the market ripped."]),
+    ("Daily discussion thread\n\nWhat are you buying today? I like MSFT.",
+     ["Daily discussion thread", "What are you buying today?", "I like MSFT."]),
+    ("Position update:\n\n- 100 shares AAPL\n\n- 50 shares KO",
+     ["Position update:", "- 100 shares AAPL", "- 50 shares KO"]),
+    ("See the No. 1 holding in the fund. It is GOOGL.",
+     ["See the No. 1 holding in the fund.", "It is GOOGL."]),
+    ("Earnings are on Jan. 30 after close. Options are pricing a 7% move.",
+     ["Earnings are on Jan. 30 after close.", "Options are pricing a 7% move."]),
+    ("The S&P 500 closed at 5,000.12. Nasdaq lagged 🐻 Small caps rallied.",
+     ["The S&P 500 closed at 5,000.12.", "Nasdaq lagged 🐻 Small caps rallied."]),
+    ("Margins are in the cash flow statement (pg. 5) of the 10-K. Revenue grew.",
+     ["Margins are in the cash flow statement (pg. 5) of the 10-K.", "Revenue grew."]),
+]
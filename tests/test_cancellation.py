@@ -0,0 +1,89 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.sentiment_analyzer.cancellation import AnalysisCancelled
+from src.sentiment_analyzer.main import AnalysisComponents, run_analysis
+from src.sentiment_analyzer.multi_subreddit import MultiSubredditScraper
+from src.sentiment_analyzer.reddit_scraper import RedditScraper
+from src.sentiment_analyzer.sentiment_analyzer import SentimentAnalyzer
+
+from helpers import ListedTickerExtractor
+
+
+class CancellingReddit:
+    """Stand-in praw.Reddit whose listings set cancel_event after cancel_after submissions."""
+
+    def __init__(self, cancel_event: threading.Event, cancel_after: int):
+        self.cancel_event = cancel_event
+        self.cancel_after = cancel_after
+        self.served = 0
+
+    def subreddit(self, name: str):
+        return SimpleNamespace(top=lambda period, limit: self._top(name, limit))
+
+    def _top(self, name: str, limit: int):
+        for number in range(limit):
+            if self.served == self.cancel_after:
+                self.cancel_event.set()
+            self.served += 1
+            yield SimpleNamespace(id=f"{name}{number}", title=f"AAPL thread {number}",
+                                  selftext=f"AAPL looks strong today, post {number}.", score=1,
+                                  created_utc=time.time(), edited=False, crosspost_parent=None)
+
+
+def components_for(scraper, subreddits):
+    return AnalysisComponents(
+        reddit_scraper=scraper,
+        ticker_extractor=ListedTickerExtractor(['AAPL']),
+        sentiment_analyzer=SentimentAnalyzer(),
+        subreddits=subreddits
+    )
+
+
+def test_cancel_stops_listing_fetch_midway():
+    cancel_event = threading.Event()
+    reddit = CancellingReddit(cancel_event, cancel_after=10)
+    components = components_for(RedditScraper(None, None, None, reddit=reddit, subreddit='stocks'), ['stocks'])
+    try:
+        with pytest.raises(AnalysisCancelled):
+            run_analysis(components, cancel_event=cancel_event, post_limit=1000)
+    finally:
+        components.close()
+    # The listing is abandoned at the post during which the event was set
+    assert reddit.served == 11
+
+
+def test_cancel_stops_concurrent_listings():
+    cancel_event = threading.Event()
+    reddit = CancellingReddit(cancel_event, cancel_after=10)
+    scraper = MultiSubredditScraper(None, None, None, subreddits=['stocks', 'investing'], reddit=reddit,
+                                    calls_per_second=None)
+    components = components_for(scraper, scraper.subreddits)
+    try:
+        with pytest.raises(AnalysisCancelled):
+            run_analysis(components, cancel_event=cancel_event, post_limit=1000)
+    finally:
+        components.close()
+    assert reddit.served < 100
+
+
+def test_cancel_drops_pending_ticker_lookups():
+    cancel_event = threading.Event()
+    looked_up = []
+
+    class SlowExtractor(ListedTickerExtractor):
+        def _get_info(self, ticker):
+            looked_up.append(ticker)
+            cancel_event.set()
+            time.sleep(0.05)
+            return super()._get_info(ticker)
+
+    extractor = SlowExtractor(['AAPL'])
+    extractor.max_workers = 2
+    results = extractor.validate_tickers([f"T{number:03d}" for number in range(100)], cancel_event=cancel_event)
+
+    assert len(looked_up) <= 2
+    assert len(results) <= 2
@@ -0,0 +1,67 @@
+import math
+
+import pytest
+
+from src.sentiment_analyzer.mention_table import DEFAULT_HALF_LIFE, MentionTable, MentionTableBuilder
+from src.sentiment_analyzer.sentiment_analyzer import SentimentAnalyzer
+
+# Post score 1 gives an upvote weight of 1 + ln(2); score 0 the base weight of 1
+UPVOTED = 1 + math.log(2)
+
+
+@pytest.fixture
+def table() -> MentionTable:
+    builder = MentionTableBuilder()
+    # One half-life older than the newest post, so its mentions count half in the decayed mean
+    builder.add_post('p1', 0, 0.0, 'stocks', [('AAPL', 0.4, 0)])
+    builder.add_post('p2', 1, DEFAULT_HALF_LIFE, 'investing', [('AAPL', -0.2, 0), ('MSFT', 0.6, 1)])
+    builder.add_post('p3', 0, DEFAULT_HALF_LIFE, 'stocks', [('MSFT', -0.2, 2)])
+    return builder.build()
+
+
+def test_aggregate_per_ticker(table):
+    result = table.aggregate().to_dict('index')
+
+    assert result['AAPL']['count'] == 2
+    assert result['AAPL']['mean'] == pytest.approx(0.1)
+    assert result['AAPL']['weighted_mean'] == pytest.approx((0.4 - 0.2 * UPVOTED) / (1 + UPVOTED))
+    assert result['AAPL']['decayed_mean'] == pytest.approx((0.5 * 0.4 - 0.2) / 1.5)
+    assert result['MSFT']['count'] == 2
+    assert result['MSFT']['mean'] == pytest.approx(0.2)
+    assert result['MSFT']['weighted_mean'] == pytest.approx((0.6 * UPVOTED - 0.2) / (UPVOTED + 1))
+    assert result['MSFT']['decayed_mean'] == pytest.approx(0.2)
+
+
+def test_aggregate_per_source(table):
+    result = table.aggregate(by=('source', 'ticker'))
+
+    assert result['count'].to_dict() == {
+        ('stocks', 'AAPL'): 1, ('stocks', 'MSFT'): 1, ('investing', 'AAPL'): 1, ('investing', 'MSFT'): 1
+    }
+    # A single mention is its own mean, however it is weighted
+    for column in ('mean', 'weighted_mean', 'decayed_mean'):
+        assert result[column].to_dict() == pytest.approx({
+            ('stocks', 'AAPL'): 0.4, ('stocks', 'MSFT'): -0.2, ('investing', 'AAPL'): -0.2, ('investing', 'MSFT'): 0.6
+        })
+
+
+def test_decayed_mean_falls_back_to_mean_when_weights_underflow(table):
+    result = table.aggregate(half_life=1.0, now=1e9)
+
+    assert result['decayed_mean'].to_dict() == pytest.approx(result['mean'].to_dict())
+
+
+def test_tied_tickers_rank_in_first_mention_order():
+    builder = MentionTableBuilder()
+    builder.add_post('p1', 0, 0.0, 'stocks', [('ZZZ', 0.0, 0), ('AAA', 0.0, 0)])
+    builder.add_post('p2', 0, 0.0, 'stocks', [('MMM', 0.0, 0), ('AAA', 0.0, 1)])
+    aggregates = builder.build().aggregate()
+
+    assert list(aggregates.index) == ['ZZZ', 'AAA', 'MMM']
+    bullish, bearish = SentimentAnalyzer().get_top_sentiments(aggregates['mean'].to_dict())
+    assert bullish == ['ZZZ', 'AAA', 'MMM']
+    assert bearish == ['MMM', 'AAA', 'ZZZ']
+
+
+def test_empty_table_aggregates_to_nothing():
+    assert len(MentionTable().aggregate()) == 0
@@ -0,0 +1,77 @@
+from src.sentiment_analyzer.main import AnalysisComponents, run_analysis
+from src.sentiment_analyzer.parallel import ParallelScorer
+from src.sentiment_analyzer.pipeline import DEFAULT_BATCH_SIZE, build_mention_table
+from src.sentiment_analyzer.post_checkpoint import PostCheckpointStore
+from src.sentiment_analyzer.sentiment_analyzer import SentimentAnalyzer
+
+from helpers import ListedTickerExtractor, make_post, recorded_scraper
+
+TICKERS = ['AAPL', 'MSFT', 'TSLA']
+
+
+def corpus(count: int):
+    """Posts with two distinct sentences each (the title runs into the first), both mentioning a listed ticker."""
+    return [
+        make_post(f"p{number}", f"{TICKERS[number % 3]} daily thread {number}",
+                  f"I think {TICKERS[number % 3]} is a great buy at level {number}. "
+                  f"{TICKERS[(number + 1) % 3]} looks terrible after report {number}.")
+        for number in range(count)
+    ]
+
+
+def analyze(posts, workers: int):
+    components = AnalysisComponents(
+        reddit_scraper=recorded_scraper(posts),
+        ticker_extractor=ListedTickerExtractor(TICKERS),
+        sentiment_analyzer=SentimentAnalyzer(workers=workers),
+        subreddits=['stocks']
+    )
+    try:
+        return run_analysis(components, post_limit=len(posts))
+    finally:
+        components.close()
+
+
+def test_run_analysis_scores_on_process_pool_with_workers(monkeypatch):
+    calls = []
+    original = ParallelScorer.score
+
+    def score(self, sentences):
+        calls.append(len(sentences))
+        return original(self, sentences)
+
+    monkeypatch.setattr(ParallelScorer, 'score', score)
+    posts = corpus(600)
+    sentences_per_batch = 2 * DEFAULT_BATCH_SIZE
+    assert sentences_per_batch < SentimentAnalyzer.PARALLEL_MIN_SENTENCES
+
+    parallel = analyze(posts, workers=2)
+
+    assert calls, "no sentences were scored on the process pool"
+    assert all(count >= SentimentAnalyzer.PARALLEL_MIN_SENTENCES for count in calls)
+    # Only the remainder after the last pool-sized group is scored inline
+    assert sum(calls) > 2 * len(posts) - SentimentAnalyzer.PARALLEL_MIN_SENTENCES
+    assert parallel == analyze(posts, workers=1)
+
+
+def whole_text(text):
+    """Segmenter that keeps each text as a single sentence."""
+    return [text]
+
+
+def test_checkpoints_of_another_segmenter_are_not_reused(tmp_path):
+    posts = [make_post('a', 'AAPL is a great buy.', 'I sold my AAPL and MSFT yesterday.')]
+    extractor = ListedTickerExtractor(TICKERS)
+    checkpoints = PostCheckpointStore(tmp_path / 'checkpoints.db')
+    try:
+        whole = build_mention_table(posts, extractor, SentimentAnalyzer(segmenter=whole_text),
+                                    checkpoints=checkpoints)
+        resumed = build_mention_table(posts, extractor, SentimentAnalyzer(segmenter='regex'),
+                                      checkpoints=checkpoints)
+    finally:
+        checkpoints.close()
+    fresh = build_mention_table(posts, extractor, SentimentAnalyzer(segmenter='regex'))
+
+    assert whole.aggregate()['count'].to_dict() == {'AAPL': 1, 'MSFT': 1}
+    assert resumed.aggregate().equals(fresh.aggregate())
+    assert resumed.aggregate()['count'].to_dict() == {'AAPL': 2, 'MSFT': 1}
@@ -0,0 +1,86 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import praw
+
+from src.sentiment_analyzer.multi_subreddit import MultiSubredditScraper
+from src.sentiment_analyzer.recorded_reddit import RecordedReddit
+from src.sentiment_analyzer.reddit_scraper import RedditScraper
+
+
+class FakeReddit:
+    """praw.Reddit stand-in recording every client created."""
+
+    created = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.threads = set()
+        FakeReddit.created.append(self)
+
+    def subreddit(self, name):
+        return SimpleNamespace(display_name=name)
+
+    def submission(self, id):
+        self.threads.add(threading.get_ident())
+        time.sleep(0.01)
+        comments = CommentForest(
+            SimpleNamespace(id=f"{id}c{number}", body=f"Comment {number}", score=1,
+                            created_utc=time.time(), edited=False, replies=[])
+            for number in range(3)
+        )
+        return SimpleNamespace(comments=comments)
+
+
+class CommentForest(list):
+    def replace_more(self, limit):
+        return []
+
+
+def test_each_subreddit_gets_its_own_client(monkeypatch):
+    monkeypatch.setattr(praw, 'Reddit', FakeReddit)
+    FakeReddit.created = []
+
+    scraper = MultiSubredditScraper('id', 'secret', 'agent', subreddits=['stocks', 'investing', 'options'])
+
+    clients = [source.reddit for source in scraper.scrapers]
+    assert len({id(client) for client in clients}) == 3
+    assert all(client.kwargs['client_id'] == 'id' for client in clients)
+    # Responses of every client are counted together
+    assert all(client.kwargs['requestor_kwargs']['session'].hooks['response'] for client in clients)
+
+
+def test_comment_workers_use_their_own_clients(monkeypatch):
+    monkeypatch.setattr(praw, 'Reddit', FakeReddit)
+    FakeReddit.created = []
+    scraper = RedditScraper('id', 'secret', 'agent')
+
+    comments = list(scraper.iter_comments([f"s{number}" for number in range(8)], workers=4))
+
+    assert len(comments) == 24
+    workers = [client for client in FakeReddit.created if client.threads]
+    assert scraper.reddit not in workers
+    assert 1 <= len(workers) <= 4
+    assert all(len(client.threads) == 1 for client in workers)
+
+
+def listing(*posts):
+    defaults = {'score': 1, 'created_utc': time.time(), 'edited': False, 'crosspost_parent': None}
+    return [{'kind': 't3', 'data': dict(defaults, **post)} for post in posts]
+
+
+def test_reposts_are_skipped_but_same_titled_link_posts_are_kept():
+    reddit = RecordedReddit(listings={
+        'stocks': {'top': listing({'id': 'a', 'title': 'NVDA earnings', 'selftext': ''},
+                                  {'id': 'b', 'title': 'My AAPL thesis', 'selftext': 'Services keep growing.'})},
+        'investing': {'top': listing({'id': 'c', 'title': 'NVDA earnings', 'selftext': ''},
+                                     {'id': 'd', 'title': 'My AAPL thesis', 'selftext': 'Services keep growing.'},
+                                     {'id': 'e', 'title': 'Crosspost', 'selftext': '', 'crosspost_parent': 't3_a'})},
+    })
+    scraper = MultiSubredditScraper(None, None, None, subreddits=['stocks', 'investing'], reddit=reddit,
+                                    calls_per_second=None)
+
+    ids = sorted(post['id'] for post in scraper.iter_top_daily_posts())
+
+    assert ids in (['a', 'b', 'c'], ['a', 'c', 'd'])
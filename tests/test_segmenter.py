@@ -0,0 +1,22 @@
+import pickle
+
+import pytest
+
+from src.sentiment_analyzer.segmenter import DEFAULT_SEGMENTER, RegexSegmenter, get_segmenter
+
+from segmenter_cases import LABELLED_CASES
+
+
+@pytest.mark.parametrize('text, expected', LABELLED_CASES, ids=[text[:40] for text, _ in LABELLED_CASES])
+def test_default_segmenter_splits_labelled_cases(text, expected):
+    assert get_segmenter(DEFAULT_SEGMENTER)(text) == expected
+
+
+def test_regex_segmenter_survives_pickling():
+    text, expected = LABELLED_CASES[0]
+    assert pickle.loads(pickle.dumps(RegexSegmenter()))(text) == expected
+
+
+def test_unknown_segmenter_is_rejected():
+    with pytest.raises(ValueError):
+        get_segmenter('spacy')
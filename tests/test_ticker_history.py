@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from src.sentiment_analyzer.main import save_ticker_history
+from src.sentiment_analyzer.pipeline import build_mention_table
+from src.sentiment_analyzer.sentiment_analyzer import SentimentAnalyzer
+from src.sentiment_analyzer.ticker_history import ALL_SOURCES, UNKNOWN_SOURCE, TickerHistoryStore
+
+from helpers import ListedTickerExtractor, make_post
+
+
+def test_save_ticker_history_keeps_posts_without_source(tmp_path):
+    posts = [
+        make_post('a', 'AAPL beats estimates.', 'Great quarter for AAPL.', source='stocks'),
+        make_post('b', 'AAPL is overvalued.', 'Selling my AAPL today.', source=None),
+    ]
+    table = build_mention_table(posts, ListedTickerExtractor(['AAPL']), SentimentAnalyzer())
+    store = TickerHistoryStore(tmp_path / 'history.db')
+    try:
+        save_ticker_history(table.aggregate(), table.aggregate(by=('source', 'ticker')), store)
+
+        today = datetime.now().strftime('%Y-%m-%d')
+        combined = store.day(today)
+        by_source = {source: store.day(today, source) for source in ('stocks', UNKNOWN_SOURCE)}
+        assert [(row['ticker'], row['count']) for row in combined] == [('AAPL', 4)]
+        assert [row['count'] for row in by_source['stocks']] == [2]
+        assert [row['count'] for row in by_source[UNKNOWN_SOURCE]] == [2]
+        assert len(store) == 3
+        assert [row['count'] for row in store.ticker_range('AAPL', today, today, source=ALL_SOURCES)] == [4]
+    finally:
+        store.close()